@@ -1,11 +1,15 @@
 """Inference API endpoints."""
 
+from collections.abc import AsyncIterator
+
+import grpc
 from fastapi import APIRouter, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from loguru import logger
 from sqlalchemy import select
 
-from app.core.deps import CurrentUserRequired, DBSession
-from app.grpc import get_grpc_client
+from app.core.deps import CurrentUserRequired, DBSession, StreamingUserRequired
+from app.grpc import DetectorClient, get_grpc_client
 from app.models.inference import Inference
 from app.schemas.inference import (
     EventSettingUpdateResponse,
@@ -163,6 +167,75 @@ async def get_preview(
     )
 
 
+async def _preview_images(
+    grpc_client: DetectorClient, app_id: str, video_id: str
+) -> AsyncIterator[bytes]:
+    """Yield the JPEG bytes of each frame on Core's preview stream."""
+    async for result in grpc_client.preview_image_stream(app_id=app_id, video_id=video_id):
+        if result.image:
+            yield result.image
+
+
+def _mjpeg_part(image: bytes) -> bytes:
+    """Frame one JPEG as a multipart/x-mixed-replace part."""
+    return (
+        b"--frame\r\nContent-Type: image/jpeg\r\n"
+        b"Content-Length: %d\r\n\r\n%b\r\n" % (len(image), image)
+    )
+
+
+@router.get("/preview/stream")
+async def stream_preview(
+    current_user: StreamingUserRequired,
+    app_id: str = Query(..., alias="appId"),
+    video_id: str = Query(..., alias="videoId"),
+) -> StreamingResponse:
+    """
+    Stream preview images as MJPEG (multipart/x-mixed-replace).
+
+    Frames are pushed by Core as they change, replacing repeated polling of
+    the preview endpoint.
+
+    - **appId**: Application ID
+    - **videoId**: Video ID
+    """
+    grpc_client = get_grpc_client()
+    if not grpc_client:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Preview not available",
+        )
+
+    # Pull the first frame up front so an unsupported or empty stream is an
+    # error status rather than a 200 with an empty body
+    images = _preview_images(grpc_client, app_id, video_id)
+    try:
+        first = await anext(images, None)
+    except grpc.aio.AioRpcError as e:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Preview streaming not supported by Core",
+        ) from e
+    if first is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Preview not available",
+        )
+
+    async def frames():
+        try:
+            yield _mjpeg_part(first)
+            async for image in images:
+                yield _mjpeg_part(image)
+        finally:
+            await images.aclose()
+
+    return StreamingResponse(
+        frames(),
+        media_type="multipart/x-mixed-replace; boundary=frame",
+    )
+
+
 @router.post("/stream", response_model=InferenceStreamStart)
 async def start_stream(
     db: DBSession,
@@ -257,6 +330,17 @@ async def sync_inferences(
     db_inferences = {(inf.app_id, inf.video_id): inf for inf in result.scalars().all()}
     db_keys = set(db_inferences.keys())
 
+    # 이미 동기화된 상태 → commit 없이 바로 반환
+    if core_keys == db_keys:
+        return InferenceSyncResponse(
+            success=True,
+            message="Already in sync",
+            added_to_db=0,
+            added_to_core=0,
+            deleted_from_db=0,
+            failed=0,
+        )
+
     added_to_db = 0
     added_to_core = 0
     deleted_from_db = 0
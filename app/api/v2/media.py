@@ -1,11 +1,16 @@
 """Media proxy API endpoints."""
 
+import base64
+
 import httpx
 from fastapi import APIRouter, HTTPException, Query, Request, Response, status
 from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
 from app.core.config import get_settings
 from app.core.deps import DBSession
+from app.core.responses import json_response
+from app.schemas.event import EventSummaryItem
 from app.schemas.protocol import ProtocolDTO
 from app.services.event_service import EventService
 
@@ -14,6 +19,24 @@ settings = get_settings()
 router = APIRouter()
 
 
+def _build_upstream_auth() -> str | None:
+    """Build the ViveEX Authorization header (Bearer token > Basic auth)."""
+    if settings.bearer_token:
+        return f"Bearer {settings.bearer_token}"
+    if settings.basic_user and settings.basic_pass:
+        credentials = f"{settings.basic_user}:{settings.basic_pass}"
+        return f"Basic {base64.b64encode(credentials.encode()).decode()}"
+    return None
+
+
+# Upstream config is fixed for the process lifetime; resolve it once at import
+_MEDIA_BASE_URL = f"{settings.backend_base}/media"
+_UPSTREAM_AUTH = _build_upstream_auth()
+
+# Serializes summary items straight to JSON bytes (no intermediate dicts)
+_summary_items_adapter = TypeAdapter(list[EventSummaryItem])
+
+
 @router.get("/{media_tail:path}")
 async def proxy_media(
     request: Request,
@@ -31,20 +54,14 @@ async def proxy_media(
     - **download**: Force download
     """
     # Build target URL
-    base_url = settings.backend_base
-    target_url = f"{base_url}/media/{media_tail}"
+    target_url = f"{_MEDIA_BASE_URL}/{media_tail}"
 
     # Build headers
     headers = {}
 
     # Auth priority: Bearer token > Basic auth > Client auth
-    if settings.bearer_token:
-        headers["Authorization"] = f"Bearer {settings.bearer_token}"
-    elif settings.basic_user and settings.basic_pass:
-        import base64
-        credentials = f"{settings.basic_user}:{settings.basic_pass}"
-        auth_header = base64.b64encode(credentials.encode()).decode()
-        headers["Authorization"] = f"Basic {auth_header}"
+    if _UPSTREAM_AUTH:
+        headers["Authorization"] = _UPSTREAM_AUTH
     else:
         # Forward client auth
         auth = request.headers.get("Authorization")
@@ -114,17 +131,11 @@ async def head_media(
 
     - **media_tail**: Media path
     """
-    base_url = settings.backend_base
-    target_url = f"{base_url}/media/{media_tail}"
+    target_url = f"{_MEDIA_BASE_URL}/{media_tail}"
 
     headers = {}
-    if settings.bearer_token:
-        headers["Authorization"] = f"Bearer {settings.bearer_token}"
-    elif settings.basic_user and settings.basic_pass:
-        import base64
-        credentials = f"{settings.basic_user}:{settings.basic_pass}"
-        auth_header = base64.b64encode(credentials.encode()).decode()
-        headers["Authorization"] = f"Basic {auth_header}"
+    if _UPSTREAM_AUTH:
+        headers["Authorization"] = _UPSTREAM_AUTH
 
     try:
         async with httpx.AsyncClient(
@@ -147,13 +158,13 @@ async def head_media(
 
 
 # Statistics endpoints (reusing event service)
-@router.get("")
+@router.get("", response_model=list[EventSummaryItem])
 async def get_media_statistics(
     db: DBSession,
     video_id: str | None = Query(None, alias="videoId"),
     start_time: int = Query(0, alias="startTime"),
     end_time: int = Query(0, alias="endTime"),
-) -> list:
+) -> Response:
     """Get event statistics for media."""
     from app.schemas.event import EventQueryParams
 
@@ -165,7 +176,7 @@ async def get_media_statistics(
 
     event_service = EventService(db)
     summary = await event_service.get_event_summary(params)
-    return [item.model_dump(by_alias=True) for item in summary.items]
+    return json_response(_summary_items_adapter, summary.items)
 
 
 @router.get("/protocol", response_model=ProtocolDTO | None)
@@ -1,6 +1,8 @@
 """Metrics API endpoints."""
 
+import asyncio
 import platform
+from functools import lru_cache
 
 import psutil
 
@@ -12,6 +14,7 @@ from app.schemas.system import MetricsResponse
 router = APIRouter()
 
 
+@lru_cache
 def _get_disk_path() -> str:
     """Get the appropriate disk path for the OS."""
     if platform.system() == "Darwin":
@@ -34,6 +37,12 @@ async def get_metrics(
 
     Returns real-time system metrics using psutil.
     """
+    # cpu_percent sleeps for its sampling interval; keep it off the event loop
+    return await asyncio.to_thread(_sample_metrics)
+
+
+def _sample_metrics() -> MetricsResponse:
+    """Sample CPU, memory and disk usage (blocking)."""
     # CPU
     cpu_percent = psutil.cpu_percent(interval=0.1)
 
@@ -4,13 +4,22 @@ Manages physical alarm devices: I/O controllers, speakers, LED signal towers.
 Ported from legacy Event Bridge (autocare_event_bridge_2.0).
 """
 
+import asyncio
+import time
 import uuid
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, Response, status
 from loguru import logger
-from sqlalchemy import select
+from pydantic import TypeAdapter
+from sqlalchemy import exists, lambda_stmt, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from app.core.deps import CurrentUserRequired, DBSession
+from app.core.responses import json_response
 from app.models.sensor import Sensor, SensorType
 from app.schemas.sensor import (
     SensorCreate,
@@ -23,6 +32,78 @@ from app.workers import get_alarm_service
 
 router = APIRouter()
 
+_sensor_list_adapter = TypeAdapter(list[SensorDTO])
+_sensor_type_list_adapter = TypeAdapter(list[SensorTypeDTO])
+
+
+def _to_sensor_type_dto(sensor_type: SensorType) -> SensorTypeDTO:
+    """Build DTO from a DB row without re-validating (rows are already valid)."""
+    return SensorTypeDTO.model_construct(
+        id=sensor_type.id,
+        name=sensor_type.name,
+        protocol=sensor_type.protocol,
+    )
+
+
+def _to_sensor_dto(sensor: Sensor) -> SensorDTO:
+    """Build DTO from a DB row without re-validating (rows are already valid)."""
+    return SensorDTO.model_construct(
+        id=sensor.id,
+        name=sensor.name,
+        type_id=sensor.type_id,
+        ip=sensor.ip,
+        port=sensor.port,
+        max_time=sensor.max_time,
+        pause_time=sensor.pause_time,
+        is_time_restricted=sensor.is_time_restricted,
+        time_restricted_start=sensor.time_restricted_start,
+        time_restricted_end=sensor.time_restricted_end,
+    )
+
+
+# ============================================================================
+# Sensor Type cache
+# ============================================================================
+
+# Sensor types are a tiny, rarely-mutated set: keep them in-process and drop
+# the cache on every type write (it is repopulated lazily on the next read).
+# Writes only invalidate the local worker, so entries also expire after a
+# short TTL to pick up changes made through other workers.
+_TYPE_CACHE_TTL = 5.0  # seconds
+_type_cache: tuple[float, dict[str, SensorTypeDTO]] | None = None
+_type_cache_version = 0
+_type_cache_lock = asyncio.Lock()
+
+
+async def _get_type_cache(db: AsyncSession) -> dict[str, SensorTypeDTO]:
+    """Get sensor types keyed by ID, loading them from DB on a cache miss."""
+    global _type_cache
+
+    cached = _type_cache
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
+    async with _type_cache_lock:
+        cached = _type_cache
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        version = _type_cache_version
+        result = await db.execute(select(SensorType))
+        types = {st.id: _to_sensor_type_dto(st) for st in result.scalars()}
+
+        # Don't store a snapshot that a concurrent write already invalidated
+        if version == _type_cache_version:
+            _type_cache = (time.monotonic() + _TYPE_CACHE_TTL, types)
+        return types
+
+
+def _invalidate_type_cache() -> None:
+    """Drop cached sensor types after a sensor type write."""
+    global _type_cache, _type_cache_version
+    _type_cache = None
+    _type_cache_version += 1
+
 
 # ============================================================================
 # Sensor Type CRUD (MUST be before /{sensor_id} routes!)
@@ -33,11 +114,10 @@ router = APIRouter()
 async def get_sensor_types(
     db: DBSession,
     current_user: CurrentUserRequired,
-) -> list[SensorTypeDTO]:
+) -> Response:
     """Get all sensor types."""
-    result = await db.execute(select(SensorType))
-    sensor_types = result.scalars().all()
-    return [SensorTypeDTO.model_validate(st) for st in sensor_types]
+    sensor_types = await _get_type_cache(db)
+    return json_response(_sensor_type_list_adapter, list(sensor_types.values()))
 
 
 @router.get("/types/{type_id}", response_model=SensorTypeDTO)
@@ -47,8 +127,7 @@ async def get_sensor_type(
     current_user: CurrentUserRequired,
 ) -> SensorTypeDTO:
     """Get sensor type by ID."""
-    result = await db.execute(select(SensorType).where(SensorType.id == type_id))
-    sensor_type = result.scalar_one_or_none()
+    sensor_type = (await _get_type_cache(db)).get(type_id)
 
     if not sensor_type:
         raise HTTPException(
@@ -56,7 +135,7 @@ async def get_sensor_type(
             detail=f"Sensor type '{type_id}' not found",
         )
 
-    return SensorTypeDTO.model_validate(sensor_type)
+    return sensor_type
 
 
 @router.post("/types", response_model=SensorTypeDTO, status_code=status.HTTP_201_CREATED)
@@ -75,12 +154,11 @@ async def create_sensor_type(
     - **LA6_POE**: PATLITE socket-based LED signal tower
     """
     # Generate UUID if not provided
-    type_id = data.id or str(uuid.uuid4())
+    type_id = data.id or uuid.uuid4().hex
 
     # Check if type already exists (only if ID was provided)
     if data.id:
-        existing = await db.execute(select(SensorType).where(SensorType.id == type_id))
-        if existing.scalar_one_or_none():
+        if await db.scalar(select(exists().where(SensorType.id == type_id))):
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail=f"Sensor type '{type_id}' already exists",
@@ -95,14 +173,15 @@ async def create_sensor_type(
     db.add(sensor_type)
     await db.commit()
     await db.refresh(sensor_type)
+    _invalidate_type_cache()
 
     # Reload alarm service cache
     alarm_service = get_alarm_service()
     if alarm_service:
-        await alarm_service.reload_cache()
+        alarm_service.schedule_reload()
 
     logger.info(f"Sensor type created: {sensor_type.id} ({sensor_type.name})")
-    return SensorTypeDTO.model_validate(sensor_type)
+    return _to_sensor_type_dto(sensor_type)
 
 
 @router.delete("/types/{type_id}")
@@ -116,10 +195,7 @@ async def delete_sensor_type(
     Cannot delete if sensors are using this type.
     """
     # Check if any sensors are using this type
-    sensors_result = await db.execute(
-        select(Sensor).where(Sensor.type_id == type_id)
-    )
-    if sensors_result.scalars().first():
+    if await db.scalar(select(exists().where(Sensor.type_id == type_id))):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Cannot delete: sensors are using type '{type_id}'",
@@ -136,11 +212,12 @@ async def delete_sensor_type(
 
     await db.delete(sensor_type)
     await db.commit()
+    _invalidate_type_cache()
 
     # Reload alarm service cache
     alarm_service = get_alarm_service()
     if alarm_service:
-        await alarm_service.reload_cache()
+        alarm_service.schedule_reload()
 
     logger.info(f"Sensor type deleted: {type_id}")
     return {"status": "success"}
@@ -166,24 +243,27 @@ async def seed_sensor_types(
         ("type_led", "LA6_POE", "PATLITE socket-based LED signal tower"),
     ]
 
-    created = 0
-    for type_id, name, protocol in default_types:
-        existing = await db.execute(
-            select(SensorType).where(SensorType.name == name)
-        )
-        if existing.scalar_one_or_none():
-            continue
+    # One IN query for all names instead of a SELECT per type
+    names = [name for _, name, _ in default_types]
+    existing = set(
+        await db.scalars(select(SensorType.name).where(SensorType.name.in_(names)))
+    )
 
-        sensor_type = SensorType(id=type_id, name=name, protocol=protocol)
-        db.add(sensor_type)
-        created += 1
+    new_types = [
+        SensorType(id=type_id, name=name, protocol=protocol)
+        for type_id, name, protocol in default_types
+        if name not in existing
+    ]
+    created = len(new_types)
 
+    db.add_all(new_types)
     await db.commit()
+    _invalidate_type_cache()
 
     # Reload alarm service cache
     alarm_service = get_alarm_service()
     if alarm_service:
-        await alarm_service.reload_cache()
+        alarm_service.schedule_reload()
 
     logger.info(f"Sensor types seeded: {created} created")
     return {"status": "success", "created": created}
@@ -194,24 +274,49 @@ async def seed_sensor_types(
 # ============================================================================
 
 
+@asynccontextmanager
+async def _sensor_type_fk_guard(
+    db: AsyncSession, type_id: str | None
+) -> AsyncGenerator[None, None]:
+    """Map a type_id FK violation raised by a sensor write to HTTP 400."""
+    try:
+        yield
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Sensor type '{type_id}' not found",
+        )
+
+
+def _sensor_by_id_stmt(sensor_id: str):
+    """Point lookup by primary key; compiled once and reused via lambda_stmt."""
+    return lambda_stmt(lambda: select(Sensor).where(Sensor.id == sensor_id))
+
+
 @router.get("", response_model=list[SensorDTO])
 async def get_sensors(
     db: DBSession,
     current_user: CurrentUserRequired,
     type_id: str | None = Query(None, alias="typeId"),
-) -> list[SensorDTO]:
+) -> Response:
     """
     Get all sensors, optionally filtered by type.
 
     - **typeId**: Filter by sensor type ID
     """
+    # lambda_stmt caches the compiled SQL; type_id is extracted as a bound parameter.
+    # raiseload: relationship access while building DTOs must be an explicit eager load
+    stmt = lambda_stmt(lambda: select(Sensor).options(raiseload("*")))
     if type_id:
-        result = await db.execute(select(Sensor).where(Sensor.type_id == type_id))
-    else:
-        result = await db.execute(select(Sensor))
+        stmt += lambda s: s.where(Sensor.type_id == type_id)
+    result = await db.execute(stmt)
 
-    sensors = result.scalars().all()
-    return [SensorDTO.model_validate(s) for s in sensors]
+    # model_construct + one dump_json pass; measured faster than letting the
+    # adapter validate ORM rows itself (validate_python(..., from_attributes=True))
+    return json_response(
+        _sensor_list_adapter, [_to_sensor_dto(s) for s in result.scalars()]
+    )
 
 
 @router.post("", response_model=SensorDTO, status_code=status.HTTP_201_CREATED)
@@ -229,22 +334,17 @@ async def create_sensor(
     - **port**: Device port number
     """
     # Generate UUID if not provided
-    sensor_id = data.id or str(uuid.uuid4())
+    sensor_id = data.id or uuid.uuid4().hex
 
     # Check if sensor already exists (only if ID was provided)
     if data.id:
-        existing = await db.execute(select(Sensor).where(Sensor.id == sensor_id))
-        if existing.scalar_one_or_none():
+        if await db.scalar(select(exists().where(Sensor.id == sensor_id))):
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail=f"Sensor '{sensor_id}' already exists",
             )
 
-    # Check if sensor type exists
-    type_result = await db.execute(
-        select(SensorType).where(SensorType.id == data.type_id)
-    )
-    if not type_result.scalar_one_or_none():
+    if data.type_id not in await _get_type_cache(db):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Sensor type '{data.type_id}' not found",
@@ -264,16 +364,17 @@ async def create_sensor(
     )
 
     db.add(sensor)
-    await db.commit()
+    async with _sensor_type_fk_guard(db, data.type_id):
+        await db.commit()
     await db.refresh(sensor)
 
     # Reload alarm service cache
     alarm_service = get_alarm_service()
     if alarm_service:
-        await alarm_service.reload_cache()
+        alarm_service.schedule_reload()
 
     logger.info(f"Sensor created: {sensor.id}")
-    return SensorDTO.model_validate(sensor)
+    return _to_sensor_dto(sensor)
 
 
 @router.get("/{sensor_id}", response_model=SensorDTO)
@@ -283,7 +384,7 @@ async def get_sensor(
     current_user: CurrentUserRequired,
 ) -> SensorDTO:
     """Get sensor by ID."""
-    result = await db.execute(select(Sensor).where(Sensor.id == sensor_id))
+    result = await db.execute(_sensor_by_id_stmt(sensor_id))
     sensor = result.scalar_one_or_none()
 
     if not sensor:
@@ -292,7 +393,7 @@ async def get_sensor(
             detail=f"Sensor '{sensor_id}' not found",
         )
 
-    return SensorDTO.model_validate(sensor)
+    return _to_sensor_dto(sensor)
 
 
 @router.put("/{sensor_id}", response_model=SensorDTO)
@@ -303,54 +404,45 @@ async def update_sensor(
     current_user: CurrentUserRequired,
 ) -> SensorDTO:
     """Update sensor configuration."""
-    result = await db.execute(select(Sensor).where(Sensor.id == sensor_id))
-    sensor = result.scalar_one_or_none()
+    # Only provided (non-null) fields are written
+    values = data.model_dump(exclude_none=True)
 
-    if not sensor:
+    if data.type_id is not None and data.type_id not in await _get_type_cache(db):
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Sensor '{sensor_id}' not found",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Sensor type '{data.type_id}' not found",
         )
 
-    # Update fields if provided
-    if data.name is not None:
-        sensor.name = data.name
-    if data.type_id is not None:
-        # Verify sensor type exists
-        type_result = await db.execute(
-            select(SensorType).where(SensorType.id == data.type_id)
+    if values:
+        # Single UPDATE ... RETURNING round-trip instead of SELECT + dirty-tracked flush
+        stmt = (
+            update(Sensor)
+            .where(Sensor.id == sensor_id)
+            .values(**values)
+            .returning(Sensor)
         )
-        if not type_result.scalar_one_or_none():
+    else:
+        stmt = select(Sensor).where(Sensor.id == sensor_id)
+
+    async with _sensor_type_fk_guard(db, data.type_id):
+        result = await db.execute(stmt)
+        sensor = result.scalar_one_or_none()
+
+        if not sensor:
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Sensor type '{data.type_id}' not found",
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Sensor '{sensor_id}' not found",
             )
-        sensor.type_id = data.type_id
-    if data.ip is not None:
-        sensor.ip = data.ip
-    if data.port is not None:
-        sensor.port = data.port
-    if data.max_time is not None:
-        sensor.max_time = data.max_time
-    if data.pause_time is not None:
-        sensor.pause_time = data.pause_time
-    if data.is_time_restricted is not None:
-        sensor.is_time_restricted = data.is_time_restricted
-    if data.time_restricted_start is not None:
-        sensor.time_restricted_start = data.time_restricted_start
-    if data.time_restricted_end is not None:
-        sensor.time_restricted_end = data.time_restricted_end
 
-    await db.commit()
-    await db.refresh(sensor)
+        await db.commit()
 
     # Reload alarm service cache
     alarm_service = get_alarm_service()
     if alarm_service:
-        await alarm_service.reload_cache()
+        alarm_service.schedule_reload()
 
     logger.info(f"Sensor updated: {sensor.id}")
-    return SensorDTO.model_validate(sensor)
+    return _to_sensor_dto(sensor)
 
 
 @router.delete("/{sensor_id}")
@@ -360,7 +452,7 @@ async def delete_sensor(
     current_user: CurrentUserRequired,
 ) -> dict:
     """Delete sensor by ID."""
-    result = await db.execute(select(Sensor).where(Sensor.id == sensor_id))
+    result = await db.execute(_sensor_by_id_stmt(sensor_id))
     sensor = result.scalar_one_or_none()
 
     if not sensor:
@@ -375,7 +467,7 @@ async def delete_sensor(
     # Reload alarm service cache
     alarm_service = get_alarm_service()
     if alarm_service:
-        await alarm_service.reload_cache()
+        alarm_service.schedule_reload()
 
     logger.info(f"Sensor deleted: {sensor_id}")
     return {"status": "success"}
@@ -1,13 +1,20 @@
 """Statistics API endpoints."""
 
+import base64
+import binascii
+import random
+import time
 from datetime import datetime, timedelta
 from typing import Literal
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, HTTPException, Query, Response, status
 from loguru import logger
-from sqlalchemy import func, select
+from pydantic import TypeAdapter
+from sqlalchemy import case, func, lambda_stmt, select, tuple_
+from sqlalchemy.orm import raiseload
 
 from app.core.deps import CurrentUserRequired, DBSession
+from app.core.responses import json_response
 from app.models.camera import Camera
 from app.models.event import Event
 from app.schemas.statistics import (
@@ -22,10 +29,43 @@ from app.schemas.statistics import (
 
 router = APIRouter()
 
+_event_log_adapter = TypeAdapter(EventLogResponse)
+_summary_adapter = TypeAdapter(SummaryResponse)
+_trend_adapter = TypeAdapter(TrendResponse)
+
 
 def _timestamp_to_iso(ts_ms: int) -> str:
-    """Convert millisecond timestamp to ISO 8601 string."""
-    return datetime.utcfromtimestamp(ts_ms / 1000).isoformat() + "Z"
+    """Convert millisecond timestamp to ISO 8601 string.
+
+    Formats from time.gmtime fields directly (no datetime allocation); output
+    matches datetime.isoformat(), which omits the fraction when it is zero.
+    """
+    secs, ms = divmod(ts_ms, 1000)
+    tm = time.gmtime(secs)
+    base = (
+        f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+        f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}"
+    )
+    if ms:
+        return f"{base}.{ms:03d}000Z"
+    return base + "Z"
+
+
+def _encode_cursor(timestamp: int, event_id: int) -> str:
+    """Encode an event log keyset position as an opaque cursor."""
+    return base64.urlsafe_b64encode(f"{timestamp}:{event_id}".encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[int, int]:
+    """Decode a cursor from _encode_cursor into (timestamp, event_id)."""
+    try:
+        timestamp, event_id = base64.urlsafe_b64decode(cursor.encode()).split(b":")
+        return int(timestamp), int(event_id)
+    except (binascii.Error, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
 
 
 def _date_to_timestamp_range(
@@ -76,6 +116,26 @@ def _date_to_timestamp_range(
     return start_ts, end_ts, start_date_str, end_date_str
 
 
+def _month_bucket_boundaries(date_str: str, unit: str) -> list[int]:
+    """
+    Get start timestamps (ms) of every bucket after the first for quarter/year.
+
+    quarter: starts of months 2 and 3; year: starts of Q2, Q3 and Q4.
+    Uses the same local-time month starts as _date_to_timestamp_range.
+    """
+    if unit == "quarter":
+        # date_str: "2024-Q4"
+        year, quarter = date_str.split("-Q")
+        start_month = (int(quarter) - 1) * 3 + 1
+        months = [start_month + 1, start_month + 2]
+    else:  # year
+        # date_str: "2024"
+        year = date_str
+        months = [4, 7, 10]
+
+    return [int(datetime(int(year), m, 1).timestamp() * 1000) for m in months]
+
+
 def _generate_example_events() -> list[EventLogItem]:
     """Generate example events for testing."""
     now = datetime.utcnow()
@@ -93,7 +153,7 @@ def _generate_example_events() -> list[EventLogItem]:
         cam_id, cam_name = cameras[i % len(cameras)]
         event_type = event_types[i % len(event_types)]
 
-        examples.append(EventLogItem(
+        examples.append(EventLogItem.model_construct(
             id=f"evt_{1000 + i}",
             camera_id=cam_id,
             camera_name=cam_name,
@@ -148,12 +208,16 @@ def _generate_example_summary(
     ]
 
 
+# Inclusive value ranges for example trend series
+_EXAMPLE_VEHICLE_RANGE = range(5, 51)
+_EXAMPLE_PERSON_RANGE = range(2, 31)
+_EXAMPLE_ANIMAL_RANGE = range(0, 11)
+
+
 def _generate_example_trend(
     unit: str, date: str
 ) -> TrendResponse:
     """Generate example trend data for testing."""
-    import random
-
     if unit == "day":
         labels = [f"{h}:00" for h in range(24)]
     elif unit == "month":
@@ -167,12 +231,12 @@ def _generate_example_trend(
     else:  # year
         labels = ["Q1", "Q2", "Q3", "Q4"]
 
-    # Generate random data
+    # Generate random data (one choices() call per series instead of n randint calls)
     n = len(labels)
-    vehicle_data = [random.randint(5, 50) for _ in range(n)]
-    person_data = [random.randint(2, 30) for _ in range(n)]
-    animal_data = [random.randint(0, 10) for _ in range(n)]
-    total_data = [v + p + a for v, p, a in zip(vehicle_data, person_data, animal_data)]
+    vehicle_data = random.choices(_EXAMPLE_VEHICLE_RANGE, k=n)
+    person_data = random.choices(_EXAMPLE_PERSON_RANGE, k=n)
+    animal_data = random.choices(_EXAMPLE_ANIMAL_RANGE, k=n)
+    total_data = list(map(sum, zip(vehicle_data, person_data, animal_data)))
 
     return TrendResponse(
         unit=unit,
@@ -195,9 +259,10 @@ async def get_event_log(
     event_type: str | None = Query(None),
     from_date: str | None = Query(None, alias="from"),
     to_date: str | None = Query(None, alias="to"),
-    page: int = Query(1, ge=1),
+    page: int = Query(1, ge=1, deprecated=True),
     page_size: int = Query(10, ge=1, le=100),
-) -> EventLogResponse:
+    cursor: str | None = Query(None),
+) -> Response:
     """
     Get paginated event log.
 
@@ -205,33 +270,42 @@ async def get_event_log(
     - **event_type**: Filter by event type (optional)
     - **from**: Start date ISO format (optional)
     - **to**: End date ISO format (optional)
-    - **page**: Page number (default: 1)
+    - **page**: Page number (default: 1, deprecated - use cursor)
     - **page_size**: Items per page (default: 10, max: 100)
+    - **cursor**: `next_cursor` from the previous page (takes precedence over page)
     """
-    # Build query
-    query = select(Event).order_by(Event.timestamp.desc())
-    count_query = select(func.count()).select_from(Event)
+    # Build query (id breaks timestamp ties so keyset positions are unique).
+    # lambda_stmt caches the compiled SQL per filter combination; filter values
+    # captured by the lambdas are extracted as bound parameters.
+    query = lambda_stmt(
+        lambda: select(Event, Camera.name.label("camera_name"))
+        .outerjoin(Camera, Event.video_id == Camera.id)
+        .order_by(Event.timestamp.desc(), Event.id.desc())
+        # Relationship access while building DTOs must be an explicit eager load
+        .options(raiseload("*"))
+    )
+    count_query = lambda_stmt(lambda: select(func.count()).select_from(Event))
 
     # Apply filters
     if camera_id:
-        query = query.where(Event.video_id == camera_id)
-        count_query = count_query.where(Event.video_id == camera_id)
+        query += lambda s: s.where(Event.video_id == camera_id)
+        count_query += lambda s: s.where(Event.video_id == camera_id)
 
     if event_type:
-        query = query.where(Event.object_type == event_type)
-        count_query = count_query.where(Event.object_type == event_type)
+        query += lambda s: s.where(Event.object_type == event_type)
+        count_query += lambda s: s.where(Event.object_type == event_type)
 
     if from_date:
         from_dt = datetime.strptime(from_date, "%Y-%m-%d")
         from_ts = int(from_dt.timestamp() * 1000)
-        query = query.where(Event.timestamp >= from_ts)
-        count_query = count_query.where(Event.timestamp >= from_ts)
+        query += lambda s: s.where(Event.timestamp >= from_ts)
+        count_query += lambda s: s.where(Event.timestamp >= from_ts)
 
     if to_date:
         to_dt = datetime.strptime(to_date, "%Y-%m-%d") + timedelta(days=1)
         to_ts = int(to_dt.timestamp() * 1000)
-        query = query.where(Event.timestamp < to_ts)
-        count_query = count_query.where(Event.timestamp < to_ts)
+        query += lambda s: s.where(Event.timestamp < to_ts)
+        count_query += lambda s: s.where(Event.timestamp < to_ts)
 
     # Get total count
     total_result = await db.execute(count_query)
@@ -240,50 +314,52 @@ async def get_event_log(
     # If no events, return example data
     if total == 0:
         examples = _generate_example_events()
-        return EventLogResponse(
+        return json_response(_event_log_adapter, EventLogResponse(
             items=examples,
             total=len(examples),
             page=1,
             page_size=page_size,
-        )
+        ))
 
-    # Apply pagination
-    offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size)
+    # Apply pagination: keyset seek when a cursor is given, OFFSET otherwise
+    if cursor:
+        cursor_ts, cursor_id = _decode_cursor(cursor)
+        query += lambda s: s.where(
+            tuple_(Event.timestamp, Event.id) < tuple_(cursor_ts, cursor_id)
+        )
+    else:
+        offset = (page - 1) * page_size
+        query += lambda s: s.offset(offset)
+    query += lambda s: s.limit(page_size)
 
-    # Execute query
+    # Execute query (camera names come from the outer join)
     result = await db.execute(query)
-    events = result.scalars().all()
-
-    # Get camera names
-    camera_ids = list(set(e.video_id for e in events if e.video_id))
-    camera_names = {}
-    if camera_ids:
-        cameras_result = await db.execute(
-            select(Camera).where(Camera.id.in_(camera_ids))
-        )
-        for cam in cameras_result.scalars().all():
-            camera_names[cam.id] = cam.name or cam.id
 
-    # Map to response
+    # Map to response (single pass over the result, no intermediate row list)
     items = []
-    for event in events:
-        items.append(EventLogItem(
+    next_cursor = None
+    for event, camera_name in result:
+        items.append(EventLogItem.model_construct(
             id=str(event.id),
             camera_id=event.video_id or "",
-            camera_name=camera_names.get(event.video_id, event.video_name or event.video_id or ""),
+            camera_name=camera_name or event.video_name or event.video_id or "",
             event_type=event.object_type or "unknown",
             timestamp=_timestamp_to_iso(event.timestamp),
             video_url=None,  # TODO: Generate video clip URL if available
             thumbnail_url=f"/media/events/{event.id}/thumbnail.jpg" if event.id else None,
         ))
 
-    return EventLogResponse(
+    if len(items) == page_size:
+        # event is the last row of the full page
+        next_cursor = _encode_cursor(event.timestamp, event.id)
+
+    return json_response(_event_log_adapter, EventLogResponse(
         items=items,
         total=total,
         page=page,
         page_size=page_size,
-    )
+        next_cursor=next_cursor,
+    ))
 
 
 @router.get("/summary", response_model=SummaryResponse)
@@ -294,7 +370,7 @@ async def get_summary(
     date: str = Query(..., description="Date based on unit: day=2024-12-28, month=2024-12, quarter=2024-Q4, year=2024"),
     camera_id: str | None = Query(None),
     event_type: str | None = Query(None),
-) -> SummaryResponse:
+) -> Response:
     """
     Get aggregated statistics summary.
 
@@ -309,13 +385,17 @@ async def get_summary(
     query = (
         select(
             Event.video_id,
-            Event.video_name,
+            # Display name fallback resolved in SQL: camera > event video name > id
+            func.coalesce(
+                Camera.name, Event.video_name, Event.video_id, ""
+            ).label("camera_name"),
             Event.object_type,
             func.count().label("count"),
         )
+        .outerjoin(Camera, Event.video_id == Camera.id)
         .where(Event.timestamp >= start_ts)
         .where(Event.timestamp < end_ts)
-        .group_by(Event.video_id, Event.video_name, Event.object_type)
+        .group_by(Event.video_id, Event.video_name, Camera.name, Event.object_type)
     )
 
     if camera_id:
@@ -329,31 +409,23 @@ async def get_summary(
 
     # If no data, return example
     if not rows:
-        return SummaryResponse(items=_generate_example_summary(unit, date))
-
-    # Get camera names
-    camera_ids = list(set(row.video_id for row in rows if row.video_id))
-    camera_names = {}
-    if camera_ids:
-        cameras_result = await db.execute(
-            select(Camera).where(Camera.id.in_(camera_ids))
+        return json_response(
+            _summary_adapter, SummaryResponse(items=_generate_example_summary(unit, date))
         )
-        for cam in cameras_result.scalars().all():
-            camera_names[cam.id] = cam.name or cam.id
 
     # Map to response
     items = []
     for row in rows:
-        items.append(SummaryItem(
+        items.append(SummaryItem.model_construct(
             camera_id=row.video_id or "",
-            camera_name=camera_names.get(row.video_id, row.video_name or row.video_id or ""),
+            camera_name=row.camera_name,
             event_type=row.object_type or "unknown",
             start_date=start_date_str,
             end_date=end_date_str,
             count=row.count,
         ))
 
-    return SummaryResponse(items=items)
+    return json_response(_summary_adapter, SummaryResponse(items=items))
 
 
 @router.get("/trend", response_model=TrendResponse)
@@ -364,7 +436,7 @@ async def get_trend(
     date: str = Query(..., description="Date based on unit"),
     camera_id: str | None = Query(None),
     event_type: str | None = Query(None),
-) -> TrendResponse:
+) -> Response:
     """
     Get trend data for charts.
 
@@ -399,11 +471,24 @@ async def get_trend(
         # Variable bucket size - handle separately
         labels = ["Q1", "Q2", "Q3", "Q4"]
 
-    # Build base query
+    # Bucket index is computed in SQL so only (bucket, type, count) rows come back
+    if unit in ("day", "month"):
+        bucket_expr = (Event.timestamp - start_ts) // bucket_size_ms
+    else:
+        # Month within quarter / quarter within year: integer comparisons against
+        # precomputed bucket start timestamps (no per-row date parsing)
+        boundaries = _month_bucket_boundaries(date, unit)
+        bucket_expr = case(
+            *[(Event.timestamp < b, i) for i, b in enumerate(boundaries)],
+            else_=len(boundaries),
+        )
+
+    bucket_col = bucket_expr.label("bucket")
     base_query = (
-        select(Event.timestamp, Event.object_type)
+        select(bucket_col, Event.object_type, func.count().label("count"))
         .where(Event.timestamp >= start_ts)
         .where(Event.timestamp < end_ts)
+        .group_by(bucket_col, Event.object_type)
     )
 
     if camera_id:
@@ -413,37 +498,25 @@ async def get_trend(
         base_query = base_query.where(Event.object_type == event_type)
 
     result = await db.execute(base_query)
-    events = result.all()
+    rows = result.all()
 
     # If no data, return example
-    if not events:
-        return _generate_example_trend(unit, date)
+    if not rows:
+        return json_response(_trend_adapter, _generate_example_trend(unit, date))
 
-    # Initialize buckets
+    # Fill buckets from grouped counts
     event_types_found = set()
     buckets: dict[str, list[int]] = {}
 
-    for event in events:
-        ts = event.timestamp
-        et = event.object_type or "unknown"
+    for row in rows:
+        et = row.object_type or "unknown"
         event_types_found.add(et)
 
         if et not in buckets:
             buckets[et] = [0] * bucket_count
 
-        # Calculate bucket index
-        if unit in ("day", "month"):
-            bucket_idx = min((ts - start_ts) // bucket_size_ms, bucket_count - 1)
-        elif unit == "quarter":
-            # Month within quarter
-            dt = datetime.utcfromtimestamp(ts / 1000)
-            bucket_idx = (dt.month - 1) % 3
-        else:  # year
-            # Quarter within year
-            dt = datetime.utcfromtimestamp(ts / 1000)
-            bucket_idx = (dt.month - 1) // 3
-
-        buckets[et][int(bucket_idx)] += 1
+        bucket_idx = min(int(row.bucket), bucket_count - 1)
+        buckets[et][bucket_idx] += row.count
 
     # Build series with total
     series = []
@@ -458,12 +531,12 @@ async def get_trend(
     # Add total series at the beginning
     series.insert(0, TrendSeries(event_type="total", data=total_data))
 
-    return TrendResponse(
+    return json_response(_trend_adapter, TrendResponse(
         unit=unit,
         date=date,
         labels=labels,
         series=series,
-    )
+    ))
 
 
 @router.get("/event-types", response_model=EventTypesResponse)
@@ -2,11 +2,12 @@
 
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from loguru import logger
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from app.core.deps import get_current_user
+from app.core.responses import etag_json_response
 from app.models.user import User
 from app.services.stream_service import stream_service
 
@@ -48,10 +49,21 @@ class SyncResponse(BaseModel):
     synced_count: int = 0
 
 
+_stream_list_adapter = TypeAdapter(StreamListResponse)
+_stream_info_adapter = TypeAdapter(StreamInfo)
+
+
+def _stream_urls(name: str) -> StreamUrls:
+    """Build playback URLs for a stream (all four from one service call)."""
+    rtsp, hls, whep, whep_player = stream_service.get_stream_urls(name)
+    return StreamUrls.model_construct(rtsp=rtsp, hls=hls, whep=whep, whep_player=whep_player)
+
+
 @router.get("", response_model=StreamListResponse)
 async def list_streams(
+    request: Request,
     current_user: User = Depends(get_current_user),
-):
+) -> Response:
     """
     Get all streams directly from MediaMTX.
 
@@ -60,40 +72,48 @@ async def list_streams(
     """
     paths = await stream_service.get_all_paths()
 
+    # Hoist attribute lookups out of the per-path loop
+    get_urls = stream_service.get_stream_urls
+    make_info = StreamInfo.model_construct
+    make_urls = StreamUrls.model_construct
+
     streams = []
+    append = streams.append
     for path in paths:
-        name = path.get("name", "")
+        name = path.get("name")
         if not name:
             continue
 
         # Get source info
-        source = path.get("source", {}) or {}
+        source = path.get("source") or {}
+        rtsp, hls, whep, whep_player = get_urls(name)
 
-        streams.append(
-            StreamInfo(
+        # Fields are coerced here, so skip per-stream validation
+        append(
+            make_info(
                 name=name,
-                ready=path.get("ready", False),
+                ready=bool(path.get("ready")),
                 source_ready=path.get("sourceReady"),
-                source_type=source.get("type") if source else None,
-                readers_count=len(path.get("readers", [])),
-                urls=StreamUrls(
-                    rtsp=stream_service.get_rtsp_url(name),
-                    hls=stream_service.get_hls_url(name),
-                    whep=stream_service.get_webrtc_url(name),
-                    whep_player=stream_service.get_webrtc_player_url(name),
-                ),
+                source_type=source.get("type"),
+                readers_count=len(path.get("readers") or ()),
+                urls=make_urls(rtsp=rtsp, hls=hls, whep=whep, whep_player=whep_player),
             )
         )
 
     logger.info(f"Retrieved {len(streams)} streams from MediaMTX")
-    return StreamListResponse(streams=streams, total=len(streams))
+    return etag_json_response(
+        request,
+        _stream_list_adapter,
+        StreamListResponse.model_construct(streams=streams, total=len(streams)),
+    )
 
 
 @router.get("/{stream_name}", response_model=StreamInfo)
 async def get_stream(
     stream_name: str,
+    request: Request,
     current_user: User = Depends(get_current_user),
-):
+) -> Response:
     """
     Get details of a specific stream from MediaMTX.
 
@@ -107,19 +127,15 @@ async def get_stream(
     if status.get("status") == "error":
         raise HTTPException(status_code=503, detail=status.get("message", "MediaMTX error"))
 
-    return StreamInfo(
+    stream = StreamInfo.model_construct(
         name=stream_name,
-        ready=status.get("is_ready", False),
+        ready=bool(status.get("is_ready")),
         source_ready=status.get("source_ready"),
         source_type=status.get("source"),
         readers_count=status.get("readers_count", 0),
-        urls=StreamUrls(
-            rtsp=stream_service.get_rtsp_url(stream_name),
-            hls=stream_service.get_hls_url(stream_name),
-            whep=stream_service.get_webrtc_url(stream_name),
-            whep_player=stream_service.get_webrtc_player_url(stream_name),
-        ),
+        urls=_stream_urls(stream_name),
     )
+    return etag_json_response(request, _stream_info_adapter, stream)
 
 
 @router.get("/{stream_name}/player-url")
@@ -130,11 +146,12 @@ async def get_player_url(
     """
     Get the WebRTC player URL for embedding in iframe or direct access.
     """
+    _, hls, whep, whep_player = stream_service.get_stream_urls(stream_name)
     return {
         "stream_name": stream_name,
-        "whep_player": stream_service.get_webrtc_player_url(stream_name),
-        "whep": stream_service.get_webrtc_url(stream_name),
-        "hls": stream_service.get_hls_url(stream_name),
+        "whep_player": whep_player,
+        "whep": whep,
+        "hls": hls,
     }
 
 
@@ -1,19 +1,23 @@
 """System API endpoints."""
 
+import asyncio
 import os
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
 
 import httpx
-import nats
 import psutil
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 from loguru import logger
+from pydantic import TypeAdapter
 from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_dx_config, get_settings
 from app.core.deps import CurrentUserRequired, DBSession
+from app.core.responses import etag_json_response
+from app.db.session import async_session_maker
 from app.grpc import get_grpc_client
 from app.models.app import App
 from app.models.camera import Camera
@@ -23,6 +27,7 @@ from app.models.inference import Inference
 from app.models.eventpush import Eventpush
 from app.schemas.system import (
     CleanupResponse,
+    LivenessResponse,
     ServiceHealth,
     SyncAllResponse,
     SyncResult,
@@ -31,21 +36,41 @@ from app.schemas.system import (
     SystemStatusResponse,
 )
 from app.services.stream_service import stream_service
+from app.workers.nats_publisher import get_nats_publisher
 
 settings = get_settings()
+dx_config = get_dx_config()
 _start_time = time.time()
 
+# Upper bound for each individual /health probe (seconds)
+_HEALTH_PROBE_TIMEOUT = 5.0
+
+# Image rows fetched, unlinked and deleted per transaction during /cleanup
+_CLEANUP_BATCH_SIZE = 1000
+# Image files unlinked concurrently within a batch
+_CLEANUP_UNLINK_CHUNK = 256
+
+# Disk usage barely moves; reuse the last reading: (monotonic time, percent)
+_DISK_USAGE_TTL = 5.0
+_disk_usage_cache: tuple[float, float] | None = None
+
+# Short-lived /status cache: (monotonic time computed, response without uptime)
+_status_cache: tuple[float, SystemStatusResponse] | None = None
+_status_lock = asyncio.Lock()
+
 router = APIRouter()
 
+_status_adapter = TypeAdapter(SystemStatusResponse)
+_info_adapter = TypeAdapter(SystemInfo)
+
 
 @router.get("", response_model=SystemInfo)
 async def get_system_info(
+    request: Request,
     current_user: CurrentUserRequired,
-) -> SystemInfo:
+) -> Response:
     """Get system info with JWT claims."""
-    dx_config = get_dx_config()
-
-    return SystemInfo(
+    info = SystemInfo(
         id=current_user.id,
         name=current_user.username,
         address=None,  # Could be populated from config
@@ -60,10 +85,23 @@ async def get_system_info(
         nats_port=dx_config.nats_port,
         launcher_port=dx_config.launcher_port,
     )
+    return etag_json_response(request, _info_adapter, info)
+
+
+@router.get("/health/live", response_model=LivenessResponse)
+async def get_system_liveness() -> LivenessResponse:
+    """
+    Liveness probe: the process is up and serving requests.
+
+    No auth and no I/O; use /health/ready (or /health) for downstream checks.
+    """
+    return LivenessResponse(uptime_seconds=int(time.time() - _start_time))
 
 
 @router.get("/health", response_model=SystemHealthResponse)
+@router.get("/health/ready", response_model=SystemHealthResponse)
 async def get_system_health(
+    request: Request,
     current_user: CurrentUserRequired,
     db: DBSession,
 ) -> SystemHealthResponse:
@@ -72,57 +110,60 @@ async def get_system_health(
 
     Returns status of Core (gRPC), MediaMTX, NATS, and Database.
     """
-    # Check Core (gRPC)
-    core_health = ServiceHealth(status="disconnected")
-    grpc_client = get_grpc_client()
-    if grpc_client:
-        try:
-            start = time.time()
-            await grpc_client.get_dx_info()
-            latency = (time.time() - start) * 1000
-            core_health = ServiceHealth(status="connected", latency_ms=round(latency, 2))
-        except Exception as e:
-            core_health = ServiceHealth(status="error", message=str(e))
-
-    # Check MediaMTX
-    mediamtx_health = ServiceHealth(status="disconnected")
-    try:
+    async def _check_core() -> ServiceHealth:
+        grpc_client = get_grpc_client()
+        if not grpc_client:
+            return ServiceHealth(status="disconnected")
         start = time.time()
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(f"{stream_service.api_url}/paths/list", timeout=5.0)
-            latency = (time.time() - start) * 1000
-            if resp.status_code == 200:
-                data = resp.json()
-                mediamtx_health = ServiceHealth(
-                    status="connected",
-                    latency_ms=round(latency, 2),
-                    details={"streams": data.get("itemCount", 0)},
-                )
-            else:
-                mediamtx_health = ServiceHealth(status="error", message=f"HTTP {resp.status_code}")
-    except Exception as e:
-        mediamtx_health = ServiceHealth(status="error", message=str(e))
+        await grpc_client.get_dx_info()
+        latency = (time.time() - start) * 1000
+        return ServiceHealth(status="connected", latency_ms=round(latency, 2))
 
-    # Check NATS
-    nats_health = ServiceHealth(status="disconnected")
-    try:
+    async def _check_mediamtx() -> ServiceHealth:
         start = time.time()
-        nc = await nats.connect(settings.nats_uri, connect_timeout=3)
+        client: httpx.AsyncClient = request.app.state.http_client
+        resp = await client.get(f"{stream_service.api_url}/paths/list")
         latency = (time.time() - start) * 1000
-        await nc.close()
-        nats_health = ServiceHealth(status="connected", latency_ms=round(latency, 2))
-    except Exception as e:
-        nats_health = ServiceHealth(status="error", message=str(e))
+        if resp.status_code != 200:
+            return ServiceHealth(status="error", message=f"HTTP {resp.status_code}")
+        data = resp.json()
+        return ServiceHealth(
+            status="connected",
+            latency_ms=round(latency, 2),
+            details={"streams": data.get("itemCount", 0)},
+        )
+
+    async def _check_nats() -> ServiceHealth:
+        # Ping over the long-lived publisher connection instead of connect/close
+        publisher = await get_nats_publisher()
+        start = time.time()
+        if not await publisher.ping(timeout=1.0):
+            return ServiceHealth(status="error", message="NATS not connected")
+        latency = (time.time() - start) * 1000
+        return ServiceHealth(status="connected", latency_ms=round(latency, 2))
 
-    # Check Database
-    db_health = ServiceHealth(status="disconnected")
-    try:
+    async def _check_db() -> ServiceHealth:
         start = time.time()
         await db.execute(select(func.count()).select_from(App))
         latency = (time.time() - start) * 1000
-        db_health = ServiceHealth(status="connected", latency_ms=round(latency, 2))
-    except Exception as e:
-        db_health = ServiceHealth(status="error", message=str(e))
+        return ServiceHealth(status="connected", latency_ms=round(latency, 2))
+
+    async def _probe(check) -> ServiceHealth:
+        # Each probe is bounded so one slow service can't stall the others
+        try:
+            return await asyncio.wait_for(check(), timeout=_HEALTH_PROBE_TIMEOUT)
+        except TimeoutError:
+            return ServiceHealth(status="error", message="Health check timed out")
+        except Exception as e:
+            return ServiceHealth(status="error", message=str(e))
+
+    # Core (gRPC), MediaMTX, NATS and Database checks run concurrently
+    core_health, mediamtx_health, nats_health, db_health = await asyncio.gather(
+        _probe(_check_core),
+        _probe(_check_mediamtx),
+        _probe(_check_nats),
+        _probe(_check_db),
+    )
 
     # Overall health
     all_connected = all(
@@ -139,79 +180,136 @@ async def get_system_health(
     )
 
 
+def _status_cache_fresh() -> bool:
+    """Check whether the cached /status response is still within its TTL."""
+    return (
+        _status_cache is not None
+        and time.monotonic() - _status_cache[0] < settings.status_cache_ttl_seconds
+    )
+
+
+async def _get_disk_usage_percent() -> float:
+    """Get data folder disk usage, statvfs'd in a thread and reused briefly."""
+    global _disk_usage_cache
+
+    if _disk_usage_cache and time.monotonic() - _disk_usage_cache[0] < _DISK_USAGE_TTL:
+        return _disk_usage_cache[1]
+
+    try:
+        disk = await asyncio.to_thread(psutil.disk_usage, settings.data_save_folder)
+        percent = disk.percent
+    except Exception:
+        percent = 0.0
+
+    _disk_usage_cache = (time.monotonic(), percent)
+    return percent
+
+
+async def _compute_system_status(db: AsyncSession) -> SystemStatusResponse:
+    """Collect status counts and disk usage (uptime is filled in by the caller)."""
+    # All counts in one round-trip (scalar subqueries share a single snapshot)
+    counts = (
+        await db.execute(
+            select(
+                select(func.count()).select_from(App).scalar_subquery().label("apps"),
+                select(func.count()).select_from(Camera).scalar_subquery().label("cameras"),
+                select(func.count()).select_from(Inference).scalar_subquery().label("inferences"),
+                select(func.count()).select_from(Event).scalar_subquery().label("events"),
+                # Pending eventpushes (enabled ones)
+                select(func.count())
+                .select_from(Eventpush)
+                .where(Eventpush.enabled == True)
+                .scalar_subquery()
+                .label("eventpushes"),
+            )
+        )
+    ).one()
+
+    disk_usage_percent = await _get_disk_usage_percent()
+
+    return SystemStatusResponse(
+        apps_count=counts.apps or 0,
+        cameras_count=counts.cameras or 0,
+        active_inferences=counts.inferences or 0,
+        total_events=counts.events or 0,
+        pending_eventpushes=counts.eventpushes or 0,
+        disk_usage_percent=disk_usage_percent,
+    )
+
+
 @router.get("/status", response_model=SystemStatusResponse)
 async def get_system_status(
+    request: Request,
     current_user: CurrentUserRequired,
     db: DBSession,
-) -> SystemStatusResponse:
+) -> Response:
     """
     Get system status summary.
 
     Returns counts of apps, cameras, inferences, events, and disk usage.
     """
-    # Count apps
-    apps_result = await db.execute(select(func.count()).select_from(App))
-    apps_count = apps_result.scalar() or 0
-
-    # Count cameras
-    cameras_result = await db.execute(select(func.count()).select_from(Camera))
-    cameras_count = cameras_result.scalar() or 0
-
-    # Count active inferences
-    inferences_result = await db.execute(select(func.count()).select_from(Inference))
-    active_inferences = inferences_result.scalar() or 0
-
-    # Count total events
-    events_result = await db.execute(select(func.count()).select_from(Event))
-    total_events = events_result.scalar() or 0
-
-    # Count pending eventpushes (enabled ones)
-    eventpushes_result = await db.execute(
-        select(func.count()).select_from(Eventpush).where(Eventpush.enabled == True)
+    global _status_cache
+
+    if not _status_cache_fresh():
+        async with _status_lock:
+            # Another request may have refreshed it while we waited
+            if not _status_cache_fresh():
+                _status_cache = (time.monotonic(), await _compute_system_status(db))
+
+    _, status_response = _status_cache
+
+    # Uptime is always current; only the counts and disk usage are cached.
+    # The ETag covers the cached part so revalidation can still answer 304.
+    return etag_json_response(
+        request,
+        _status_adapter,
+        status_response.model_copy(
+            update={"uptime_seconds": int(time.time() - _start_time)}
+        ),
+        etag_content=status_response,
     )
-    pending_eventpushes = eventpushes_result.scalar() or 0
 
-    # Get disk usage
-    try:
-        disk = psutil.disk_usage(settings.data_save_folder)
-        disk_usage_percent = disk.percent
-    except Exception:
-        disk_usage_percent = 0.0
 
-    # Calculate uptime
-    uptime_seconds = int(time.time() - _start_time)
-
-    return SystemStatusResponse(
-        apps_count=apps_count,
-        cameras_count=cameras_count,
-        active_inferences=active_inferences,
-        total_events=total_events,
-        pending_eventpushes=pending_eventpushes,
-        disk_usage_percent=disk_usage_percent,
-        uptime_seconds=uptime_seconds,
-    )
+def _failed_sync(name: str, exc: BaseException) -> SyncResult:
+    """Log a failed sync stage and map it to a SyncResult."""
+    message = exc.detail if isinstance(exc, HTTPException) else str(exc)
+    logger.error(f"{name.capitalize()} sync failed: {message}")
+    return SyncResult(name=name, success=False, message=message)
 
 
 @router.post("/sync-all", response_model=SyncAllResponse)
 async def sync_all(
     current_user: CurrentUserRequired,
-    db: DBSession,
 ) -> SyncAllResponse:
     """
     Sync all data from external services.
 
-    Runs cameras, apps, and inferences sync in sequence.
+    Runs cameras, apps, and inferences sync concurrently.
     """
-    results = []
-
     # Import sync functions
     from app.api.v2.cameras import sync_cameras_from_mediamtx
     from app.api.v2.apps import sync_apps_from_core
     from app.api.v2.inference import sync_inferences
 
-    # 1. Sync cameras from MediaMTX
-    try:
-        camera_result = await sync_cameras_from_mediamtx(db=db, current_user=current_user)
+    async def _run_sync(sync_fn):
+        # Each stage gets its own session so the stages can run concurrently
+        async with async_session_maker() as session:
+            return await sync_fn(db=session, current_user=current_user)
+
+    # Cameras (MediaMTX), apps (Core) and inferences are independent of each other
+    camera_result, apps_result, inference_result = await asyncio.gather(
+        _run_sync(sync_cameras_from_mediamtx),
+        _run_sync(sync_apps_from_core),
+        _run_sync(sync_inferences),
+        return_exceptions=True,
+    )
+
+    results = []
+
+    # 1. Cameras from MediaMTX
+    if isinstance(camera_result, BaseException):
+        results.append(_failed_sync("cameras", camera_result))
+    else:
         results.append(SyncResult(
             name="cameras",
             success=camera_result.success,
@@ -220,13 +318,11 @@ async def sync_all(
             deleted=camera_result.deleted,
             message=camera_result.message,
         ))
-    except Exception as e:
-        logger.error(f"Camera sync failed: {e}")
-        results.append(SyncResult(name="cameras", success=False, message=str(e)))
 
-    # 2. Sync apps from Core
-    try:
-        apps_result = await sync_apps_from_core(db=db, current_user=current_user)
+    # 2. Apps from Core
+    if isinstance(apps_result, BaseException):
+        results.append(_failed_sync("apps", apps_result))
+    else:
         results.append(SyncResult(
             name="apps",
             success=apps_result.success,
@@ -235,16 +331,11 @@ async def sync_all(
             deleted=apps_result.deleted,
             message=apps_result.message,
         ))
-    except HTTPException as e:
-        logger.error(f"Apps sync failed: {e.detail}")
-        results.append(SyncResult(name="apps", success=False, message=e.detail))
-    except Exception as e:
-        logger.error(f"Apps sync failed: {e}")
-        results.append(SyncResult(name="apps", success=False, message=str(e)))
 
-    # 3. Sync inferences
-    try:
-        inference_result = await sync_inferences(db=db, current_user=current_user)
+    # 3. Inferences
+    if isinstance(inference_result, BaseException):
+        results.append(_failed_sync("inferences", inference_result))
+    else:
         results.append(SyncResult(
             name="inferences",
             success=inference_result.success,
@@ -252,12 +343,6 @@ async def sync_all(
             deleted=inference_result.deleted_from_db,
             message=inference_result.message,
         ))
-    except HTTPException as e:
-        logger.error(f"Inference sync failed: {e.detail}")
-        results.append(SyncResult(name="inferences", success=False, message=e.detail))
-    except Exception as e:
-        logger.error(f"Inference sync failed: {e}")
-        results.append(SyncResult(name="inferences", success=False, message=str(e)))
 
     all_success = all(r.success for r in results)
     total_added = sum(r.added for r in results)
@@ -270,6 +355,24 @@ async def sync_all(
     )
 
 
+def _unlink_image(path: str) -> int:
+    """Delete an image file (blocking; run in a thread).
+
+    Returns the freed size in bytes (0 if the file was already gone),
+    or -1 if deletion failed.
+    """
+    try:
+        img_path = Path(path)
+        if not img_path.exists():
+            return 0
+        size = img_path.stat().st_size
+        img_path.unlink()
+        return size
+    except Exception as e:
+        logger.warning(f"Failed to delete image {path}: {e}")
+        return -1
+
+
 @router.post("/cleanup", response_model=CleanupResponse)
 async def cleanup_old_data(
     current_user: CurrentUserRequired,
@@ -286,35 +389,43 @@ async def cleanup_old_data(
 
     cutoff_timestamp = int((datetime.now() - timedelta(days=days)).timestamp() * 1000)
 
-    # Get images to delete (for disk space calculation)
-    images_result = await db.execute(
-        select(Image).where(Image.timestamp < cutoff_timestamp)
-    )
-    old_images = images_result.scalars().all()
-
-    # Calculate disk space to be freed
+    # Delete images a batch at a time: files in worker threads off the event
+    # loop, then the rows by id, committing so memory and locks stay bounded
     disk_freed_bytes = 0
     images_deleted = 0
-    for img in old_images:
-        try:
-            img_path = Path(img.path)
-            if img_path.exists():
-                disk_freed_bytes += img_path.stat().st_size
-                img_path.unlink()
-            images_deleted += 1
-        except Exception as e:
-            logger.warning(f"Failed to delete image {img.path}: {e}")
+    while True:
+        batch = (
+            await db.execute(
+                select(Image.id, Image.path)
+                .where(Image.timestamp < cutoff_timestamp)
+                .limit(_CLEANUP_BATCH_SIZE)
+            )
+        ).all()
+        if not batch:
+            break
+
+        for i in range(0, len(batch), _CLEANUP_UNLINK_CHUNK):
+            chunk = batch[i : i + _CLEANUP_UNLINK_CHUNK]
+            sizes = await asyncio.gather(
+                *(asyncio.to_thread(_unlink_image, row.path) for row in chunk)
+            )
+            disk_freed_bytes += sum(size for size in sizes if size > 0)
+
+        # Counts come from the DELETE itself (no pre-count SELECT)
+        images_result = await db.execute(
+            delete(Image)
+            .where(Image.id.in_([row.id for row in batch]))
+            .execution_options(synchronize_session=False)
+        )
+        images_deleted += images_result.rowcount
+        await db.commit()
 
-    # Delete old images from DB
-    await db.execute(delete(Image).where(Image.timestamp < cutoff_timestamp))
-
-    # Delete old events
     events_result = await db.execute(
-        select(func.count()).select_from(Event).where(Event.timestamp < cutoff_timestamp)
+        delete(Event)
+        .where(Event.timestamp < cutoff_timestamp)
+        .execution_options(synchronize_session=False)
     )
-    events_to_delete = events_result.scalar() or 0
-
-    await db.execute(delete(Event).where(Event.timestamp < cutoff_timestamp))
+    events_to_delete = events_result.rowcount
 
     await db.commit()
 
@@ -2,7 +2,7 @@
 
 from fastapi import APIRouter, HTTPException, status
 
-from app.core.deps import CurrentUserRequired, DBSession
+from app.core.deps import CurrentUserRequired, DBSession, invalidate_user_cache
 from app.schemas.auth import ChangePassword
 from app.services.user_service import UserService
 
@@ -38,4 +38,5 @@ async def change_password(
             detail="User not found",
         )
 
+    invalidate_user_cache(user_id)
     return {"status": "success"}
@@ -1,22 +1,26 @@
 """Video management API endpoints."""
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Response, status
+from pydantic import TypeAdapter
 
 from app.core.deps import CurrentUserRequired, DBSession
+from app.core.responses import json_response
 from app.schemas.video import VideoCreate, VideoDTO, VideoSettings, VideoSettingUpdate
 from app.services.video_service import VideoService
 
 router = APIRouter()
 
+_video_list_adapter = TypeAdapter(list[VideoDTO])
+
 
 @router.get("", response_model=list[VideoDTO])
 async def get_videos(
     db: DBSession,
     current_user: CurrentUserRequired,
-) -> list[VideoDTO]:
+) -> Response:
     """Get all videos/streams."""
     video_service = VideoService(db)
-    return await video_service.get_all_dto()
+    return json_response(_video_list_adapter, await video_service.get_all_dto())
 
 
 @router.post("", response_model=VideoDTO)
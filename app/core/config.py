@@ -1,6 +1,5 @@
 """Application configuration using pydantic-settings."""
 
-from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -8,6 +7,11 @@ import yaml
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables and config files."""
@@ -33,6 +37,13 @@ class Settings(BaseSettings):
     data_save_folder: str = "/opt/autocare/dx/volume/DxApi"
     db_file: str = "DxApi.db"
 
+    # Connection pool (sized for concurrent statistics/event-log requests)
+    db_pool_size: int = 20
+    db_max_overflow: int = 20
+    db_pool_timeout: float = 10.0
+    db_pool_recycle: int = 1800  # seconds
+    db_pool_pre_ping: bool = False  # local SQLite connections don't go stale
+
     @property
     def database_url(self) -> str:
         """SQLite database URL."""
@@ -48,6 +59,11 @@ class Settings(BaseSettings):
     jwt_access_token_expire_minutes: int = 60 * 24  # 24 hours
     jwt_issuer: str = "https://localhost:8000/"
     jwt_audience: str = "https://localhost:8000/"
+    # bcrypt cost factor (2^rounds iterations); each step down halves the work
+    # and the brute-force resistance, so only lower it for dev/test data
+    bcrypt_rounds: int = Field(default=12, ge=4, le=31)
+    # Accept unsalted "$plain$<sha256>" password hashes (test fixtures only)
+    allow_plain_hash: bool = False
 
     # NATS
     nats_uri: str = Field(default="nats://localhost:4222", alias="NATS_URI")
@@ -57,6 +73,8 @@ class Settings(BaseSettings):
         default="127.0.0.1:50051",
         alias="CORE_GRPC_SERVER",
     )
+    # Channels (separate HTTP/2 connections) RPCs are spread across
+    grpc_channel_pool_size: int = Field(default=4, ge=1)
 
     # ViveEX (Mx) Backend
     backend_base: str = Field(
@@ -86,6 +104,9 @@ class Settings(BaseSettings):
     event_retention_days: int = 30
     image_retention_days: int = 7
 
+    # System status (/system/status) cache TTL for polling dashboards
+    status_cache_ttl_seconds: float = 3.0
+
     # Core Services (gRPC, NATS, Workers)
     # Set to False to disable connections to Core for frontend/backend only testing
     enable_core_services: bool = Field(
@@ -119,6 +140,11 @@ class Settings(BaseSettings):
         alias="MEDIAMTX_ENABLED",
         description="Enable MediaMTX integration for camera streaming",
     )
+    mediamtx_paths_cache_ttl: float = Field(
+        default=0.5,
+        alias="MEDIAMTX_PATHS_CACHE_TTL",
+        description="Seconds to reuse a MediaMTX paths/list response",
+    )
 
     @field_validator("core_grpc_server", mode="before")
     @classmethod
@@ -136,6 +162,7 @@ class DxConfig:
 
     def __init__(self, config_path: str | None = None):
         self._config: dict[str, Any] = {}
+        self._set_ports()
         if config_path:
             self.load(config_path)
 
@@ -143,37 +170,31 @@ class DxConfig:
         """Load configuration from YAML file."""
         path = Path(config_path)
         if path.exists():
-            with open(path) as f:
-                self._config = yaml.safe_load(f) or {}
+            with open(path, "rb") as f:
+                self._config = yaml.load(f, Loader=YamlLoader) or {}
+            self._set_ports()
+
+    def _set_ports(self) -> None:
+        """Resolve the port keys from dx.cfg once, with their defaults."""
+        self.api_port: int = int(self._config.get("port_api", 8400))
+        self.nats_port: int = int(self._config.get("port_nats", 4422))
+        self.launcher_port: int = int(self._config.get("port_launcher", 8500))
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value by key."""
         return self._config.get(key, default)
 
-    @property
-    def api_port(self) -> int:
-        """Get API port from dx.cfg."""
-        return self._config.get("port_api", 8400)
-
-    @property
-    def nats_port(self) -> int:
-        """Get NATS port from dx.cfg."""
-        return self._config.get("port_nats", 4422)
 
-    @property
-    def launcher_port(self) -> int:
-        """Get launcher port from dx.cfg."""
-        return self._config.get("port_launcher", 8500)
+# Module-level singletons, built once at import
+settings = Settings()
+dx_config = DxConfig(settings.dx_cfg_path)
 
 
-@lru_cache
 def get_settings() -> Settings:
-    """Get cached settings instance."""
-    return Settings()
+    """Get the settings instance."""
+    return settings
 
 
-@lru_cache
 def get_dx_config() -> DxConfig:
-    """Get cached DX config instance."""
-    settings = get_settings()
-    return DxConfig(settings.dx_cfg_path)
+    """Get the DX config instance."""
+    return dx_config
@@ -1,12 +1,13 @@
 """FastAPI dependencies for dependency injection."""
 
+import time
 from typing import Annotated, AsyncGenerator
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import decode_access_token
+from app.core.security import cache_token_entry, decode_access_token, token_cache_key
 from app.db.session import async_session_maker
 from app.models.user import User
 from app.services.user_service import UserService
@@ -14,6 +15,21 @@ from app.services.user_service import UserService
 # Security scheme
 security = HTTPBearer(auto_error=False)
 
+# Token -> User cache so bursty polling doesn't hit the DB for every request.
+# Entries never outlive the token's own exp claim.
+_USER_CACHE_TTL = 30.0  # seconds
+_USER_CACHE_MAX_SIZE = 4096
+_user_cache: dict[bytes, tuple[float, User]] = {}
+
+
+def invalidate_user_cache(user_id: str | None = None) -> None:
+    """Drop cached users (all, or only entries for user_id) after a user write."""
+    if user_id is None:
+        _user_cache.clear()
+        return
+    for key in [k for k, (_, user) in _user_cache.items() if user.id == user_id]:
+        del _user_cache[key]
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Get database session."""
@@ -33,6 +49,12 @@ async def get_current_user(
         return None
 
     token = credentials.credentials
+    cache_key = token_cache_key(token)
+
+    cached = _user_cache.get(cache_key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
     payload = decode_access_token(token)
 
     if not payload:
@@ -44,6 +66,10 @@ async def get_current_user(
 
     user_service = UserService(db)
     user = await user_service.get_by_id(user_id)
+    if user:
+        cache_token_entry(
+            _user_cache, _USER_CACHE_MAX_SIZE, cache_key, user, _USER_CACHE_TTL, payload.get("exp")
+        )
     return user
 
 
@@ -60,7 +86,21 @@ async def get_current_user_required(
     return user
 
 
+async def get_streaming_user_required(
+    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
+) -> User:
+    """Require authenticated user for a long-lived streaming response.
+
+    A request-scoped get_db is only torn down after the response body ends,
+    holding a pooled connection for the whole stream; this session is closed
+    as soon as the handler returns.
+    """
+    return await get_current_user_required(await get_current_user(credentials, db))
+
+
 # Type aliases for cleaner dependency injection
 DBSession = Annotated[AsyncSession, Depends(get_db)]
 CurrentUser = Annotated[User | None, Depends(get_current_user)]
 CurrentUserRequired = Annotated[User, Depends(get_current_user_required)]
+StreamingUserRequired = Annotated[User, Depends(get_streaming_user_required)]
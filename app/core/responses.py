@@ -0,0 +1,48 @@
+"""Response helpers for pre-serialized JSON payloads."""
+
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response, status
+from pydantic import TypeAdapter
+
+
+def json_response(adapter: TypeAdapter, content: Any) -> Response:
+    """Serialize content straight to JSON bytes with a pydantic TypeAdapter.
+
+    Returning a Response skips FastAPI's response_model re-validation and
+    jsonable_encoder pass; keep response_model on the route for OpenAPI docs.
+    """
+    return Response(
+        content=adapter.dump_json(content, by_alias=True),
+        media_type="application/json",
+    )
+
+
+def etag_json_response(
+    request: Request,
+    adapter: TypeAdapter,
+    content: Any,
+    max_age: int = 3,
+    etag_content: Any = None,
+) -> Response:
+    """Like json_response, plus a content-hash ETag and short private caching.
+
+    Answers 304 Not Modified when If-None-Match already carries the ETag, so
+    polling clients skip the body entirely. When etag_content is given it is
+    hashed instead of content (leaving out fields that change on every call)
+    and the ETag is marked weak.
+    """
+    body = adapter.dump_json(content, by_alias=True)
+    hashed = body if etag_content is None else adapter.dump_json(etag_content, by_alias=True)
+    tag = f'"{hashlib.blake2b(hashed, digest_size=8).hexdigest()}"'
+    etag = tag if etag_content is None else f"W/{tag}"
+    headers = {"ETag": etag, "Cache-Control": f"private, max-age={max_age}"}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if tag in candidates or "*" in candidates:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -1,35 +1,102 @@
 """Security utilities for authentication and authorization."""
 
+import base64
+import binascii
 import hashlib
+import hmac
+import json
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import bcrypt
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
 
 from app.core.config import get_settings
 
 settings = get_settings()
 
+_bcrypt_rounds = settings.bcrypt_rounds
+
+# JWT settings snapshotted once; settings are not reloaded at runtime
+_jwt_secret = settings.jwt_secret_key
+_jwt_algorithm = settings.jwt_algorithm
+_jwt_issuer = settings.jwt_issuer
+_jwt_audience = settings.jwt_audience
+_jwt_expire_delta = timedelta(minutes=settings.jwt_access_token_expire_minutes)
+# Signing key parsed once instead of by jose on every encode/decode
+_jwt_key = jwk.construct(_jwt_secret, _jwt_algorithm)
+# Precomputed once for the HS256 fast path in decode_access_token
+_jwt_secret_bytes = _jwt_secret.encode()
+
+# Verified token -> claims cache; repeat requests with the same bearer token
+# skip signature and claim checks. Entries never outlive the token's exp.
+_TOKEN_CACHE_TTL = 60.0  # seconds
+_TOKEN_CACHE_MAX_SIZE = 4096
+_token_cache: dict[bytes, tuple[float, dict[str, Any]]] = {}
+
+
+def token_cache_key(token: str) -> bytes:
+    """Get the cache key for a bearer token (a digest, not the token itself)."""
+    return hashlib.sha256(token.encode()).digest()[:16]
+
+
+def cache_token_entry(
+    cache: dict[bytes, tuple[float, Any]],
+    max_size: int,
+    key: bytes,
+    value: Any,
+    ttl: float,
+    token_exp: float | None,
+) -> None:
+    """Store a per-token cache entry, evicting expired (then oldest) entries when full.
+
+    The entry never outlives the token's own exp claim.
+    """
+    now = time.monotonic()
+    if len(cache) >= max_size:
+        for stale in [k for k, (expires, _) in cache.items() if expires <= now]:
+            del cache[stale]
+        if len(cache) >= max_size:
+            del cache[next(iter(cache))]
+
+    expires = now + ttl
+    if token_exp is not None:
+        expires = min(expires, now + (float(token_exp) - time.time()))
+    cache[key] = (expires, value)
+
+
+def _verify_bcrypt(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its bcrypt hash."""
+    # bcrypt has a 72 byte limit, truncate if needed
+    truncated = plain_password.encode("utf-8")[:72]
+    try:
+        return bcrypt.checkpw(truncated, hashed_password.encode("utf-8"))
+    except ValueError:  # not a bcrypt hash (e.g. $plain$ when disallowed)
+        return False
+
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash."""
-    # Support test hash format with $plain$ prefix
+def _verify_plain_or_bcrypt(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password, also accepting the $plain$<sha256> test hash format."""
     if hashed_password.startswith("$plain$"):
         expected_hash = hashed_password[7:]  # Remove $plain$ prefix
         actual_hash = hashlib.sha256(plain_password.encode()).hexdigest()
-        return expected_hash == actual_hash
+        # Constant-time compare so the match length doesn't leak via timing
+        return hmac.compare_digest(expected_hash.encode(), actual_hash.encode())
+    return _verify_bcrypt(plain_password, hashed_password)
 
-    # bcrypt has a 72 byte limit, truncate if needed
-    truncated = plain_password[:72].encode("utf-8")
-    return bcrypt.checkpw(truncated, hashed_password.encode("utf-8"))
+
+# Chosen once at import: production verifies bcrypt only, with no test branch
+verify_password = (
+    _verify_plain_or_bcrypt if settings.allow_plain_hash else _verify_bcrypt
+)
 
 
-def get_password_hash(password: str) -> str:
-    """Generate password hash."""
+def get_password_hash(password: str, rounds: int | None = None) -> str:
+    """Generate password hash (bcrypt cost defaults to settings.bcrypt_rounds)."""
     # bcrypt has a 72 byte limit, truncate if needed
-    truncated = password[:72].encode("utf-8")
-    salt = bcrypt.gensalt(rounds=12)
+    truncated = password.encode("utf-8")[:72]
+    salt = bcrypt.gensalt(rounds=rounds or _bcrypt_rounds)
     return bcrypt.hashpw(truncated, salt).decode("utf-8")
 
 
@@ -40,48 +107,134 @@ def create_access_token(
     """Create JWT access token."""
     to_encode = data.copy()
 
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            minutes=settings.jwt_access_token_expire_minutes
-        )
+    expire = datetime.now(timezone.utc) + (expires_delta or _jwt_expire_delta)
 
     to_encode.update({
         "exp": expire,
-        "iss": settings.jwt_issuer,
-        "aud": settings.jwt_audience,
+        "iss": _jwt_issuer,
+        "aud": _jwt_audience,
     })
 
     return jwt.encode(
         to_encode,
-        settings.jwt_secret_key,
-        algorithm=settings.jwt_algorithm,
+        _jwt_key,
+        algorithm=_jwt_algorithm,
     )
 
 
-def decode_access_token(token: str) -> dict[str, Any] | None:
-    """Decode and validate JWT access token."""
+def _b64url_decode(segment: str) -> bytes:
+    """Decode an unpadded base64url JWT segment."""
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _decode_hs256(token: str, verify_claims: bool = True) -> dict[str, Any] | None:
+    """Verify and decode an HS256 token with hmac/hashlib directly.
+
+    Applies the same checks as jose's jwt.decode for our tokens: header alg,
+    signature, nbf and, with verify_claims, a required exp plus iss and aud.
+    """
+    try:
+        signing_input, _, signature = token.rpartition(".")
+        header_segment, _, payload_segment = signing_input.partition(".")
+        if not header_segment or not payload_segment:
+            return None
+
+        header = json.loads(_b64url_decode(header_segment))
+        if not isinstance(header, dict) or header.get("alg") != "HS256":
+            return None
+
+        expected = hmac.new(
+            _jwt_secret_bytes, signing_input.encode(), hashlib.sha256
+        ).digest()
+        if not hmac.compare_digest(expected, _b64url_decode(signature)):
+            return None
+
+        payload = json.loads(_b64url_decode(payload_segment))
+    except (binascii.Error, ValueError, UnicodeError, RecursionError):
+        # RecursionError: deeply nested JSON in an unverified header segment
+        return None
+
+    if not isinstance(payload, dict):
+        return None
+
+    now = time.time()
+    nbf = payload.get("nbf")
+    if nbf is not None and (not isinstance(nbf, (int, float)) or nbf > now):
+        return None
+
+    if not verify_claims:
+        return payload
+
+    exp = payload.get("exp")
+    if not isinstance(exp, (int, float)) or exp < now:
+        return None
+
+    if payload.get("iss") != _jwt_issuer:
+        return None
+
+    aud = payload.get("aud")
+    if isinstance(aud, str):
+        aud = [aud]
+    if not isinstance(aud, list) or _jwt_audience not in aud:
+        return None
+
+    return payload
+
+
+def _verify_access_token(token: str) -> dict[str, Any] | None:
+    """Verify a JWT access token and return its claims (uncached)."""
+    # Hot path for every authenticated request: skip jose's per-call key parsing
+    if _jwt_algorithm == "HS256":
+        return _decode_hs256(token)
+
     try:
         payload = jwt.decode(
             token,
-            settings.jwt_secret_key,
-            algorithms=[settings.jwt_algorithm],
-            audience=settings.jwt_audience,
-            issuer=settings.jwt_issuer,
+            _jwt_key,
+            algorithms=[_jwt_algorithm],
+            audience=_jwt_audience,
+            issuer=_jwt_issuer,
+            options={"require_exp": True},
         )
         return payload
     except JWTError:
         return None
 
 
+def decode_access_token(token: str) -> dict[str, Any] | None:
+    """Decode and validate JWT access token (exp, iss and aud required).
+
+    This is the single verified decode per request; use its payload rather
+    than decoding the same token again with get_token_data. Valid tokens are
+    cached briefly, so the returned claims must not be mutated.
+    """
+    key = token_cache_key(token)
+    cached = _token_cache.get(key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
+    payload = _verify_access_token(token)
+    if payload is not None:
+        cache_token_entry(
+            _token_cache, _TOKEN_CACHE_MAX_SIZE, key, payload, _TOKEN_CACHE_TTL, payload["exp"]
+        )
+    return payload
+
+
 def get_token_data(token: str) -> dict[str, Any] | None:
-    """Extract data from JWT token without full validation."""
+    """Extract data from JWT token without full validation.
+
+    Only the signature is checked (exp, iss and aud are not); prefer
+    decode_access_token unless the claims are needed from an expired token.
+    """
+    if _jwt_algorithm == "HS256":
+        return _decode_hs256(token, verify_claims=False)
+
     try:
         payload = jwt.decode(
             token,
-            settings.jwt_secret_key,
-            algorithms=[settings.jwt_algorithm],
+            _jwt_key,
+            algorithms=[_jwt_algorithm],
             options={"verify_exp": False, "verify_aud": False, "verify_iss": False},
         )
         return payload
@@ -1,9 +1,47 @@
 """Database base model."""
 
+from typing import Any
+
+from pydantic_core import from_json, to_json
 from sqlalchemy.orm import DeclarativeBase
 
 
 class Base(DeclarativeBase):
     """Base class for all database models."""
 
-    pass
+    def _cached_json(self, column: str) -> Any:
+        """Parse a JSON text column, reusing the result while it is unchanged.
+
+        The parsed value is cached per instance against the exact string it
+        came from, so reassigning the column (by setter or directly) is picked
+        up on the next call. Callers must not mutate the returned value.
+        Raises ValueError on invalid JSON.
+        """
+        raw = getattr(self, column)
+        cache = self.__dict__.setdefault("_json_cache", {})
+        hit = cache.get(column)
+        if hit is not None and hit[0] is raw:
+            return hit[1]
+
+        value = from_json(raw)
+        cache[column] = (raw, value)
+        return value
+
+    def _store_json(self, column: str, value: Any) -> None:
+        """Serialize a value into a JSON text column (None when empty).
+
+        The value itself is cached as the parse of the new string, so a
+        following _cached_json read does no work. Callers must not mutate
+        the value after storing it.
+        """
+        if not value:
+            setattr(self, column, None)
+            return
+
+        raw = to_json(value).decode()
+        setattr(self, column, raw)
+        self._prime_json_cache(column, raw, value)
+
+    def _prime_json_cache(self, column: str, raw: str, value: Any) -> None:
+        """Record value as the parse of raw for later _cached_json reads."""
+        self.__dict__.setdefault("_json_cache", {})[column] = (raw, value)
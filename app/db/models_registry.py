@@ -1,39 +1,49 @@
 """
-Model registry for Alembic migrations.
+Model registry for Alembic migrations and schema creation.
 
-Import all models here to ensure they are registered with SQLAlchemy metadata.
-This file should be imported by alembic/env.py.
+Call register_all() before using Base.metadata for DDL so every model's table
+is registered with SQLAlchemy metadata (alembic/env.py, init_database, seeding).
 """
 
 from app.db.base import Base
-from app.models.camera import Camera
-from app.models.event import Event
-from app.models.mediamtx_settings import MediaMTXSettings
-from app.models.event_setting import EventSetting
-from app.models.eventpush import Eventpush
-from app.models.image import Image
-from app.models.inference import Inference
-from app.models.mx import Mx
-from app.models.protocol import Protocol
-from app.models.registry import Registry
-from app.models.subscription import BaseEventSubscription, Subscription
-from app.models.user import User
-from app.models.video import Video
-
-__all__ = [
-    "Base",
-    "Camera",
-    "Event",
-    "MediaMTXSettings",
-    "EventSetting",
-    "Eventpush",
-    "Image",
-    "Inference",
-    "Mx",
-    "Protocol",
-    "Registry",
-    "BaseEventSubscription",
-    "Subscription",
-    "User",
-    "Video",
-]
+
+
+def register_all() -> tuple[type[Base], ...]:
+    """Import all models so their tables are registered on Base.metadata.
+
+    Safe to call repeatedly (modules are only imported once).
+    Returns the registered model classes.
+    """
+    from app.models.camera import Camera
+    from app.models.event import Event
+    from app.models.mediamtx_settings import MediaMTXSettings
+    from app.models.event_setting import EventSetting
+    from app.models.eventpush import Eventpush
+    from app.models.image import Image
+    from app.models.inference import Inference
+    from app.models.mx import Mx
+    from app.models.protocol import Protocol
+    from app.models.registry import Registry
+    from app.models.subscription import BaseEventSubscription, Subscription
+    from app.models.user import User
+    from app.models.video import Video
+
+    return (
+        Camera,
+        Event,
+        MediaMTXSettings,
+        EventSetting,
+        Eventpush,
+        Image,
+        Inference,
+        Mx,
+        Protocol,
+        Registry,
+        BaseEventSubscription,
+        Subscription,
+        User,
+        Video,
+    )
+
+
+__all__ = ["Base", "register_all"]
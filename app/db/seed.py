@@ -7,10 +7,12 @@ import uuid
 from datetime import datetime, timedelta
 
 from loguru import logger
+from pydantic_core import to_json
+from sqlalchemy import insert, inspect, select, text, tuple_
 
 from app.core.security import get_password_hash
 from app.db.base import Base
-from app.db import models_registry  # noqa: F401 - Import to register models
+from app.db.models_registry import register_all
 from app.db.session import async_session_maker, engine
 from app.models.event import Event
 from app.models.eventpush import Eventpush
@@ -21,9 +23,83 @@ from app.models.registry import Registry
 from app.models.user import User
 from app.models.video import Video
 
+# Mock users only: minimum bcrypt cost keeps seeding fast
+_SEED_BCRYPT_ROUNDS = 4
+
+# Fixture settings JSON, encoded once at import (keyed by video id)
+_VIDEO_SETTINGS = {
+    "video-001": json.dumps({
+        "maskingRegion": [],
+        "detectionPoint": "c:b",
+        "lineCrossPoint": "c:c",
+    }),
+    "video-002": json.dumps({
+        "maskingRegion": [[[0.1, 0.1], [0.9, 0.1], [0.9, 0.9], [0.1, 0.9]]],
+        "detectionPoint": "c:b",
+        "lineCrossPoint": "c:c",
+    }),
+    "video-003": json.dumps({
+        "maskingRegion": [],
+        "detectionPoint": "c:c",
+        "lineCrossPoint": "c:c",
+    }),
+    "video-004": json.dumps({
+        "maskingRegion": [],
+        "detectionPoint": "c:b",
+        "lineCrossPoint": "c:b",
+    }),
+    "video-005": json.dumps({
+        "maskingRegion": [],
+        "detectionPoint": "c:b",
+        "lineCrossPoint": "c:c",
+    }),
+}
+
+# Fixture inference settings JSON, encoded once at import (keyed by video id)
+_INFERENCE_SETTINGS = {
+    "video-001": json.dumps({
+        "version": "1.6.1",
+        "configs": [
+            {
+                "eventType": "intrusion",
+                "eventSettingId": "event-001",
+                "eventSettingName": "Intrusion Zone A",
+                "points": [[0.2, 0.2], [0.8, 0.2], [0.8, 0.8], [0.2, 0.8]],
+                "target": {"labels": ["person"], "classifiers": {}},
+            }
+        ],
+    }),
+    "video-002": json.dumps({
+        "version": "1.6.1",
+        "configs": [
+            {
+                "eventType": "counting",
+                "eventSettingId": "event-002",
+                "eventSettingName": "Vehicle Count",
+                "points": [[0.1, 0.5], [0.9, 0.5]],
+                "target": {"labels": ["car", "truck", "bus"], "classifiers": {}},
+            }
+        ],
+    }),
+    "video-003": json.dumps({
+        "version": "1.6.1",
+        "configs": [
+            {
+                "eventType": "loitering",
+                "eventSettingId": "event-003",
+                "eventSettingName": "Loitering Detection",
+                "points": [[0.3, 0.3], [0.7, 0.3], [0.7, 0.7], [0.3, 0.7]],
+                "target": {"labels": ["person"], "classifiers": {}},
+                "timeout": 30,
+            }
+        ],
+    }),
+}
+
 
 async def create_tables():
     """Create all tables."""
+    register_all()
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     logger.info("Tables created")
@@ -31,35 +107,47 @@ async def create_tables():
 
 async def seed_users():
     """Seed users."""
+    # bcrypt releases the GIL, so the three hashes run in parallel threads
+    admin_hash, operator_hash, viewer_hash = await asyncio.gather(
+        *(
+            asyncio.to_thread(get_password_hash, password, rounds=_SEED_BCRYPT_ROUNDS)
+            for password in ("admin", "operator123", "viewer123")
+        )
+    )
     users = [
         User(
             id="admin",
             username="admin",
-            hashed_password=get_password_hash("admin"),
+            hashed_password=admin_hash,
             is_active=True,
             is_superuser=True,
         ),
         User(
             id="user1",
             username="operator",
-            hashed_password=get_password_hash("operator123"),
+            hashed_password=operator_hash,
             is_active=True,
             is_superuser=False,
         ),
         User(
             id="user2",
             username="viewer",
-            hashed_password=get_password_hash("viewer123"),
+            hashed_password=viewer_hash,
             is_active=True,
             is_superuser=False,
         ),
     ]
 
     async with async_session_maker() as db:
-        for user in users:
-            existing = await db.get(User, user.id)
-            if not existing:
-                db.add(user)
+        # One round-trip for all existing ids instead of a get() per row
+        existing_ids = set(
+            (
+                await db.execute(
+                    select(User.id).where(User.id.in_([u.id for u in users]))
+                )
+            ).scalars()
+        )
+        db.add_all([u for u in users if u.id not in existing_ids])
         await db.commit()
     logger.info(f"Seeded {len(users)} users")
 
@@ -73,11 +161,7 @@ async def seed_videos():
             name="Main Entrance",
             device_id="cam-001",
             server_id="server-001",
-            settings=json.dumps({
-                "maskingRegion": [],
-                "detectionPoint": "c:b",
-                "lineCrossPoint": "c:c",
-            }),
+            settings=_VIDEO_SETTINGS["video-001"],
         ),
         Video(
             id="video-002",
@@ -85,11 +169,7 @@ async def seed_videos():
             name="Parking Lot A",
             device_id="cam-002",
             server_id="server-001",
-            settings=json.dumps({
-                "maskingRegion": [[[0.1, 0.1], [0.9, 0.1], [0.9, 0.9], [0.1, 0.9]]],
-                "detectionPoint": "c:b",
-                "lineCrossPoint": "c:c",
-            }),
+            settings=_VIDEO_SETTINGS["video-002"],
         ),
         Video(
             id="video-003",
@@ -97,11 +177,7 @@ async def seed_videos():
             name="Loading Dock",
             device_id="cam-003",
             server_id="server-001",
-            settings=json.dumps({
-                "maskingRegion": [],
-                "detectionPoint": "c:c",
-                "lineCrossPoint": "c:c",
-            }),
+            settings=_VIDEO_SETTINGS["video-003"],
         ),
         Video(
             id="video-004",
@@ -109,11 +185,7 @@ async def seed_videos():
             name="Warehouse Interior",
             device_id="cam-004",
             server_id="server-002",
-            settings=json.dumps({
-                "maskingRegion": [],
-                "detectionPoint": "c:b",
-                "lineCrossPoint": "c:b",
-            }),
+            settings=_VIDEO_SETTINGS["video-004"],
         ),
         Video(
             id="video-005",
@@ -121,19 +193,19 @@ async def seed_videos():
             name="Back Gate",
             device_id="cam-005",
             server_id="server-002",
-            settings=json.dumps({
-                "maskingRegion": [],
-                "detectionPoint": "c:b",
-                "lineCrossPoint": "c:c",
-            }),
+            settings=_VIDEO_SETTINGS["video-005"],
         ),
     ]
 
     async with async_session_maker() as db:
-        for video in videos:
-            existing = await db.get(Video, video.id)
-            if not existing:
-                db.add(video)
+        existing_ids = set(
+            (
+                await db.execute(
+                    select(Video.id).where(Video.id.in_([v.id for v in videos]))
+                )
+            ).scalars()
+        )
+        db.add_all([v for v in videos if v.id not in existing_ids])
         await db.commit()
     logger.info(f"Seeded {len(videos)} videos")
 
@@ -147,18 +219,7 @@ async def seed_inferences():
             uri="http://localhost:8080/v1/inference",
             name="Person Detection - Main Entrance",
             type="detection",
-            settings=json.dumps({
-                "version": "1.6.1",
-                "configs": [
-                    {
-                        "eventType": "intrusion",
-                        "eventSettingId": "event-001",
-                        "eventSettingName": "Intrusion Zone A",
-                        "points": [[0.2, 0.2], [0.8, 0.2], [0.8, 0.8], [0.2, 0.8]],
-                        "target": {"labels": ["person"], "classifiers": {}},
-                    }
-                ],
-            }),
+            settings=_INFERENCE_SETTINGS["video-001"],
         ),
         Inference(
             app_id="app-vehicle-detection",
@@ -166,18 +227,7 @@ async def seed_inferences():
             uri="http://localhost:8080/v1/inference",
             name="Vehicle Detection - Parking",
             type="detection",
-            settings=json.dumps({
-                "version": "1.6.1",
-                "configs": [
-                    {
-                        "eventType": "counting",
-                        "eventSettingId": "event-002",
-                        "eventSettingName": "Vehicle Count",
-                        "points": [[0.1, 0.5], [0.9, 0.5]],
-                        "target": {"labels": ["car", "truck", "bus"], "classifiers": {}},
-                    }
-                ],
-            }),
+            settings=_INFERENCE_SETTINGS["video-002"],
         ),
         Inference(
             app_id="app-person-detection",
@@ -185,27 +235,24 @@ async def seed_inferences():
             uri="http://localhost:8080/v1/inference",
             name="Person Detection - Loading Dock",
             type="detection",
-            settings=json.dumps({
-                "version": "1.6.1",
-                "configs": [
-                    {
-                        "eventType": "loitering",
-                        "eventSettingId": "event-003",
-                        "eventSettingName": "Loitering Detection",
-                        "points": [[0.3, 0.3], [0.7, 0.3], [0.7, 0.7], [0.3, 0.7]],
-                        "target": {"labels": ["person"], "classifiers": {}},
-                        "timeout": 30,
-                    }
-                ],
-            }),
+            settings=_INFERENCE_SETTINGS["video-003"],
         ),
     ]
 
     async with async_session_maker() as db:
-        for inf in inferences:
-            existing = await db.get(Inference, (inf.app_id, inf.video_id))
-            if not existing:
-                db.add(inf)
+        # Composite primary key: match (app_id, video_id) pairs as row values
+        keys = [(inf.app_id, inf.video_id) for inf in inferences]
+        existing_keys = set(
+            tuple(row)
+            for row in await db.execute(
+                select(Inference.app_id, Inference.video_id).where(
+                    tuple_(Inference.app_id, Inference.video_id).in_(keys)
+                )
+            )
+        )
+        db.add_all(
+            [inf for inf in inferences if (inf.app_id, inf.video_id) not in existing_keys]
+        )
         await db.commit()
     logger.info(f"Seeded {len(inferences)} inferences")
 
@@ -217,66 +264,81 @@ async def seed_events():
     object_types = ["person", "car", "truck", "bicycle", "motorcycle"]
     event_types = ["intrusion", "counting", "loitering", "line_cross"]
 
-    events = []
+    count = 500
     now = datetime.now()
 
-    # Generate 500 events over the last 7 days
-    for i in range(500):
-        video_idx = random.randint(0, len(video_ids) - 1)
-        obj_type = random.choice(object_types)
-        event_type = random.choice(event_types)
+    # Draw each categorical column in one choices() call, and derive every
+    # string/timestamp that depends only on that choice up front
+    video_idxs = random.choices(range(len(video_ids)), k=count)
+    obj_type_draws = random.choices(object_types, k=count)
+    event_type_draws = random.choices(event_types, k=count)
+    # Random timestamp within last 7 days (whole hours)
+    timestamp_draws = random.choices(
+        [int((now - timedelta(hours=h)).timestamp() * 1000) for h in range(7 * 24 + 1)],
+        k=count,
+    )
+    setting_id_draws = random.choices([f"event-{n:03d}" for n in range(1, 11)], k=count)
+    event_titles = {t: t.replace("_", " ").title() for t in event_types}
+    uniform = random.uniform
+    randint = random.randint
+
+    rows = []
 
-        # Random timestamp within last 7 days
-        random_hours = random.randint(0, 7 * 24)
-        timestamp = int((now - timedelta(hours=random_hours)).timestamp() * 1000)
+    # Generate 500 events over the last 7 days
+    for i in range(count):
+        video_idx = video_idxs[i]
+        obj_type = obj_type_draws[i]
+        event_title = event_titles[event_type_draws[i]]
 
         # Random bbox
-        x = random.uniform(0.1, 0.7)
-        y = random.uniform(0.1, 0.7)
-        w = random.uniform(0.1, 0.3)
-        h = random.uniform(0.1, 0.4)
+        x = uniform(0.1, 0.7)
+        y = uniform(0.1, 0.7)
+        w = uniform(0.1, 0.3)
+        h = uniform(0.1, 0.4)
 
         objects = [
             {
-                "trackId": f"track-{random.randint(1000, 9999)}",
+                "trackId": f"track-{randint(1000, 9999)}",
                 "label": obj_type,
                 "bbox": [x, y, w, h],
-                "score": random.uniform(0.7, 0.99),
+                "score": uniform(0.7, 0.99),
                 "classifiers": [],
             }
         ]
 
         # Sometimes add multiple objects
         if random.random() > 0.7:
-            obj_type2 = random.choice(object_types)
             objects.append({
-                "trackId": f"track-{random.randint(1000, 9999)}",
-                "label": obj_type2,
+                "trackId": f"track-{randint(1000, 9999)}",
+                "label": random.choice(object_types),
                 "bbox": [x + 0.2, y, w, h],
-                "score": random.uniform(0.7, 0.99),
+                "score": uniform(0.7, 0.99),
                 "classifiers": [],
             })
 
-        event = Event(
-            event_setting_id=f"event-{random.randint(1, 10):03d}",
-            event_setting_name=f"{event_type.replace('_', ' ').title()} Zone",
-            video_id=video_ids[video_idx],
-            video_name=video_names[video_idx],
-            app_id=f"app-{obj_type}-detection",
-            timestamp=timestamp,
-            caption=f"{obj_type.title()} detected",
-            desc=f"{event_type.replace('_', ' ').title()} event detected at {video_names[video_idx]}",
-            device_id=f"cam-{video_idx + 1:03d}",
-            vms_id="vms-001",
-            objects=json.dumps(objects),
-            object_type=obj_type,
-        )
-        events.append(event)
-
+        # Plain column dicts: bulk-loaded below without ORM objects
+        rows.append({
+            "event_setting_id": setting_id_draws[i],
+            "event_setting_name": f"{event_title} Zone",
+            "video_id": video_ids[video_idx],
+            "video_name": video_names[video_idx],
+            "app_id": f"app-{obj_type}-detection",
+            "timestamp": timestamp_draws[i],
+            "caption": f"{obj_type.title()} detected",
+            "desc": f"{event_title} event detected at {video_names[video_idx]}",
+            "device_id": f"cam-{video_idx + 1:03d}",
+            "vms_id": "vms-001",
+            # pydantic-core's Rust encoder (compact output, same JSON values)
+            "objects": to_json(objects).decode(),
+            "object_type": obj_type,
+        })
+
+    # One Core executemany INSERT against the table in a single transaction
+    # (no unit of work, identity map or ORM bulk-persistence layer)
     async with async_session_maker() as db:
-        db.add_all(events)
+        await db.execute(insert(Event.__table__), rows)
         await db.commit()
-    logger.info(f"Seeded {len(events)} events")
+    logger.info(f"Seeded {len(rows)} events")
 
 
 async def seed_eventpushes():
@@ -306,8 +368,7 @@ async def seed_eventpushes():
     ]
 
     async with async_session_maker() as db:
-        for ep in eventpushes:
-            db.add(ep)
+        db.add_all(eventpushes)
         await db.commit()
     logger.info(f"Seeded {len(eventpushes)} eventpushes")
 
@@ -332,8 +393,7 @@ async def seed_mx():
     ]
 
     async with async_session_maker() as db:
-        for mx in mx_list:
-            db.add(mx)
+        db.add_all(mx_list)
         await db.commit()
     logger.info(f"Seeded {len(mx_list)} mx configurations")
 
@@ -351,8 +411,7 @@ async def seed_registries():
     ]
 
     async with async_session_maker() as db:
-        for reg in registries:
-            db.add(reg)
+        db.add_all(registries)
         await db.commit()
     logger.info(f"Seeded {len(registries)} registries")
 
@@ -392,8 +451,7 @@ async def seed_protocols():
     ]
 
     async with async_session_maker() as db:
-        for protocol in protocols:
-            db.add(protocol)
+        db.add_all(protocols)
         await db.commit()
     logger.info(f"Seeded {len(protocols)} protocols")
 
@@ -403,24 +461,71 @@ async def seed_all():
     logger.info("Starting database seeding...")
 
     await create_tables()
-    await seed_users()
-    await seed_videos()
-    await seed_inferences()
-    await seed_events()
-    await seed_eventpushes()
-    await seed_mx()
-    await seed_registries()
-    await seed_protocols()
+    # Each seeder uses its own session; only inferences/events refer to videos.
+    # On SQLite the commits still serialize on the write lock.
+    await asyncio.gather(
+        seed_users(),
+        seed_videos(),
+        seed_eventpushes(),
+        seed_mx(),
+        seed_registries(),
+        seed_protocols(),
+    )
+    await asyncio.gather(seed_inferences(), seed_events())
 
     logger.info("Database seeding completed!")
 
 
+def _schema_matches(sync_conn) -> bool:
+    """Whether every model table exists with the columns the models declare.
+
+    Compares column names, types, nullability and primary keys, so a stale
+    database (e.g. events.id left as BIGINT NOT NULL) counts as drifted.
+    """
+    inspector = inspect(sync_conn)
+    existing = set(inspector.get_table_names())
+    dialect = sync_conn.dialect
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing:
+            return False
+        reflected = {
+            col["name"]: (col["type"].compile(dialect=dialect), col["nullable"])
+            for col in inspector.get_columns(table.name)
+        }
+        expected = {
+            col.name: (col.type.compile(dialect=dialect), col.nullable)
+            for col in table.columns
+        }
+        if reflected != expected:
+            return False
+        pk = inspector.get_pk_constraint(table.name)["constrained_columns"]
+        if set(pk) != {col.name for col in table.primary_key}:
+            return False
+    return True
+
+
 async def clear_all():
-    """Clear all data from tables."""
+    """Clear all data from tables (the schema is recreated if it has drifted)."""
+    register_all()
+    tables = Base.metadata.sorted_tables
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-        await conn.run_sync(Base.metadata.create_all)
-    logger.info("All tables cleared and recreated")
+        if not await conn.run_sync(_schema_matches):
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+            logger.info("All tables cleared and recreated")
+            return
+
+        # SQLite has no TRUNCATE: delete children first so foreign keys hold,
+        # all in one transaction with no DDL
+        for table in reversed(tables):
+            await conn.execute(table.delete())
+        if conn.dialect.name == "sqlite":
+            has_sequence = await conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_sequence'")
+            )
+            if has_sequence.first():
+                await conn.execute(text("DELETE FROM sqlite_sequence"))
+    logger.info("All tables cleared")
 
 
 if __name__ == "__main__":
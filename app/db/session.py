@@ -1,6 +1,11 @@
 """Database session configuration."""
 
+import asyncio
+
+from loguru import logger
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import get_settings
 
@@ -11,8 +16,25 @@ engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
     future=True,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    pool_pre_ping=settings.db_pool_pre_ping,
 )
 
+
+def enable_sqlite_foreign_keys(dbapi_connection, connection_record) -> None:
+    """Turn on FOREIGN KEY enforcement (SQLite leaves it off per connection)."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+if engine.dialect.name == "sqlite":
+    event.listen(engine.sync_engine, "connect", enable_sqlite_foreign_keys)
+
 # Create async session maker
 async_session_maker = async_sessionmaker(
     engine,
@@ -26,3 +48,20 @@ async_session_maker = async_sessionmaker(
 async def get_engine():
     """Get database engine."""
     return engine
+
+
+async def warm_up_pool(size: int | None = None) -> None:
+    """Open pool connections up front so first requests don't pay connect cost."""
+    size = size or settings.db_pool_size
+    # Each aiosqlite connect runs on its own thread, so open them together.
+    # Warming is only an optimization: close whatever opened, log failures.
+    results = await asyncio.gather(*(engine.connect() for _ in range(size)), return_exceptions=True)
+    await asyncio.gather(
+        *(conn.close() for conn in results if not isinstance(conn, BaseException)),
+        return_exceptions=True,
+    )
+    failures = [exc for exc in results if isinstance(exc, BaseException)]
+    if failures:
+        logger.warning(
+            f"DB pool warm-up opened {size - len(failures)}/{size} connections: {failures[0]}"
+        )
@@ -1,6 +1,17 @@
 """gRPC client for Core (Detector) communication."""
 
-from app.grpc.detector_client import DetectorClient
+from google.protobuf.internal import api_implementation
+
+# Every Core response is parsed here; the pure-Python runtime is an order of
+# magnitude slower, so refuse to start on it rather than degrade silently
+if api_implementation.Type() not in ("upb", "cpp"):
+    raise ImportError(
+        f"protobuf {api_implementation.Type()!r} backend is active; "
+        "install protobuf>=6.31.1 wheels and unset "
+        "PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=python"
+    )
+
+from app.grpc.detector_client import DetectorClient  # noqa: E402
 
 # Global gRPC client instance (set by main.py on startup)
 _grpc_client: DetectorClient | None = None
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0e\x61utocare.proto\x12\x08\x61utocare\"\x07\n\x05\x45mpty\"\x1d\n\x0bPipelineReq\x12\x0e\n\x06\x61pp_id\x18\x01 \x01(\t\"\x1d\n\x0bPipelineRes\x12\x0e\n\x06result\x18\x01 \x01(\x08\"\x9e\x01\n\x0cInferenceReq\x12\x0e\n\x06\x61pp_id\x18\x01 \x01(\t\x12\x16\n\tstream_id\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x10\n\x03uri\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x15\n\x08settings\x18\x04 \x01(\tH\x02\x88\x01\x01\x12\x11\n\x04name\x18\x05 \x01(\tH\x03\x88\x01\x01\x42\x0c\n\n_stream_idB\x06\n\x04_uriB\x0b\n\t_settingsB\x07\n\x05_name\"\xf7\x01\n\x0cInferenceRes\x12\r\n\x05\x63ount\x18\x01 \x01(\x05\x12\x13\n\x06status\x18\x02 \x01(\x05H\x00\x88\x01\x01\x12\x10\n\x03\x65os\x18\x03 \x01(\x08H\x01\x88\x01\x01\x12\x10\n\x03\x65rr\x18\x04 \x01(\x08H\x02\x88\x01\x01\x12\x11\n\x04meta\x18\x05 \x01(\tH\x03\x88\x01\x01\x12\x15\n\x08snapshot\x18\x06 \x01(\x0cH\x04\x88\x01\x01\x12\x13\n\x06\x61pp_id\x18\x07 \x01(\tH\x05\x88\x01\x01\x12\x16\n\tstream_id\x18\x08 \x01(\tH\x06\x88\x01\x01\x42\t\n\x07_statusB\x06\n\x04_eosB\x06\n\x04_errB\x07\n\x05_metaB\x0b\n\t_snapshotB\t\n\x07_app_idB\x0c\n\n_stream_id\"F\n\x06\x41ppReq\x12\x13\n\x06\x61pp_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x12\n\x05\x63hunk\x18\x02 \x01(\x0cH\x01\x88\x01\x01\x42\t\n\x07_app_idB\x08\n\x06_chunk\"\x18\n\x06\x41ppRes\x12\x0e\n\x06result\x18\x01 \x01(\x08\"%\n\x07\x41ppList\x12\x1a\n\x03\x61pp\x18\x01 \x03(\x0b\x32\r.autocare.App\":\n\rInferenceList\x12)\n\tinference\x18\x01 \x03(\x0b\x32\x16.autocare.InferenceReq\"=\n\x10InferenceResList\x12)\n\tinference\x18\x01 \x03(\x0b\x32\x16.autocare.InferenceRes\"H\n\x06LicReq\x12\x10\n\x03key\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x16\n\thash_code\x18\x02 \x01(\tH\x01\x88\x01\x01\x42\x06\n\x04_keyB\x0c\n\n_hash_code\">\n\x06LicRes\x12\x0e\n\x06result\x18\x01 \x01(\x08\x12\x16\n\thash_code\x18\x02 \x01(\tH\x00\x88\x01\x01\x42\x0c\n\n_hash_code\"P\n\x0cStreamingReq\x12\x10\n\x03uri\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x17\n\nsession_id\x18\x02 \x01(\tH\x01\x88\x01\x01\x42\x06\n\x04_uriB\r\n\x0b_session_id\"~\n\x0cStreamingRes\x12\x15\n\x08location\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x15\n\x08ts_start\x18\x02 \x01(\x03H\x01\x88\x01\x01\x12\x17\n\nsession_id\x18\x03 \x01(\tH\x02\x88\x01\x01\x42\x0b\n\t_locationB\x0b\n\t_ts_startB\r\n\x0b_session_id\"\xd4\x01\n\x05Model\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0f\n\x07version\x18\x03 \x01(\t\x12\x10\n\x08platform\x18\x04 \x01(\t\x12\x11\n\tframework\x18\x05 \x01(\t\x12\x10\n\x08\x63\x61pacity\x18\x06 \x01(\x05\x12\x11\n\tprecision\x18\x07 \x01(\t\x12\x0c\n\x04\x64\x65sc\x18\x08 \x01(\t\x12\x0c\n\x04path\x18\t \x01(\t\x12\x14\n\x0c\x63ompute_capa\x18\n \x01(\t\x12\x16\n\tref_count\x18\x0b \x01(\x05H\x00\x88\x01\x01\x42\x0c\n\n_ref_count\"\x9d\x01\n\x05\x45vent\x12\x13\n\x0b\x63\x61tegory_id\x18\x01 \x01(\t\x12\x15\n\rcategory_name\x18\x02 \x01(\t\x12\'\n\x07targets\x18\x03 \x03(\x0b\x32\x16.autocare.Event.Target\x1a?\n\x06Target\x12\x12\n\nevent_name\x18\x01 \x01(\t\x12\x10\n\x08\x65vent_id\x18\x02 \x01(\t\x12\x0f\n\x07\x63lasses\x18\x03 \x03(\t\"]\n\x08Pipeline\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0e\n\x06plugin\x18\x02 \x01(\t\x12\x15\n\x08model_id\x18\x03 \x01(\tH\x00\x88\x01\x01\x12\x0f\n\x07\x63lasses\x18\x04 \x03(\tB\x0b\n\t_model_id\"\xe7\x02\n\x03\x41pp\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x17\n\nevgen_path\x18\x03 \x01(\tH\x00\x88\x01\x01\x12\x1f\n\x06models\x18\x04 \x03(\x0b\x32\x0f.autocare.Model\x12\x13\n\x06\x65vents\x18\x05 \x01(\tH\x01\x88\x01\x01\x12\x11\n\tpipelines\x18\x06 \x01(\t\x12\x17\n\ncover_path\x18\x07 \x01(\tH\x02\x88\x01\x01\x12\x0c\n\x04\x64\x65sc\x18\x08 \x01(\t\x12\x19\n\x0cmemory_usage\x18\t \x01(\x05H\x03\x88\x01\x01\x12\x14\n\x07version\x18\n \x01(\tH\x04\x88\x01\x01\x12\x16\n\tframework\x18\x0b \x01(\tH\x05\x88\x01\x01\x12\x14\n\x07outputs\x18\x0c \x01(\tH\x06\x88\x01\x01\x42\r\n\x0b_evgen_pathB\t\n\x07_eventsB\r\n\x0b_cover_pathB\x0f\n\r_memory_usageB\n\n\x08_versionB\x0c\n\n_frameworkB\n\n\x08_outputs\"G\n\tInference\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0e\n\x06\x61pp_id\x18\x02 \x01(\t\x12\x11\n\tstream_id\x18\x03 \x01(\t\x12\x0b\n\x03uri\x18\x04 \x01(\t\"\xb1\x01\n\x02\x44x\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x03 \x01(\t\x12\x10\n\x08\x63\x61pacity\x18\x04 \x01(\x05\x12\x11\n\tactivated\x18\x05 \x01(\x05\x12\x0f\n\x07version\x18\x06 \x01(\t\x12\x11\n\tframework\x18\x07 \x01(\t\x12\x10\n\x08lic_type\x18\x08 \x01(\t\x12\x14\n\x0clic_end_date\x18\t \x01(\t\x12\x0f\n\x07lic_key\x18\n \x01(\t2\xb6\x08\n\x08\x44\x65tector\x12@\n\x0c\x41\x64\x64Inference\x12\x16.autocare.InferenceReq\x1a\x16.autocare.InferenceRes\"\x00\x12\x43\n\x0fRemoveInference\x12\x16.autocare.InferenceReq\x1a\x16.autocare.InferenceRes\"\x00\x12:\n\x12RemoveInferenceAll\x12\x10.autocare.AppReq\x1a\x10.autocare.AppRes\"\x00\x12\x43\n\x0fUpdateInference\x12\x16.autocare.InferenceReq\x1a\x16.autocare.InferenceRes\"\x00\x12\x34\n\nInstallApp\x12\x10.autocare.AppReq\x1a\x10.autocare.AppRes\"\x00(\x01\x12\x34\n\x0cUninstallApp\x12\x10.autocare.AppReq\x1a\x10.autocare.AppRes\"\x00\x12\x33\n\nGetAppList\x12\x10.autocare.AppReq\x1a\x11.autocare.AppList\"\x00\x12\x45\n\x10GetInferenceList\x12\x16.autocare.InferenceReq\x1a\x17.autocare.InferenceList\"\x00\x12\x46\n\x12GetInferenceStatus\x12\x16.autocare.InferenceReq\x1a\x16.autocare.InferenceRes\"\x00\x12G\n\x15GetInferenceStatusAll\x12\x10.autocare.AppReq\x1a\x1a.autocare.InferenceResList\"\x00\x12G\n\x13RequestPreviewImage\x12\x16.autocare.InferenceReq\x1a\x16.autocare.InferenceRes\"\x00\x12\x39\n\x11LicenseActivation\x12\x10.autocare.LicReq\x1a\x10.autocare.LicRes\"\x00\x12;\n\x13LicenseDeactivation\x12\x10.autocare.LicReq\x1a\x10.autocare.LicRes\"\x00\x12\x37\n\x0fLicenseActivate\x12\x10.autocare.LicReq\x1a\x10.autocare.LicRes\"\x00\x12\x42\n\x0eStartStreaming\x12\x16.autocare.StreamingReq\x1a\x16.autocare.StreamingRes\"\x00\x12\x41\n\rStopStreaming\x12\x16.autocare.StreamingReq\x1a\x16.autocare.StreamingRes\"\x00\x12(\n\x05GetDx\x12\x0f.autocare.Empty\x1a\x0c.autocare.Dx\"\x00\x42\x0f\xaa\x02\x0cGrpcDxClientb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0e\x61utocare.proto\x12\x08\x61utocare\"\x07\n\x05\x45mpty\"\x1d\n\x0bPipelineReq\x12\x0e\n\x06\x61pp_id\x18\x01 \x01(\t\"\x1d\n\x0bPipelineRes\x12\x0e\n\x06result\x18\x01 \x01(\x08\"^\n\x0cInferenceReq\x12\x0e\n\x06\x61pp_id\x18\x01 \x01(\t\x12\x11\n\tstream_id\x18\x02 \x01(\t\x12\x0b\n\x03uri\x18\x03 \x01(\t\x12\x10\n\x08settings\x18\x04 \x01(\t\x12\x0c\n\x04name\x18\x05 \x01(\t\"\xba\x01\n\x0cInferenceRes\x12\r\n\x05\x63ount\x18\x01 \x01(\x05\x12\x0e\n\x06status\x18\x02 \x01(\x05\x12\x0b\n\x03\x65os\x18\x03 \x01(\x08\x12\x0b\n\x03\x65rr\x18\x04 \x01(\x08\x12\x11\n\x04meta\x18\x05 \x01(\tH\x00\x88\x01\x01\x12\x15\n\x08snapshot\x18\x06 \x01(\x0cH\x01\x88\x01\x01\x12\x13\n\x06\x61pp_id\x18\x07 \x01(\tH\x02\x88\x01\x01\x12\x11\n\tstream_id\x18\x08 \x01(\tB\x07\n\x05_metaB\x0b\n\t_snapshotB\t\n\x07_app_id\"F\n\x06\x41ppReq\x12\x13\n\x06\x61pp_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x12\n\x05\x63hunk\x18\x02 \x01(\x0cH\x01\x88\x01\x01\x42\t\n\x07_app_idB\x08\n\x06_chunk\"\x18\n\x06\x41ppRes\x12\x0e\n\x06result\x18\x01 \x01(\x08\"%\n\x07\x41ppList\x12\x1a\n\x03\x61pp\x18\x01 \x03(\x0b\x32\r.autocare.App\":\n\rInferenceList\x12)\n\tinference\x18\x01 \x03(\x0b\x32\x16.autocare.InferenceReq\"=\n\x10InferenceResList\x12)\n\tinference\x18\x01 \x03(\x0b\x32\x16.autocare.InferenceRes\"H\n\x06LicReq\x12\x10\n\x03key\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x16\n\thash_code\x18\x02 \x01(\tH\x01\x88\x01\x01\x42\x06\n\x04_keyB\x0c\n\n_hash_code\">\n\x06LicRes\x12\x0e\n\x06result\x18\x01 \x01(\x08\x12\x16\n\thash_code\x18\x02 \x01(\tH\x00\x88\x01\x01\x42\x0c\n\n_hash_code\"P\n\x0cStreamingReq\x12\x10\n\x03uri\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x17\n\nsession_id\x18\x02 \x01(\tH\x01\x88\x01\x01\x42\x06\n\x04_uriB\r\n\x0b_session_id\"~\n\x0cStreamingRes\x12\x15\n\x08location\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x15\n\x08ts_start\x18\x02 \x01(\x03H\x01\x88\x01\x01\x12\x17\n\nsession_id\x18\x03 \x01(\tH\x02\x88\x01\x01\x42\x0b\n\t_locationB\x0b\n\t_ts_startB\r\n\x0b_session_id\"\xd4\x01\n\x05Model\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0f\n\x07version\x18\x03 \x01(\t\x12\x10\n\x08platform\x18\x04 \x01(\t\x12\x11\n\tframework\x18\x05 \x01(\t\x12\x10\n\x08\x63\x61pacity\x18\x06 \x01(\x05\x12\x11\n\tprecision\x18\x07 \x01(\t\x12\x0c\n\x04\x64\x65sc\x18\x08 \x01(\t\x12\x0c\n\x04path\x18\t \x01(\t\x12\x14\n\x0c\x63ompute_capa\x18\n \x01(\t\x12\x16\n\tref_count\x18\x0b \x01(\x05H\x00\x88\x01\x01\x42\x0c\n\n_ref_count\"\x9d\x01\n\x05\x45vent\x12\x13\n\x0b\x63\x61tegory_id\x18\x01 \x01(\t\x12\x15\n\rcategory_name\x18\x02 \x01(\t\x12\'\n\x07targets\x18\x03 \x03(\x0b\x32\x16.autocare.Event.Target\x1a?\n\x06Target\x12\x12\n\nevent_name\x18\x01 \x01(\t\x12\x10\n\x08\x65vent_id\x18\x02 \x01(\t\x12\x0f\n\x07\x63lasses\x18\x03 \x03(\t\"]\n\x08Pipeline\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0e\n\x06plugin\x18\x02 \x01(\t\x12\x15\n\x08model_id\x18\x03 \x01(\tH\x00\x88\x01\x01\x12\x0f\n\x07\x63lasses\x18\x04 \x03(\tB\x0b\n\t_model_id\"\xe7\x02\n\x03\x41pp\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x17\n\nevgen_path\x18\x03 \x01(\tH\x00\x88\x01\x01\x12\x1f\n\x06models\x18\x04 \x03(\x0b\x32\x0f.autocare.Model\x12\x13\n\x06\x65vents\x18\x05 \x01(\tH\x01\x88\x01\x01\x12\x11\n\tpipelines\x18\x06 \x01(\t\x12\x17\n\ncover_path\x18\x07 \x01(\tH\x02\x88\x01\x01\x12\x0c\n\x04\x64\x65sc\x18\x08 \x01(\t\x12\x19\n\x0cmemory_usage\x18\t \x01(\x05H\x03\x88\x01\x01\x12\x14\n\x07version\x18\n \x01(\tH\x04\x88\x01\x01\x12\x16\n\tframework\x18\x0b \x01(\tH\x05\x88\x01\x01\x12\x14\n\x07outputs\x18\x0c \x01(\tH\x06\x88\x01\x01\x42\r\n\x0b_evgen_pathB\t\n\x07_eventsB\r\n\x0b_cover_pathB\x0f\n\r_memory_usageB\n\n\x08_versionB\x0c\n\n_frameworkB\n\n\x08_outputs\"G\n\tInference\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0e\n\x06\x61pp_id\x18\x02 \x01(\t\x12\x11\n\tstream_id\x18\x03 \x01(\t\x12\x0b\n\x03uri\x18\x04 \x01(\t\"\xb1\x01\n\x02\x44x\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x03 \x01(\t\x12\x10\n\x08\x63\x61pacity\x18\x04 \x01(\x05\x12\x11\n\tactivated\x18\x05 \x01(\x05\x12\x0f\n\x07version\x18\x06 \x01(\t\x12\x11\n\tframework\x18\x07 \x01(\t\x12\x10\n\x08lic_type\x18\x08 \x01(\t\x12\x14\n\x0clic_end_date\x18\t \x01(\t\x12\x0f\n\x07lic_key\x18\n \x01(\t2\x84\t\n\x08\x44\x65tector\x12@\n\x0c\x41\x64\x64Inference\x12\x16.autocare.InferenceReq\x1a\x16.autocare.InferenceRes\"\x00\x12\x43\n\x0fRemoveInference\x12\x16.autocare.InferenceReq\x1a\x16.autocare.InferenceRes\"\x00\x12:\n\x12RemoveInferenceAll\x12\x10.autocare.AppReq\x1a\x10.autocare.AppRes\"\x00\x12\x43\n\x0fUpdateInference\x12\x16.autocare.InferenceReq\x1a\x16.autocare.InferenceRes\"\x00\x12\x34\n\nInstallApp\x12\x10.autocare.AppReq\x1a\x10.autocare.AppRes\"\x00(\x01\x12\x34\n\x0cUninstallApp\x12\x10.autocare.AppReq\x1a\x10.autocare.AppRes\"\x00\x12\x33\n\nGetAppList\x12\x10.autocare.AppReq\x1a\x11.autocare.AppList\"\x00\x12\x45\n\x10GetInferenceList\x12\x16.autocare.InferenceReq\x1a\x17.autocare.InferenceList\"\x00\x12\x46\n\x12GetInferenceStatus\x12\x16.autocare.InferenceReq\x1a\x16.autocare.InferenceRes\"\x00\x12G\n\x15GetInferenceStatusAll\x12\x10.autocare.AppReq\x1a\x1a.autocare.InferenceResList\"\x00\x12G\n\x13RequestPreviewImage\x12\x16.autocare.InferenceReq\x1a\x16.autocare.InferenceRes\"\x00\x12L\n\x16SubscribePreviewImages\x12\x16.autocare.InferenceReq\x1a\x16.autocare.InferenceRes\"\x00\x30\x01\x12\x39\n\x11LicenseActivation\x12\x10.autocare.LicReq\x1a\x10.autocare.LicRes\"\x00\x12;\n\x13LicenseDeactivation\x12\x10.autocare.LicReq\x1a\x10.autocare.LicRes\"\x00\x12\x37\n\x0fLicenseActivate\x12\x10.autocare.LicReq\x1a\x10.autocare.LicRes\"\x00\x12\x42\n\x0eStartStreaming\x12\x16.autocare.StreamingReq\x1a\x16.autocare.StreamingRes\"\x00\x12\x41\n\rStopStreaming\x12\x16.autocare.StreamingReq\x1a\x16.autocare.StreamingRes\"\x00\x12(\n\x05GetDx\x12\x0f.autocare.Empty\x1a\x0c.autocare.Dx\"\x00\x42\x0f\xaa\x02\x0cGrpcDxClientb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -38,42 +38,42 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_PIPELINEREQ']._serialized_end=66
   _globals['_PIPELINERES']._serialized_start=68
   _globals['_PIPELINERES']._serialized_end=97
-  _globals['_INFERENCEREQ']._serialized_start=100
-  _globals['_INFERENCEREQ']._serialized_end=258
-  _globals['_INFERENCERES']._serialized_start=261
-  _globals['_INFERENCERES']._serialized_end=508
-  _globals['_APPREQ']._serialized_start=510
-  _globals['_APPREQ']._serialized_end=580
-  _globals['_APPRES']._serialized_start=582
-  _globals['_APPRES']._serialized_end=606
-  _globals['_APPLIST']._serialized_start=608
-  _globals['_APPLIST']._serialized_end=645
-  _globals['_INFERENCELIST']._serialized_start=647
-  _globals['_INFERENCELIST']._serialized_end=705
-  _globals['_INFERENCERESLIST']._serialized_start=707
-  _globals['_INFERENCERESLIST']._serialized_end=768
-  _globals['_LICREQ']._serialized_start=770
-  _globals['_LICREQ']._serialized_end=842
-  _globals['_LICRES']._serialized_start=844
-  _globals['_LICRES']._serialized_end=906
-  _globals['_STREAMINGREQ']._serialized_start=908
-  _globals['_STREAMINGREQ']._serialized_end=988
-  _globals['_STREAMINGRES']._serialized_start=990
-  _globals['_STREAMINGRES']._serialized_end=1116
-  _globals['_MODEL']._serialized_start=1119
-  _globals['_MODEL']._serialized_end=1331
-  _globals['_EVENT']._serialized_start=1334
-  _globals['_EVENT']._serialized_end=1491
-  _globals['_EVENT_TARGET']._serialized_start=1428
-  _globals['_EVENT_TARGET']._serialized_end=1491
-  _globals['_PIPELINE']._serialized_start=1493
-  _globals['_PIPELINE']._serialized_end=1586
-  _globals['_APP']._serialized_start=1589
-  _globals['_APP']._serialized_end=1948
-  _globals['_INFERENCE']._serialized_start=1950
-  _globals['_INFERENCE']._serialized_end=2021
-  _globals['_DX']._serialized_start=2024
-  _globals['_DX']._serialized_end=2201
-  _globals['_DETECTOR']._serialized_start=2204
-  _globals['_DETECTOR']._serialized_end=3282
+  _globals['_INFERENCEREQ']._serialized_start=99
+  _globals['_INFERENCEREQ']._serialized_end=193
+  _globals['_INFERENCERES']._serialized_start=196
+  _globals['_INFERENCERES']._serialized_end=382
+  _globals['_APPREQ']._serialized_start=384
+  _globals['_APPREQ']._serialized_end=454
+  _globals['_APPRES']._serialized_start=456
+  _globals['_APPRES']._serialized_end=480
+  _globals['_APPLIST']._serialized_start=482
+  _globals['_APPLIST']._serialized_end=519
+  _globals['_INFERENCELIST']._serialized_start=521
+  _globals['_INFERENCELIST']._serialized_end=579
+  _globals['_INFERENCERESLIST']._serialized_start=581
+  _globals['_INFERENCERESLIST']._serialized_end=642
+  _globals['_LICREQ']._serialized_start=644
+  _globals['_LICREQ']._serialized_end=716
+  _globals['_LICRES']._serialized_start=718
+  _globals['_LICRES']._serialized_end=780
+  _globals['_STREAMINGREQ']._serialized_start=782
+  _globals['_STREAMINGREQ']._serialized_end=862
+  _globals['_STREAMINGRES']._serialized_start=864
+  _globals['_STREAMINGRES']._serialized_end=990
+  _globals['_MODEL']._serialized_start=993
+  _globals['_MODEL']._serialized_end=1205
+  _globals['_EVENT']._serialized_start=1208
+  _globals['_EVENT']._serialized_end=1365
+  _globals['_EVENT_TARGET']._serialized_start=1302
+  _globals['_EVENT_TARGET']._serialized_end=1365
+  _globals['_PIPELINE']._serialized_start=1367
+  _globals['_PIPELINE']._serialized_end=1460
+  _globals['_APP']._serialized_start=1463
+  _globals['_APP']._serialized_end=1822
+  _globals['_INFERENCE']._serialized_start=1824
+  _globals['_INFERENCE']._serialized_end=1895
+  _globals['_DX']._serialized_start=1898
+  _globals['_DX']._serialized_end=2075
+  _globals['_DETECTOR']._serialized_start=2078
+  _globals['_DETECTOR']._serialized_end=3234
 # @@protoc_insertion_point(module_scope)
@@ -91,6 +91,11 @@ class DetectorStub(object):
                 request_serializer=autocare__pb2.InferenceReq.SerializeToString,
                 response_deserializer=autocare__pb2.InferenceRes.FromString,
                 _registered_method=True)
+        self.SubscribePreviewImages = channel.unary_stream(
+                '/autocare.Detector/SubscribePreviewImages',
+                request_serializer=autocare__pb2.InferenceReq.SerializeToString,
+                response_deserializer=autocare__pb2.InferenceRes.FromString,
+                _registered_method=True)
         self.LicenseActivation = channel.unary_unary(
                 '/autocare.Detector/LicenseActivation',
                 request_serializer=autocare__pb2.LicReq.SerializeToString,
@@ -194,6 +199,12 @@ class DetectorServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def SubscribePreviewImages(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def LicenseActivation(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -288,6 +299,11 @@ def add_DetectorServicer_to_server(servicer, server):
                     request_deserializer=autocare__pb2.InferenceReq.FromString,
                     response_serializer=autocare__pb2.InferenceRes.SerializeToString,
             ),
+            'SubscribePreviewImages': grpc.unary_stream_rpc_method_handler(
+                    servicer.SubscribePreviewImages,
+                    request_deserializer=autocare__pb2.InferenceReq.FromString,
+                    response_serializer=autocare__pb2.InferenceRes.SerializeToString,
+            ),
             'LicenseActivation': grpc.unary_unary_rpc_method_handler(
                     servicer.LicenseActivation,
                     request_deserializer=autocare__pb2.LicReq.FromString,
@@ -628,6 +644,33 @@ class Detector(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def SubscribePreviewImages(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/autocare.Detector/SubscribePreviewImages',
+            autocare__pb2.InferenceReq.SerializeToString,
+            autocare__pb2.InferenceRes.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def LicenseActivation(request,
             target,
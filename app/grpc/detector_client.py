@@ -1,17 +1,67 @@
 """gRPC client for Core/Detector service."""
 
+import asyncio
+import itertools
 import json
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, AsyncIterator
+from typing import Any
 
 import grpc
 from loguru import logger
+from pydantic_core import to_json
 
 from app.core.config import get_settings
 from app.grpc import autocare_pb2, autocare_pb2_grpc
 
 settings = get_settings()
 
+# gRPC service config with retry policy
+_SERVICE_CONFIG_JSON = json.dumps({
+    "methodConfig": [{
+        "name": [{"service": "autocare.Detector"}],
+        "retryPolicy": {
+            "maxAttempts": 100,
+            "initialBackoff": "5s",
+            "maxBackoff": "60s",
+            "backoffMultiplier": 2,
+            "retryableStatusCodes": ["UNAVAILABLE"]
+        }
+    }]
+})
+
+_CHANNEL_OPTIONS = (
+    ("grpc.enable_retries", 1),
+    ("grpc.service_config", _SERVICE_CONFIG_JSON),
+    ("grpc.max_receive_message_length", 100 * 1024 * 1024),  # 100MB
+    ("grpc.max_send_message_length", 100 * 1024 * 1024),  # 100MB
+    # Own subchannels per channel, so each gets its own TCP connection
+    ("grpc.use_local_subchannel_pool", 1),
+)
+
+# How long get_inference_status_batched waits to collect concurrent requests
+_STATUS_BATCH_WINDOW = 0.005  # seconds
+
+# Idle InferenceReq messages kept for reuse by the per-stream RPCs
+_REQ_POOL_MAX_SIZE = 32
+
+# GetAppList/GetDx results are reused this long; the UI polls both
+_CORE_INFO_CACHE_TTL = 2.0  # seconds
+
+_INSTALL_APP_METHOD = "/autocare.Detector/InstallApp"
+_INSTALL_CHUNK_SIZE = 1024 * 1024  # 1MB chunks (legacy uses this size)
+
+
+def _encode_app_chunk(app_id: str, app_data: bytes, offset: int) -> bytes:
+    """Serialize one InstallApp chunk (runs on a worker thread)."""
+    # Send app_id with every chunk (like legacy)
+    return autocare_pb2.AppReq(
+        app_id=app_id,
+        chunk=app_data[offset:offset + _INSTALL_CHUNK_SIZE],
+    ).SerializeToString()
+
 
 @dataclass
 class InferenceStatus:
@@ -83,57 +133,153 @@ class DetectorClient:
     for managing inference pipelines and streaming.
     """
 
-    def __init__(self, address: str | None = None):
+    def __init__(self, address: str | None = None, pool_size: int | None = None):
         self.address = address or settings.core_grpc_server
-        self._channel: grpc.aio.Channel | None = None
-        self._stub: autocare_pb2_grpc.DetectorStub | None = None
+        self.pool_size = pool_size or settings.grpc_channel_pool_size
+        # One HTTP/2 connection caps concurrent streams (~100), so RPCs are
+        # spread round-robin over a small pool of channels
+        self._channels: list[grpc.aio.Channel] = []
+        self._stubs: list[autocare_pb2_grpc.DetectorStub] = []
+        self._stub_cycle: Iterator[autocare_pb2_grpc.DetectorStub] | None = None
+        self._install_app: grpc.aio.StreamUnaryMultiCallable | None = None
+        self._connect_lock = asyncio.Lock()
+        # Pending batched status requests: (app_id, video_id, future)
+        self._status_waiters: list[tuple[str, str, asyncio.Future]] = []
+        # The flush still collecting waiters, and every flush until it is done
+        # (the event loop keeps only weak references to tasks)
+        self._status_flush: asyncio.Task | None = None
+        self._status_flush_tasks: set[asyncio.Task] = set()
+        self._req_pool: list[autocare_pb2.InferenceReq] = []
+        # Short-lived GetAppList/GetDx results: key -> (expires_at, value)
+        self._info_cache: dict[str, tuple[float, Any]] = {}
+        self._info_locks = {"apps": asyncio.Lock(), "dx": asyncio.Lock()}
+        # Bumped on invalidation so a fetch started before it isn't cached
+        self._info_generation = {"apps": 0, "dx": 0}
 
     async def connect(self) -> None:
         """Connect to gRPC server."""
         try:
-            # Create async channel with retry policy
-            self._channel = grpc.aio.insecure_channel(
-                self.address,
-                options=[
-                    ("grpc.enable_retries", 1),
-                    ("grpc.service_config", self._get_service_config()),
-                    ("grpc.max_receive_message_length", 100 * 1024 * 1024),  # 100MB
-                    ("grpc.max_send_message_length", 100 * 1024 * 1024),  # 100MB
-                ],
+            # Create async channels with retry policy
+            self._channels = [
+                grpc.aio.insecure_channel(self.address, options=_CHANNEL_OPTIONS)
+                for _ in range(self.pool_size)
+            ]
+            self._stubs = [autocare_pb2_grpc.DetectorStub(ch) for ch in self._channels]
+            self._stub_cycle = itertools.cycle(self._stubs)
+            # InstallApp is fed pre-serialized AppReq bytes, so chunk copies
+            # and encoding happen on worker threads, not the event loop
+            self._install_app = self._channels[0].stream_unary(
+                _INSTALL_APP_METHOD,
+                request_serializer=None,
+                response_deserializer=autocare_pb2.AppRes.FromString,
             )
-            self._stub = autocare_pb2_grpc.DetectorStub(self._channel)
-            logger.info(f"Connected to gRPC at {self.address}")
+            logger.info(f"Connected to gRPC at {self.address} ({self.pool_size} channels)")
         except Exception as e:
             logger.error(f"Failed to connect to gRPC: {e}")
             raise
 
+    async def warm_up(self, timeout: float = 5.0) -> None:
+        """Connect and wait for the channels to be READY before the first RPC.
+
+        Takes the TCP/HTTP/2 handshake out of the first user-facing call.
+        If Core is not reachable in time, RPCs simply connect on demand.
+        """
+        await self._ensure_connected()
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(channel.channel_ready() for channel in self._channels)),
+                timeout,
+            )
+            logger.info(f"gRPC channels ready at {self.address}")
+        except TimeoutError:
+            logger.warning(f"gRPC channels not ready after {timeout}s, connecting on demand")
+
     async def disconnect(self) -> None:
         """Disconnect from gRPC server."""
-        if self._channel:
-            await self._channel.close()
-            self._channel = None
-            self._stub = None
+        if self._channels:
+            channels = self._channels
+            self._channels = []
+            self._stubs = []
+            self._stub_cycle = None
+            self._install_app = None
+            for channel in channels:
+                await channel.close()
             logger.info("Disconnected from gRPC")
 
-    def _get_service_config(self) -> str:
-        """Get gRPC service config with retry policy."""
-        return json.dumps({
-            "methodConfig": [{
-                "name": [{"service": "autocare.Detector"}],
-                "retryPolicy": {
-                    "maxAttempts": 100,
-                    "initialBackoff": "5s",
-                    "maxBackoff": "60s",
-                    "backoffMultiplier": 2,
-                    "retryableStatusCodes": ["UNAVAILABLE"]
-                }
-            }]
-        })
+    async def _ensure_connected(self) -> None:
+        """Connect on first use; concurrent first callers share one connect()."""
+        if self._stub_cycle is not None:
+            return
+        async with self._connect_lock:
+            if self._stub_cycle is None:
+                await self.connect()
+
+    def _next_stub(self) -> autocare_pb2_grpc.DetectorStub:
+        """Get the next stub in the channel pool (round-robin)."""
+        return next(self._stub_cycle)
+
+    @contextmanager
+    def _borrow_req(self, app_id: str, video_id: str) -> Iterator[autocare_pb2.InferenceReq]:
+        """Borrow a pooled InferenceReq with app_id/stream_id set.
+
+        The message is owned by the caller until the block exits, so it must
+        only be used for a single awaited RPC inside the block. It is only
+        returned to the pool on a normal exit; after a cancellation the
+        in-flight call may still reference it, so it is dropped instead.
+        """
+        request = self._req_pool.pop() if self._req_pool else autocare_pb2.InferenceReq()
+        request.app_id = app_id
+        request.stream_id = video_id
+        yield request
+        request.Clear()
+        if len(self._req_pool) < _REQ_POOL_MAX_SIZE:
+            self._req_pool.append(request)
+
+    async def _cached_info(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Return a cached Core info result, fetching it once when stale.
+
+        Concurrent callers on a stale entry share a single RPC. Failed
+        fetches raise and are never cached.
+        """
+        cached = self._info_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        async with self._info_locks[key]:
+            cached = self._info_cache.get(key)
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
+            generation = self._info_generation[key]
+            value = await fetch()
+            if self._info_generation[key] == generation:
+                self._info_cache[key] = (time.monotonic() + _CORE_INFO_CACHE_TTL, value)
+            return value
+
+    def _invalidate_info(self, key: str) -> None:
+        """Drop a cached Core info result, including one still being fetched."""
+        self._info_generation[key] += 1
+        self._info_cache.pop(key, None)
+
+    @staticmethod
+    def _to_inference_status(response: autocare_pb2.InferenceRes) -> InferenceStatus:
+        """Build an InferenceStatus from an InferenceRes (without snapshot)."""
+        # status/eos/err are plain proto3 fields (unset reads as 0/False);
+        # only meta keeps presence, to report None when unset
+        return InferenceStatus(
+            status=response.status,
+            count=response.count,
+            eos=response.eos,
+            err=response.err,
+            meta=response.meta if response.HasField("meta") else None,
+        )
 
-    def _ensure_connected(self) -> None:
-        """Ensure client is connected."""
-        if self._stub is None:
-            raise RuntimeError("gRPC client is not connected. Call connect() first.")
+    @classmethod
+    def _to_preview_status(cls, response: autocare_pb2.InferenceRes) -> InferenceStatus:
+        """Build an InferenceStatus from an InferenceRes, including the snapshot."""
+        status = cls._to_inference_status(response)
+        if response.HasField("snapshot"):
+            status.image = response.snapshot
+        return status
 
     async def add_inference(
         self,
@@ -156,26 +302,23 @@ class DetectorClient:
         Returns:
             Count from response (number of affected inferences)
         """
-        self._ensure_connected()
+        await self._ensure_connected()
 
-        request = autocare_pb2.InferenceReq(
-            app_id=app_id,
-            stream_id=video_id,
-            uri=uri,
-        )
+        with self._borrow_req(app_id, video_id) as request:
+            request.uri = uri
+            if settings:
+                request.settings = to_json(settings).decode()
+            if name:
+                request.name = name
 
-        if settings:
-            request.settings = json.dumps(settings)
-        if name:
-            request.name = name
+            try:
+                response: autocare_pb2.InferenceRes = await self._next_stub().AddInference(request)
+            except grpc.aio.AioRpcError as e:
+                logger.error(f"gRPC AddInference failed: {e.code()} - {e.details()}")
+                raise
 
-        try:
-            response: autocare_pb2.InferenceRes = await self._stub.AddInference(request)
-            logger.info(f"gRPC AddInference: app={app_id}, video={video_id}, count={response.count}")
-            return response.count
-        except grpc.aio.AioRpcError as e:
-            logger.error(f"gRPC AddInference failed: {e.code()} - {e.details()}")
-            raise
+        logger.info(f"gRPC AddInference: app={app_id}, video={video_id}, count={response.count}")
+        return response.count
 
     async def remove_inference(
         self,
@@ -188,29 +331,26 @@ class DetectorClient:
         Returns:
             Count from response (number of affected inferences)
         """
-        self._ensure_connected()
+        await self._ensure_connected()
 
-        request = autocare_pb2.InferenceReq(
-            app_id=app_id,
-            stream_id=video_id,
-        )
+        with self._borrow_req(app_id, video_id) as request:
+            try:
+                response: autocare_pb2.InferenceRes = await self._next_stub().RemoveInference(request)
+            except grpc.aio.AioRpcError as e:
+                logger.error(f"gRPC RemoveInference failed: {e.code()} - {e.details()}")
+                raise
 
-        try:
-            response: autocare_pb2.InferenceRes = await self._stub.RemoveInference(request)
-            logger.info(f"gRPC RemoveInference: app={app_id}, video={video_id}, count={response.count}")
-            return response.count
-        except grpc.aio.AioRpcError as e:
-            logger.error(f"gRPC RemoveInference failed: {e.code()} - {e.details()}")
-            raise
+        logger.info(f"gRPC RemoveInference: app={app_id}, video={video_id}, count={response.count}")
+        return response.count
 
     async def remove_inference_all(self, app_id: str) -> bool:
         """Remove all inferences for an app."""
-        self._ensure_connected()
+        await self._ensure_connected()
 
         request = autocare_pb2.AppReq(app_id=app_id)
 
         try:
-            response: autocare_pb2.AppRes = await self._stub.RemoveInferenceAll(request)
+            response: autocare_pb2.AppRes = await self._next_stub().RemoveInferenceAll(request)
             logger.info(f"gRPC RemoveInferenceAll: app={app_id}, result={response.result}")
             return response.result
         except grpc.aio.AioRpcError as e:
@@ -230,25 +370,22 @@ class DetectorClient:
         Returns:
             Count from response (number of affected inferences)
         """
-        self._ensure_connected()
+        await self._ensure_connected()
 
-        request = autocare_pb2.InferenceReq(
-            app_id=app_id,
-            stream_id=video_id,
-        )
+        with self._borrow_req(app_id, video_id) as request:
+            if settings:
+                request.settings = to_json(settings).decode()
+            if name:
+                request.name = name
 
-        if settings:
-            request.settings = json.dumps(settings)
-        if name:
-            request.name = name
+            try:
+                response: autocare_pb2.InferenceRes = await self._next_stub().UpdateInference(request)
+            except grpc.aio.AioRpcError as e:
+                logger.error(f"gRPC UpdateInference failed: {e.code()} - {e.details()}")
+                raise
 
-        try:
-            response: autocare_pb2.InferenceRes = await self._stub.UpdateInference(request)
-            logger.info(f"gRPC UpdateInference: app={app_id}, video={video_id}, count={response.count}")
-            return response.count
-        except grpc.aio.AioRpcError as e:
-            logger.error(f"gRPC UpdateInference failed: {e.code()} - {e.details()}")
-            raise
+        logger.info(f"gRPC UpdateInference: app={app_id}, video={video_id}, count={response.count}")
+        return response.count
 
     async def get_inference_status(
         self,
@@ -265,46 +402,106 @@ class DetectorClient:
             - 2: CONNECTING
             - 3: CONNECTED
         """
-        self._ensure_connected()
+        await self._ensure_connected()
 
-        request = autocare_pb2.InferenceReq(
-            app_id=app_id,
-            stream_id=video_id,
-        )
+        with self._borrow_req(app_id, video_id) as request:
+            try:
+                response: autocare_pb2.InferenceRes = await self._next_stub().GetInferenceStatus(request)
+            except grpc.aio.AioRpcError as e:
+                logger.error(f"gRPC GetInferenceStatus failed: {e.code()} - {e.details()}")
+                return None
+
+        return self._to_inference_status(response)
+
+    async def get_inference_status_batched(
+        self,
+        app_id: str,
+        video_id: str,
+    ) -> InferenceStatus | None:
+        """
+        Get inference status, coalescing concurrent calls into GetInferenceStatusAll.
+
+        Requests arriving within a short window are answered from one
+        GetInferenceStatusAll per app; streams missing from that response
+        fall back to GetInferenceStatus. Same result as get_inference_status.
+        """
+        await self._ensure_connected()
+
+        future = asyncio.get_running_loop().create_future()
+        self._status_waiters.append((app_id, video_id, future))
+        if self._status_flush is None:
+            self._status_flush = asyncio.create_task(self._flush_status_waiters())
+            self._status_flush_tasks.add(self._status_flush)
+            self._status_flush.add_done_callback(self._on_status_flush_done)
+        return await future
+
+    def _on_status_flush_done(self, task: asyncio.Task) -> None:
+        """Drop a finished flush; cancel its waiters if it never collected them."""
+        self._status_flush_tasks.discard(task)
+        if self._status_flush is task:
+            # Cancelled (shutdown) before the batch window ended
+            waiters, self._status_waiters = self._status_waiters, []
+            self._status_flush = None
+            for _, _, future in waiters:
+                future.cancel()
+
+    async def _flush_status_waiters(self) -> None:
+        """Answer the collected batched status requests."""
+        await asyncio.sleep(_STATUS_BATCH_WINDOW)
+        waiters, self._status_waiters = self._status_waiters, []
+        self._status_flush = None
 
         try:
-            response: autocare_pb2.InferenceRes = await self._stub.GetInferenceStatus(request)
-            return InferenceStatus(
-                status=response.status if response.HasField("status") else 0,
-                count=response.count,
-                eos=response.eos if response.HasField("eos") else False,
-                err=response.err if response.HasField("err") else False,
-                meta=response.meta if response.HasField("meta") else None,
+            app_ids = list(dict.fromkeys(app_id for app_id, _, _ in waiters))
+            responses = await asyncio.gather(
+                *(
+                    self._next_stub().GetInferenceStatusAll(autocare_pb2.AppReq(app_id=app_id))
+                    for app_id in app_ids
+                ),
+                return_exceptions=True,
             )
-        except grpc.aio.AioRpcError as e:
-            logger.error(f"gRPC GetInferenceStatus failed: {e.code()} - {e.details()}")
-            return None
+
+            found: dict[tuple[str, str], InferenceStatus] = {}
+            for app_id, response in zip(app_ids, responses):
+                if isinstance(response, BaseException):
+                    logger.warning(f"gRPC GetInferenceStatusAll failed for app={app_id}: {response}")
+                    continue
+                for inf in response.inference:
+                    if inf.stream_id:
+                        found[(app_id, inf.stream_id)] = self._to_inference_status(inf)
+
+            missing = [(a, v) for a, v, _ in waiters if (a, v) not in found]
+            fallbacks = await asyncio.gather(
+                *(self.get_inference_status(a, v) for a, v in missing)
+            )
+            found.update(
+                (key, status) for key, status in zip(missing, fallbacks) if status
+            )
+
+            for app_id, video_id, future in waiters:
+                if not future.done():
+                    future.set_result(found.get((app_id, video_id)))
+        except Exception as e:
+            for _, _, future in waiters:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            # Cancelled (shutdown) mid-RPC: never leave callers waiting
+            for _, _, future in waiters:
+                if not future.done():
+                    future.cancel()
 
     async def get_inference_status_all(self, app_id: str | None = None) -> list[InferenceStatus]:
         """Get all inference statuses for an app (or all apps if app_id is None)."""
-        self._ensure_connected()
+        await self._ensure_connected()
 
         request = autocare_pb2.AppReq()
         if app_id:
             request.app_id = app_id
 
         try:
-            response: autocare_pb2.InferenceResList = await self._stub.GetInferenceStatusAll(request)
-            return [
-                InferenceStatus(
-                    status=inf.status if inf.HasField("status") else 0,
-                    count=inf.count,
-                    eos=inf.eos if inf.HasField("eos") else False,
-                    err=inf.err if inf.HasField("err") else False,
-                    meta=inf.meta if inf.HasField("meta") else None,
-                )
-                for inf in response.inference
-            ]
+            response: autocare_pb2.InferenceResList = await self._next_stub().GetInferenceStatusAll(request)
+            return [self._to_inference_status(inf) for inf in response.inference]
         except grpc.aio.AioRpcError as e:
             logger.error(f"gRPC GetInferenceStatusAll failed: {e.code()} - {e.details()}")
             return []
@@ -320,26 +517,49 @@ class DetectorClient:
         Returns:
             InferenceStatus with image bytes in the image field
         """
-        self._ensure_connected()
+        await self._ensure_connected()
 
-        request = autocare_pb2.InferenceReq(
-            app_id=app_id,
-            stream_id=video_id,
-        )
+        with self._borrow_req(app_id, video_id) as request:
+            try:
+                response: autocare_pb2.InferenceRes = await self._next_stub().RequestPreviewImage(request)
+            except grpc.aio.AioRpcError as e:
+                logger.error(f"gRPC RequestPreviewImage failed: {e.code()} - {e.details()}")
+                return None
+
+        return self._to_preview_status(response)
+
+    async def preview_image_stream(
+        self,
+        app_id: str,
+        video_id: str,
+    ) -> AsyncIterator[InferenceStatus]:
+        """
+        Subscribe to preview images pushed by Core as frames change.
 
+        One server-streaming call replaces polling request_preview_image;
+        iteration ends when Core closes the stream or the call fails.
+
+        Raises:
+            grpc.aio.AioRpcError: UNIMPLEMENTED when Core has no preview stream
+
+        Yields:
+            InferenceStatus with image bytes in the image field
+        """
+        await self._ensure_connected()
+
+        # Not pooled: the request is held by the call for the whole stream
+        request = autocare_pb2.InferenceReq(app_id=app_id, stream_id=video_id)
+        call = self._next_stub().SubscribePreviewImages(request)
         try:
-            response: autocare_pb2.InferenceRes = await self._stub.RequestPreviewImage(request)
-            return InferenceStatus(
-                status=response.status if response.HasField("status") else 0,
-                count=response.count,
-                eos=response.eos if response.HasField("eos") else False,
-                err=response.err if response.HasField("err") else False,
-                image=response.snapshot if response.HasField("snapshot") else None,
-                meta=response.meta if response.HasField("meta") else None,
-            )
+            async for response in call:
+                yield self._to_preview_status(response)
         except grpc.aio.AioRpcError as e:
-            logger.error(f"gRPC RequestPreviewImage failed: {e.code()} - {e.details()}")
-            return None
+            # Older Core builds lack the RPC; callers report that as unsupported
+            if e.code() == grpc.StatusCode.UNIMPLEMENTED:
+                raise
+            logger.error(f"gRPC SubscribePreviewImages failed: {e.code()} - {e.details()}")
+        finally:
+            call.cancel()
 
     async def start_streaming(
         self,
@@ -356,18 +576,18 @@ class DetectorClient:
         Returns:
             StreamingResult with HLS location and timestamps
         """
-        self._ensure_connected()
+        await self._ensure_connected()
 
         request = autocare_pb2.StreamingReq(uri=uri)
         if session_id:
             request.session_id = session_id
 
         try:
-            response: autocare_pb2.StreamingRes = await self._stub.StartStreaming(request)
+            response: autocare_pb2.StreamingRes = await self._next_stub().StartStreaming(request)
             return StreamingResult(
-                location=response.location if response.HasField("location") else "",
-                ts_start=response.ts_start if response.HasField("ts_start") else 0,
-                session_id=response.session_id if response.HasField("session_id") else "",
+                location=response.location,
+                ts_start=response.ts_start,
+                session_id=response.session_id,
             )
         except grpc.aio.AioRpcError as e:
             logger.error(f"gRPC StartStreaming failed: {e.code()} - {e.details()}")
@@ -375,12 +595,12 @@ class DetectorClient:
 
     async def stop_streaming(self, session_id: str) -> bool:
         """Stop HLS streaming in Core."""
-        self._ensure_connected()
+        await self._ensure_connected()
 
         request = autocare_pb2.StreamingReq(session_id=session_id)
 
         try:
-            await self._stub.StopStreaming(request)
+            await self._next_stub().StopStreaming(request)
             logger.info(f"gRPC StopStreaming: session={session_id}")
             return True
         except grpc.aio.AioRpcError as e:
@@ -398,25 +618,21 @@ class DetectorClient:
         Returns:
             True if installation succeeded
         """
-        self._ensure_connected()
-
-        async def chunk_generator() -> AsyncIterator[autocare_pb2.AppReq]:
-            """Generate 1MB chunks for streaming upload (like legacy C#)."""
-            chunk_size = 1024 * 1024  # 1MB chunks (legacy uses this size)
-            for i in range(0, len(app_data), chunk_size):
-                chunk = app_data[i:i + chunk_size]
-                # Send app_id with every chunk (like legacy)
-                yield autocare_pb2.AppReq(
-                    app_id=app_id,
-                    chunk=chunk,
-                )
+        await self._ensure_connected()
+
+        async def chunk_generator() -> AsyncIterator[bytes]:
+            """Generate serialized 1MB chunks for streaming upload (like legacy C#)."""
+            for offset in range(0, len(app_data), _INSTALL_CHUNK_SIZE):
+                yield await asyncio.to_thread(_encode_app_chunk, app_id, app_data, offset)
 
         try:
-            response: autocare_pb2.AppRes = await self._stub.InstallApp(
+            response: autocare_pb2.AppRes = await self._install_app(
                 chunk_generator(),
                 timeout=60,  # 60 second timeout like legacy
             )
             logger.info(f"gRPC InstallApp: app={app_id}, size={len(app_data)}, result={response.result}")
+            if response.result:
+                self._invalidate_info("apps")
             return response.result
         except grpc.aio.AioRpcError as e:
             logger.error(f"gRPC InstallApp failed: {e.code()} - {e.details()}")
@@ -424,77 +640,84 @@ class DetectorClient:
 
     async def uninstall_app(self, app_id: str) -> bool:
         """Uninstall app from Core."""
-        self._ensure_connected()
+        await self._ensure_connected()
 
         request = autocare_pb2.AppReq(app_id=app_id)
 
         try:
-            response: autocare_pb2.AppRes = await self._stub.UninstallApp(request)
+            response: autocare_pb2.AppRes = await self._next_stub().UninstallApp(request)
             logger.info(f"gRPC UninstallApp: app={app_id}, result={response.result}")
+            if response.result:
+                self._invalidate_info("apps")
             return response.result
         except grpc.aio.AioRpcError as e:
             logger.error(f"gRPC UninstallApp failed: {e.code()} - {e.details()}")
             return False
 
     async def get_app_list(self) -> list[AppInfo]:
-        """Get list of installed apps from Core."""
-        self._ensure_connected()
-
-        request = autocare_pb2.AppReq()
+        """Get list of installed apps from Core (cached briefly)."""
+        await self._ensure_connected()
 
         try:
-            response: autocare_pb2.AppList = await self._stub.GetAppList(request)
-            result = []
-            for app in response.app:
-                # Parse models
-                models = []
-                if app.models:
-                    for m in app.models:
-                        models.append(AppModelInfo(
-                            id=m.id,
-                            name=m.name,
-                            version=m.version if m.version else None,
-                            capacity=m.capacity if m.capacity else None,
-                            precision=m.precision if m.precision else None,
-                            desc=m.desc if m.desc else None,
-                            path=m.path if m.path else None,
-                        ))
-
-                result.append(AppInfo(
-                    id=app.id,
-                    name=app.name,
-                    desc=app.desc,
-                    version=app.version if app.HasField("version") else None,
-                    framework=app.framework if app.HasField("framework") else None,
-                    memory_usage=app.memory_usage if app.HasField("memory_usage") else None,
-                    evgen_path=app.evgen_path if app.HasField("evgen_path") else None,
-                    cover_path=app.cover_path if app.HasField("cover_path") else None,
-                    models=models if models else None,
-                    pipelines=app.pipelines if app.pipelines else None,
-                    outputs=app.outputs if app.HasField("outputs") else None,
-                ))
-            return result
+            return list(await self._cached_info("apps", self._fetch_app_list))
         except grpc.aio.AioRpcError as e:
             logger.error(f"gRPC GetAppList failed: {e.code()} - {e.details()}")
             return []
 
+    async def _fetch_app_list(self) -> list[AppInfo]:
+        """Call GetAppList and convert the response."""
+        request = autocare_pb2.AppReq()
+
+        response: autocare_pb2.AppList = await self._next_stub().GetAppList(request)
+        result = []
+        for app in response.app:
+            # Parse models
+            models = []
+            if app.models:
+                for m in app.models:
+                    models.append(AppModelInfo(
+                        id=m.id,
+                        name=m.name,
+                        version=m.version if m.version else None,
+                        capacity=m.capacity if m.capacity else None,
+                        precision=m.precision if m.precision else None,
+                        desc=m.desc if m.desc else None,
+                        path=m.path if m.path else None,
+                    ))
+
+            result.append(AppInfo(
+                id=app.id,
+                name=app.name,
+                desc=app.desc,
+                version=app.version if app.HasField("version") else None,
+                framework=app.framework if app.HasField("framework") else None,
+                memory_usage=app.memory_usage if app.HasField("memory_usage") else None,
+                evgen_path=app.evgen_path if app.HasField("evgen_path") else None,
+                cover_path=app.cover_path if app.HasField("cover_path") else None,
+                models=models if models else None,
+                pipelines=app.pipelines if app.pipelines else None,
+                outputs=app.outputs if app.HasField("outputs") else None,
+            ))
+        return result
+
     async def get_inference_list(self, app_id: str | None = None) -> list[dict[str, Any]]:
         """Get list of inferences from Core."""
-        self._ensure_connected()
+        await self._ensure_connected()
 
         request = autocare_pb2.InferenceReq()
         if app_id:
             request.app_id = app_id
 
         try:
-            response: autocare_pb2.InferenceList = await self._stub.GetInferenceList(request)
+            response: autocare_pb2.InferenceList = await self._next_stub().GetInferenceList(request)
             return [
                 {
                     "app_id": inf.app_id,
-                    "stream_id": inf.stream_id if inf.HasField("stream_id") else None,
-                    "uri": inf.uri if inf.HasField("uri") else None,
-                    "settings": inf.settings if inf.HasField("settings") else None,
-                    "name": inf.name if inf.HasField("name") else None,
+                    # Plain proto3 fields: unset reads as "", reported as None
+                    "stream_id": inf.stream_id or None,
+                    "uri": inf.uri or None,
+                    "settings": inf.settings or None,
+                    "name": inf.name or None,
                 }
                 for inf in response.inference
             ]
@@ -503,84 +726,81 @@ class DetectorClient:
             return []
 
     async def get_dx_info(self) -> DxInfo | None:
-        """Get DX system info from Core."""
-        self._ensure_connected()
-
-        request = autocare_pb2.Empty()
+        """Get DX system info from Core (cached briefly)."""
+        await self._ensure_connected()
 
         try:
-            response: autocare_pb2.Dx = await self._stub.GetDx(request)
-            return DxInfo(
-                id=response.id,
-                name=response.name,
-                address=response.address,
-                capacity=response.capacity,
-                activated=response.activated,
-                version=response.version,
-                framework=response.framework,
-                lic_type=response.lic_type,
-                lic_end_date=response.lic_end_date,
-                lic_key=response.lic_key,
-            )
+            return await self._cached_info("dx", self._fetch_dx_info)
         except grpc.aio.AioRpcError as e:
             logger.error(f"gRPC GetDx failed: {e.code()} - {e.details()}")
             return None
 
-    async def license_activation(
+    async def _fetch_dx_info(self) -> DxInfo:
+        """Call GetDx and convert the response."""
+        request = autocare_pb2.Empty()
+
+        response: autocare_pb2.Dx = await self._next_stub().GetDx(request)
+        return DxInfo(
+            id=response.id,
+            name=response.name,
+            address=response.address,
+            capacity=response.capacity,
+            activated=response.activated,
+            version=response.version,
+            framework=response.framework,
+            lic_type=response.lic_type,
+            lic_end_date=response.lic_end_date,
+            lic_key=response.lic_key,
+        )
+
+    async def _license_call(
         self,
+        method: str,
         license_key: str,
-        hash_code: str | None = None,
+        hash_code: str | None,
     ) -> tuple[bool, str | None]:
-        """
-        Request license activation (.req file generation).
-
-        Args:
-            license_key: License key
-            hash_code: Optional hash code
-
-        Returns:
-            Tuple of (success, hash_code)
-        """
-        self._ensure_connected()
+        """Send a LicReq to a license RPC and return (success, hash_code)."""
+        await self._ensure_connected()
 
         request = autocare_pb2.LicReq(key=license_key)
         if hash_code:
             request.hash_code = hash_code
 
         try:
-            response: autocare_pb2.LicRes = await self._stub.LicenseActivation(request)
+            response: autocare_pb2.LicRes = await getattr(self._next_stub(), method)(request)
+            if response.result:
+                # License state is part of GetDx
+                self._invalidate_info("dx")
             return response.result, response.hash_code if response.HasField("hash_code") else None
         except grpc.aio.AioRpcError as e:
-            logger.error(f"gRPC LicenseActivation failed: {e.code()} - {e.details()}")
+            logger.error(f"gRPC {method} failed: {e.code()} - {e.details()}")
             return False, None
 
-    async def license_deactivation(
+    async def license_activation(
         self,
         license_key: str,
         hash_code: str | None = None,
     ) -> tuple[bool, str | None]:
         """
-        Request license deactivation.
-
-        Args:
-            license_key: License key
-            hash_code: Optional hash code
+        Request license activation (.req file generation).
 
         Returns:
             Tuple of (success, hash_code)
         """
-        self._ensure_connected()
+        return await self._license_call("LicenseActivation", license_key, hash_code)
 
-        request = autocare_pb2.LicReq(key=license_key)
-        if hash_code:
-            request.hash_code = hash_code
+    async def license_deactivation(
+        self,
+        license_key: str,
+        hash_code: str | None = None,
+    ) -> tuple[bool, str | None]:
+        """
+        Request license deactivation.
 
-        try:
-            response: autocare_pb2.LicRes = await self._stub.LicenseDeactivation(request)
-            return response.result, response.hash_code if response.HasField("hash_code") else None
-        except grpc.aio.AioRpcError as e:
-            logger.error(f"gRPC LicenseDeactivation failed: {e.code()} - {e.details()}")
-            return False, None
+        Returns:
+            Tuple of (success, hash_code)
+        """
+        return await self._license_call("LicenseDeactivation", license_key, hash_code)
 
     async def license_activate(
         self,
@@ -590,22 +810,8 @@ class DetectorClient:
         """
         Activate license (.lic file application).
 
-        Args:
-            license_key: License key
-            hash_code: Optional hash code from activation
-
         Returns:
             True if activation succeeded
         """
-        self._ensure_connected()
-
-        request = autocare_pb2.LicReq(key=license_key)
-        if hash_code:
-            request.hash_code = hash_code
-
-        try:
-            response: autocare_pb2.LicRes = await self._stub.LicenseActivate(request)
-            return response.result
-        except grpc.aio.AioRpcError as e:
-            logger.error(f"gRPC LicenseActivate failed: {e.code()} - {e.details()}")
-            return False
+        result, _ = await self._license_call("LicenseActivate", license_key, hash_code)
+        return result
@@ -6,43 +6,101 @@ Ported from C# ASP.NET Core backend.
 """
 
 import asyncio
+import stat
 from contextlib import asynccontextmanager
 from pathlib import Path
 
+import anyio
+import grpc
+import httpx
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from loguru import logger
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.types import Scope
 
 from app.api import router as api_router
 from app.core.config import get_settings
 from app.db.base import Base
-from app.db import models_registry  # noqa: F401 - Import to register models
-from app.db.session import async_session_maker, engine
+from app.db.models_registry import register_all
+from app.db.session import async_session_maker, engine, warm_up_pool
 from app.grpc import DetectorClient, set_grpc_client
 from app.services.event_service import EventService
+from app.services.stream_service import stream_service
 from app.workers.alarm_service import alarm_service_lifespan
 from app.workers.event_retention import EventRetentionWorker
 from app.workers.eventpush_worker import EventpushWorker
 from app.workers.image_retention import ImageRetentionWorker
+from app.workers.nats_publisher import get_nats_publisher
 from app.workers.nats_subscriber import NatsEventSubscriber
 from app.workers.nats_wakeup_service import nats_wakeup_lifespan
 
 settings = get_settings()
 
+# Constant error bodies, encoded once
+_CORE_UNAVAILABLE_BODY = b'{"Code":503,"Message":"Core unavailable"}'
+_CORE_REJECTED_BODY = b'{"Code":502,"Message":"Core request failed"}'
+
+# gRPC codes meaning Core could not be reached in time (vs. rejecting a call)
+_CORE_DOWN_CODES = frozenset({grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.DEADLINE_EXCEEDED})
+
 # Global instances
 grpc_client: DetectorClient | None = None
 nats_subscriber: NatsEventSubscriber | None = None
 eventpush_worker: EventpushWorker | None = None
 scheduler: AsyncIOScheduler | None = None
+# Strong references to long-running worker tasks (the loop only keeps weak ones)
+background_tasks: set[asyncio.Task] = set()
+
+
+def _on_background_task_done(task: asyncio.Task) -> None:
+    """Drop a finished worker task and log it if it died with an error."""
+    background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.opt(exception=task.exception()).error(
+            f"Background task {task.get_name()} crashed"
+        )
+
+
+def spawn_background_task(coro, name: str) -> asyncio.Task:
+    """Start a supervised background task, cancelled on shutdown."""
+    task = asyncio.create_task(coro, name=name)
+    background_tasks.add(task)
+    task.add_done_callback(_on_background_task_done)
+    return task
+
+
+# Indexes dropped from the models that existing database files still carry
+_OBSOLETE_INDEXES = ("ix_events_video_id", "ix_events_timestamp")
+
+
+def _drop_obsolete_indexes(conn) -> None:
+    """Drop indexes that were removed from the models (write cost only)."""
+    for name in _OBSOLETE_INDEXES:
+        conn.exec_driver_sql(f"DROP INDEX IF EXISTS {name}")
+
+
+def _create_missing_indexes(conn) -> None:
+    """Create declared indexes on tables that already existed.
+
+    create_all skips existing tables entirely, so indexes added to a model
+    later would otherwise never reach an existing database file.
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
 
 
 async def init_database() -> None:
     """Initialize database tables."""
+    register_all()
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_create_missing_indexes)
+        await conn.run_sync(_drop_obsolete_indexes)
     logger.info("Database initialized")
 
 
@@ -78,19 +136,21 @@ async def init_default_sensor_types() -> None:
     ]
 
     async with async_session_maker() as db:
-        created = 0
-        for type_id, name, protocol in default_types:
-            existing = await db.execute(
-                select(SensorType).where(SensorType.name == name)
-            )
-            if existing.scalar_one_or_none():
-                continue
+        # One IN query for all names instead of a SELECT per type
+        names = [name for _, name, _ in default_types]
+        existing = set(
+            await db.scalars(select(SensorType.name).where(SensorType.name.in_(names)))
+        )
 
-            sensor_type = SensorType(id=type_id, name=name, protocol=protocol)
-            db.add(sensor_type)
-            created += 1
+        new_types = [
+            SensorType(id=type_id, name=name, protocol=protocol)
+            for type_id, name, protocol in default_types
+            if name not in existing
+        ]
+        created = len(new_types)
 
         if created > 0:
+            db.add_all(new_types)
             await db.commit()
             logger.info(f"Default sensor types created: {created}")
 
@@ -104,17 +164,15 @@ async def start_background_services() -> None:
         logger.info("Core services disabled - skipping gRPC, NATS, and workers")
         return
 
-    # Initialize gRPC client
+    # Initialize gRPC client; channels are warmed up in the background, so
+    # startup never waits on Core
     grpc_client = DetectorClient()
-    try:
-        await grpc_client.connect()
-        set_grpc_client(grpc_client)  # Set global instance for other modules
-    except Exception as e:
-        logger.warning(f"gRPC connection failed (will retry): {e}")
+    set_grpc_client(grpc_client)  # Set global instance for other modules
+    spawn_background_task(grpc_client.warm_up(), "grpc_warm_up")
 
     # Initialize eventpush worker
     eventpush_worker = EventpushWorker()
-    asyncio.create_task(eventpush_worker.run())
+    spawn_background_task(eventpush_worker.run(), "eventpush_worker")
     logger.info("Eventpush worker started")
 
     # Initialize NATS subscriber
@@ -141,7 +199,7 @@ async def start_background_services() -> None:
     nats_subscriber.add_event_handler(on_event)
 
     try:
-        asyncio.create_task(nats_subscriber.run())
+        spawn_background_task(nats_subscriber.run(), "nats_subscriber")
         logger.info("NATS subscriber started")
     except Exception as e:
         logger.warning(f"NATS connection failed (will retry): {e}")
@@ -188,11 +246,21 @@ async def stop_background_services() -> None:
         await eventpush_worker.stop()
         logger.info("Eventpush worker stopped")
 
+    # Workers were asked to stop above; cancel whatever is still running
+    tasks = list(background_tasks)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
     if grpc_client:
         await grpc_client.disconnect()
         set_grpc_client(None)  # Clear global instance
         logger.info("gRPC client disconnected")
 
+    # Shared NATS publisher connection (also used by /system/health)
+    publisher = await get_nats_publisher()
+    await publisher.disconnect()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -207,10 +275,27 @@ async def lifespan(app: FastAPI):
     data_path = Path(settings.data_save_folder)
     data_path.mkdir(parents=True, exist_ok=True)
 
+    # Shared keep-alive HTTP client (health checks, MediaMTX API).
+    # Connect fails fast when MediaMTX is down; the pool is capped so a burst
+    # of stream requests queues instead of opening unbounded sockets.
+    app.state.http_client = httpx.AsyncClient(
+        timeout=httpx.Timeout(5.0, connect=2.0),
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=20,
+            keepalive_expiry=15,
+        ),
+    )
+    stream_service.set_http_client(app.state.http_client)
+
+    # Schema first; everything after it is independent and runs concurrently
     await init_database()
-    await init_default_user()
-    await init_default_sensor_types()
-    await start_background_services()
+    await asyncio.gather(
+        warm_up_pool(),
+        init_default_user(),
+        init_default_sensor_types(),
+        start_background_services(),
+    )
 
     # Start NATS services with context managers (modern pattern)
     if settings.enable_core_services:
@@ -228,6 +313,8 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     await stop_background_services()
+    stream_service.set_http_client(None)
+    await app.state.http_client.aclose()
     logger.info("Edge Backend API stopped")
 
 
@@ -254,8 +341,25 @@ app.add_middleware(
 
 # Exception handler
 @app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def global_exception_handler(request: Request, exc: Exception) -> Response:
     """Global exception handler."""
+    # Core RPC failures are expected when Core is down; answer with a
+    # prebuilt body instead of formatting the (long) gRPC error text.
+    # Other codes are Core rejecting the call, not an outage.
+    if isinstance(exc, grpc.aio.AioRpcError):
+        logger.warning(f"Core gRPC call failed: {exc.code()}")
+        if exc.code() in _CORE_DOWN_CODES:
+            return Response(
+                content=_CORE_UNAVAILABLE_BODY,
+                status_code=503,
+                media_type="application/json",
+            )
+        return Response(
+            content=_CORE_REJECTED_BODY,
+            status_code=502,
+            media_type="application/json",
+        )
+
     logger.error(f"Unhandled exception: {exc}")
     return JSONResponse(
         status_code=500,
@@ -291,24 +395,53 @@ if static_path.exists():
     )
 
 
-# SPA fallback (serve index.html for non-API routes)
-@app.get("/{path:path}", response_model=None)
-async def spa_fallback(path: str):
-    """Serve SPA index.html for non-API routes."""
-    if path.startswith("api/") or path.startswith("video/"):
+class SPAStaticFiles(StaticFiles):
+    """Serve wwwroot, falling back to index.html for client-side routes."""
+
+    # Resolved once by check_config; None when there is no SPA to serve
+    _index_path: str | None = None
+
+    async def check_config(self) -> None:
+        # wwwroot is optional (API-only deployments); lookups then just 404
+        try:
+            await super().check_config()
+        except RuntimeError:
+            logger.info(f"SPA directory '{self.directory}' not found, not serving SPA")
+            return
+
+        full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, "index.html")
+        if stat_result and stat.S_ISREG(stat_result.st_mode):
+            self._index_path = full_path
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        # The mount fully matches every path, so it also receives wrong-method
+        # calls to API routes. Answer 405 as the router did before the mount;
+        # Allow is kept as it was then, taken from the OPTIONS catch-all (the
+        # first route that partially matches any path), not the real route.
+        if scope["method"] not in ("GET", "HEAD"):
+            raise StarletteHTTPException(status_code=405, headers={"Allow": "OPTIONS"})
+
+        # Unmatched API/video paths are real 404s, never the SPA shell
+        if self._index_path and path.partition("/")[0] not in ("api", "video"):
+            try:
+                return await super().get_response(path, scope)
+            except StarletteHTTPException as exc:
+                if exc.status_code != 404:
+                    raise
+            return FileResponse(self._index_path)
+
         return JSONResponse(
             status_code=404,
             content={"Code": 404, "Message": "Not found"},
         )
 
-    index_path = Path("wwwroot/index.html")
-    if index_path.exists():
-        return FileResponse(index_path)
 
-    return JSONResponse(
-        status_code=404,
-        content={"Code": 404, "Message": "Not found"},
-    )
+# SPA (mounted last so API routes and /video are matched first)
+app.mount(
+    "/",
+    SPAStaticFiles(directory="wwwroot", html=True, check_dir=False),
+    name="spa",
+)
 
 
 if __name__ == "__main__":
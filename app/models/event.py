@@ -1,13 +1,27 @@
 """Event model for storing detection events."""
 
-import json
 from typing import Any
 
+from pydantic_core import from_json, to_json
 from sqlalchemy import BigInteger, Index, Integer, String, Text
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, validates
 
 from app.db.base import Base
 
+# 10-digit (seconds) and 16-digit (microseconds) timestamp ranges
+_SECONDS_MIN, _SECONDS_MAX = 10**9, 10**10
+_MICROS_MIN, _MICROS_MAX = 10**15, 10**16
+
+
+def to_milliseconds(ts: int) -> int:
+    """Normalize a seconds/milliseconds/microseconds timestamp to milliseconds."""
+    # Digit-count ranges compared as integers (no str() per value)
+    if _SECONDS_MIN <= ts < _SECONDS_MAX:  # 10 digits: seconds
+        return ts * 1000
+    if _MICROS_MIN <= ts < _MICROS_MAX:  # 16 digits: microseconds
+        return ts // 1000
+    return ts  # already milliseconds
+
 
 class Event(Base):
     """Event database model - stores detection events from the inference engine."""
@@ -22,28 +36,43 @@ class Event(Base):
     event_setting_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
     # Video/Stream reference
-    video_id: Mapped[str | None] = mapped_column(String(255), nullable=True, index=True)
+    video_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
     video_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
     app_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
     # Event metadata
-    timestamp: Mapped[int] = mapped_column(BigInteger, index=True)  # Unix timestamp in ms
+    timestamp: Mapped[int] = mapped_column(BigInteger)  # Unix timestamp in ms
     caption: Mapped[str | None] = mapped_column(String(512), nullable=True)
-    desc: Mapped[str | None] = mapped_column(Text, nullable=True)
+    desc: Mapped[str | None] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_group="payload", deferred_raiseload=True
+    )
 
     # Device reference
     device_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
     vms_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
-    # Detection objects (stored as JSON string)
-    objects: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Detection objects (stored as JSON string). objects and desc form the
+    # "payload" group: aggregate/log queries skip them, queries that build
+    # DTOs must undefer_group("payload") (accessing them unloaded raises).
+    objects: Mapped[str | None] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_group="payload", deferred_raiseload=True
+    )
 
     # Denormalized field for performance (first object label)
     object_type: Mapped[str | None] = mapped_column(String(255), nullable=True, index=True)
 
-    # Indexes for common queries
+    # Indexes for common queries. video_id and timestamp need no index of
+    # their own: each leads one of the composites below.
     __table_args__ = (
-        Index("ix_events_timestamp_video_id", "timestamp", "video_id"),
+        # Event log filtered by app and camera over a time range
+        Index("ix_events_app_video_ts", "app_id", "video_id", "timestamp"),
+        # Covers statistics range scans filtered by camera and/or type
+        Index(
+            "ix_events_timestamp_video_id_object_type",
+            "timestamp",
+            "video_id",
+            "object_type",
+        ),
         Index("ix_events_timestamp_object_type", "timestamp", "object_type"),
         Index("ix_events_summary", "video_id", "object_type", "timestamp"),
     )
@@ -53,28 +82,44 @@ class Event(Base):
         if not self.objects:
             return []
         try:
-            return json.loads(self.objects)
-        except json.JSONDecodeError:
+            return self._cached_json("objects")
+        except ValueError:
             return []
 
     def set_objects(self, objects: list[dict[str, Any]]) -> None:
         """Serialize objects list to JSON and set object_type."""
-        self.objects = json.dumps(objects) if objects else None
-        # Denormalize first object label for performance
-        if objects and len(objects) > 0:
-            self.object_type = objects[0].get("label")
-        else:
+        self.objects = objects
+
+    @validates("objects")
+    def _validate_objects(self, key: str, value: Any) -> str | None:
+        """Store objects as JSON and keep object_type in sync on every write.
+
+        Accepts a list (serialized once) or a JSON string (parsed once);
+        either way the parsed list is cached for get_objects.
+        """
+        if not value:
             self.object_type = None
+            return None
+
+        if isinstance(value, str):
+            raw = value
+            try:
+                objects = from_json(raw)
+            except ValueError:
+                objects = []
+        else:
+            raw = to_json(value).decode()
+            objects = value
+        self._prime_json_cache(key, raw, objects)
+
+        # Denormalize first object label for performance
+        first = objects[0] if isinstance(objects, list) and objects else None
+        self.object_type = first.get("label") if isinstance(first, dict) else None
+        return raw
 
     @property
     def normalized_timestamp(self) -> int:
         """Normalize timestamp to 13-digit milliseconds."""
         if self.timestamp is None:
             return 0
-
-        ts_str = str(self.timestamp)
-        if len(ts_str) == 10:  # seconds
-            return self.timestamp * 1000
-        elif len(ts_str) == 16:  # microseconds
-            return self.timestamp // 1000
-        return self.timestamp  # already milliseconds
+        return to_milliseconds(self.timestamp)
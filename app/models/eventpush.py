@@ -1,6 +1,5 @@
 """Eventpush model for webhook configuration."""
 
-import json
 import uuid
 
 from sqlalchemy import Boolean, String, Text
@@ -29,10 +28,10 @@ class Eventpush(Base):
         if not self.events:
             return []
         try:
-            return json.loads(self.events)
-        except json.JSONDecodeError:
+            return self._cached_json("events")
+        except ValueError:
             return []
 
     def set_events(self, events: list[str]) -> None:
         """Serialize events list to JSON."""
-        self.events = json.dumps(events) if events else None
+        self._store_json("events", events)
@@ -1,6 +1,5 @@
 """Inference model for inference server configuration."""
 
-import json
 from typing import Any
 
 from sqlalchemy import String, Text
@@ -30,23 +29,23 @@ class Inference(Base):
         if not self.settings:
             return {"version": "1.6.1", "configs": []}
         try:
-            return json.loads(self.settings)
-        except json.JSONDecodeError:
+            return self._cached_json("settings")
+        except ValueError:
             return {"version": "1.6.1", "configs": []}
 
     def set_settings(self, settings: dict[str, Any]) -> None:
         """Serialize settings to JSON."""
-        self.settings = json.dumps(settings) if settings else None
+        self._store_json("settings", settings)
 
     def get_node_settings(self) -> dict[str, Any]:
         """Deserialize node settings JSON."""
         if not self.node_settings:
             return {}
         try:
-            return json.loads(self.node_settings)
-        except json.JSONDecodeError:
+            return self._cached_json("node_settings")
+        except ValueError:
             return {}
 
     def set_node_settings(self, node_settings: dict[str, Any]) -> None:
         """Serialize node settings to JSON."""
-        self.node_settings = json.dumps(node_settings) if node_settings else None
+        self._store_json("node_settings", node_settings)
@@ -4,7 +4,7 @@ Ported from legacy Event Bridge (autocare_event_bridge_2.0).
 Manages physical alarm devices: I/O controllers, speakers, LED lights.
 """
 
-from sqlalchemy import Boolean, Integer, String, Text
+from sqlalchemy import Boolean, ForeignKey, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -33,7 +33,9 @@ class Sensor(Base):
 
     id: Mapped[str] = mapped_column(String(255), primary_key=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
-    type_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    type_id: Mapped[str] = mapped_column(
+        String(255), ForeignKey("sensor_types.id"), nullable=False, index=True
+    )
     ip: Mapped[str] = mapped_column(String(255), nullable=False, default="0.0.0.0")
     port: Mapped[int] = mapped_column(Integer, nullable=False, default=80)
 
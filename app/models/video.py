@@ -1,6 +1,5 @@
 """Video model for stream configuration."""
 
-import json
 from typing import Any
 
 from sqlalchemy import String, Text
@@ -32,10 +31,10 @@ class Video(Base):
                 "line_cross_point": "c:c",
             }
         try:
-            return json.loads(self.settings)
-        except json.JSONDecodeError:
+            return self._cached_json("settings")
+        except ValueError:
             return {}
 
     def set_settings(self, settings: dict[str, Any]) -> None:
         """Serialize settings to JSON."""
-        self.settings = json.dumps(settings) if settings else None
+        self._store_json("settings", settings)
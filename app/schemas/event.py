@@ -2,6 +2,8 @@
 
 from pydantic import BaseModel, Field, field_validator
 
+from app.models.event import to_milliseconds
+
 
 class EventObjectClassifier(BaseModel):
     """Event object classifier schema."""
@@ -65,12 +67,9 @@ class EventDTO(BaseModel):
         """Normalize timestamp to 13-digit milliseconds."""
         if v is None:
             return 0
-        ts_str = str(v)
-        if len(ts_str) == 10:  # seconds
-            return v * 1000
-        elif len(ts_str) == 16:  # microseconds
-            return v // 1000
-        return v
+        if not isinstance(v, int):
+            return v  # left to field validation
+        return to_milliseconds(v)
 
 
 class EventQueryParams(BaseModel):
@@ -23,6 +23,7 @@ class EventLogResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: str | None = None  # Pass as `cursor` to fetch the next page
 
 
 # Summary
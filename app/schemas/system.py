@@ -99,6 +99,15 @@ class SystemHealthResponse(BaseModel):
     model_config = {"populate_by_name": True}
 
 
+class LivenessResponse(BaseModel):
+    """Liveness probe response (process is up; no downstream checks)."""
+
+    status: str = "ok"
+    uptime_seconds: int = Field(..., alias="uptimeSeconds")
+
+    model_config = {"populate_by_name": True}
+
+
 class SystemStatusResponse(BaseModel):
     """System status summary response."""
 
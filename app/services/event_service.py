@@ -7,6 +7,7 @@ from typing import Any
 
 from sqlalchemy import and_, desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer_group
 
 from app.core.config import get_settings
 from app.models.event import Event
@@ -88,15 +89,15 @@ class EventService(BaseService[Event]):
             self.db.add(event)
             saved_events.append(event)
 
+        # ids are assigned at flush and the session keeps values after commit,
+        # so no refresh (which would also unload the deferred payload columns)
         await self.db.commit()
-        for event in saved_events:
-            await self.db.refresh(event)
 
         return saved_events
 
     async def get_events(self, params: EventQueryParams) -> EventPagedResponse:
         """Get paginated events with filters."""
-        query = select(Event)
+        query = select(Event).options(undefer_group("payload"))
 
         # Apply filters
         filters = []
@@ -1,5 +1,6 @@
 """Inference service for inference configuration management."""
 
+import asyncio
 from pathlib import Path
 
 from loguru import logger
@@ -233,8 +234,21 @@ class InferenceService(BaseService[Inference]):
         else:
             inferences = await self.get_all()
 
+        # Concurrent lookups coalesce into one GetInferenceStatusAll per app
+        grpc_statuses: list = [None] * len(inferences)
+        if self.grpc_client:
+            grpc_statuses = await asyncio.gather(
+                *(
+                    self.grpc_client.get_inference_status_batched(
+                        app_id=inf.app_id,
+                        video_id=inf.video_id,
+                    )
+                    for inf in inferences
+                )
+            )
+
         statuses = []
-        for inf in inferences:
+        for inf, grpc_status in zip(inferences, grpc_statuses):
             status = InferenceWithStatus(
                 app_id=inf.app_id,
                 video_id=inf.video_id,
@@ -243,18 +257,11 @@ class InferenceService(BaseService[Inference]):
                 eos=False,
                 err=False,
             )
-
-            # Get status from Core via gRPC
-            if self.grpc_client:
-                grpc_status = await self.grpc_client.get_inference_status(
-                    app_id=inf.app_id,
-                    video_id=inf.video_id,
-                )
-                if grpc_status:
-                    status.status = grpc_status.status
-                    status.count = grpc_status.count
-                    status.eos = grpc_status.eos
-                    status.err = grpc_status.err
+            if grpc_status:
+                status.status = grpc_status.status
+                status.count = grpc_status.count
+                status.eos = grpc_status.eos
+                status.err = grpc_status.err
 
             statuses.append(status)
 
@@ -1,5 +1,7 @@
 """Stream service for MediaMTX integration."""
 
+import asyncio
+import time
 from typing import Any
 
 import httpx
@@ -29,8 +31,17 @@ class StreamService:
         self._webrtc_url = env_settings.mediamtx_webrtc_url
         self._rtsp_url = env_settings.mediamtx_rtsp_url
         self._enabled = env_settings.mediamtx_enabled
-        self._timeout = 10.0
+        # Per-call timeouts replace the client's whole Timeout, so each one
+        # carries the fail-fast connect limit itself.
+        self._timeout = httpx.Timeout(10.0, connect=2.0)
+        self._status_timeout = httpx.Timeout(5.0, connect=2.0)
         self._settings_loaded = False
+        # Shared keep-alive client (set from app lifespan, lazily created otherwise)
+        self._client: httpx.AsyncClient | None = None
+        # Short-lived paths/list snapshot: (monotonic time fetched, items)
+        self._paths_cache: tuple[float, list[dict[str, Any]]] | None = None
+        self._paths_lock = asyncio.Lock()
+        self._paths_cache_ttl = env_settings.mediamtx_paths_cache_ttl
 
     async def _load_settings_from_db(self, db: AsyncSession) -> None:
         """Load settings from database if available."""
@@ -68,8 +79,41 @@ class StreamService:
         self._rtsp_url = rtsp_url
         self._enabled = enabled
         self._settings_loaded = True
+        self.invalidate_paths_cache()
         logger.info("MediaMTX settings updated in stream service")
 
+    def set_http_client(self, client: httpx.AsyncClient | None) -> None:
+        """Use a shared HTTP client (owned by the caller) for MediaMTX requests."""
+        self._client = client
+
+    def invalidate_paths_cache(self) -> None:
+        """Drop the cached paths/list response after a path change."""
+        self._paths_cache = None
+
+    def _cached_paths(self) -> list[dict[str, Any]] | None:
+        """Get cached paths/list items if still within the TTL."""
+        cached = self._paths_cache
+        if cached and time.monotonic() - cached[0] < self._paths_cache_ttl:
+            return cached[1]
+        return None
+
+    @staticmethod
+    def _path_status(data: dict[str, Any]) -> dict[str, Any]:
+        """Build a stream status dictionary from a MediaMTX path item."""
+        return {
+            "status": "ok",
+            "is_ready": data.get("ready", False),
+            "source_ready": data.get("sourceReady", False),
+            "readers_count": len(data.get("readers") or []),
+            "source": (data.get("source") or {}).get("type"),
+        }
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating one if none was provided."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient()
+        return self._client
+
     @property
     def api_url(self) -> str:
         return self._api_url
@@ -105,38 +149,40 @@ class StreamService:
             logger.warning("MediaMTX is disabled, skipping camera registration")
             return True
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    f"{self._api_url}/config/paths/add/{camera_id}",
+        client = self._get_client()
+        try:
+            response = await client.post(
+                f"{self._api_url}/config/paths/add/{camera_id}",
+                json={"source": rtsp_url},
+                timeout=self._timeout,
+            )
+
+            if response.status_code == 200:
+                logger.info(f"Camera {camera_id} registered with MediaMTX")
+                return True
+
+            # Path might already exist, try to patch instead
+            if response.status_code == 400:
+                patch_response = await client.patch(
+                    f"{self._api_url}/config/paths/patch/{camera_id}",
                     json={"source": rtsp_url},
                     timeout=self._timeout,
                 )
-
-                if response.status_code == 200:
-                    logger.info(f"Camera {camera_id} registered with MediaMTX")
+                if patch_response.status_code == 200:
+                    logger.info(f"Camera {camera_id} updated in MediaMTX")
                     return True
 
-                # Path might already exist, try to patch instead
-                if response.status_code == 400:
-                    patch_response = await client.patch(
-                        f"{self._api_url}/config/paths/patch/{camera_id}",
-                        json={"source": rtsp_url},
-                        timeout=self._timeout,
-                    )
-                    if patch_response.status_code == 200:
-                        logger.info(f"Camera {camera_id} updated in MediaMTX")
-                        return True
-
-                logger.error(
-                    f"Failed to register camera {camera_id}: "
-                    f"{response.status_code} - {response.text}"
-                )
-                return False
+            logger.error(
+                f"Failed to register camera {camera_id}: "
+                f"{response.status_code} - {response.text}"
+            )
+            return False
 
-            except httpx.RequestError as e:
-                logger.error(f"MediaMTX connection error for {camera_id}: {e}")
-                return False
+        except httpx.RequestError as e:
+            logger.error(f"MediaMTX connection error for {camera_id}: {e}")
+            return False
+        finally:
+            self.invalidate_paths_cache()
 
     async def unregister_camera(self, camera_id: str) -> bool:
         """
@@ -152,31 +198,33 @@ class StreamService:
             logger.warning("MediaMTX is disabled, skipping camera unregistration")
             return True
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.delete(
-                    f"{self._api_url}/config/paths/delete/{camera_id}",
-                    timeout=self._timeout,
-                )
+        client = self._get_client()
+        try:
+            response = await client.delete(
+                f"{self._api_url}/config/paths/delete/{camera_id}",
+                timeout=self._timeout,
+            )
 
-                if response.status_code == 200:
-                    logger.info(f"Camera {camera_id} removed from MediaMTX")
-                    return True
+            if response.status_code == 200:
+                logger.info(f"Camera {camera_id} removed from MediaMTX")
+                return True
 
-                # 404 is acceptable - camera might not have been registered
-                if response.status_code == 404:
-                    logger.warning(f"Camera {camera_id} not found in MediaMTX")
-                    return True
+            # 404 is acceptable - camera might not have been registered
+            if response.status_code == 404:
+                logger.warning(f"Camera {camera_id} not found in MediaMTX")
+                return True
 
-                logger.error(
-                    f"Failed to unregister camera {camera_id}: "
-                    f"{response.status_code} - {response.text}"
-                )
-                return False
+            logger.error(
+                f"Failed to unregister camera {camera_id}: "
+                f"{response.status_code} - {response.text}"
+            )
+            return False
 
-            except httpx.RequestError as e:
-                logger.error(f"MediaMTX connection error for {camera_id}: {e}")
-                return False
+        except httpx.RequestError as e:
+            logger.error(f"MediaMTX connection error for {camera_id}: {e}")
+            return False
+        finally:
+            self.invalidate_paths_cache()
 
     async def update_camera(self, camera_id: str, rtsp_url: str) -> bool:
         """
@@ -193,31 +241,33 @@ class StreamService:
             logger.warning("MediaMTX is disabled, skipping camera update")
             return True
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.patch(
-                    f"{self._api_url}/config/paths/patch/{camera_id}",
-                    json={"source": rtsp_url},
-                    timeout=self._timeout,
-                )
+        client = self._get_client()
+        try:
+            response = await client.patch(
+                f"{self._api_url}/config/paths/patch/{camera_id}",
+                json={"source": rtsp_url},
+                timeout=self._timeout,
+            )
 
-                if response.status_code == 200:
-                    logger.info(f"Camera {camera_id} updated in MediaMTX")
-                    return True
+            if response.status_code == 200:
+                logger.info(f"Camera {camera_id} updated in MediaMTX")
+                return True
 
-                # If path doesn't exist, create it
-                if response.status_code == 404:
-                    return await self.register_camera(camera_id, rtsp_url)
+            # If path doesn't exist, create it
+            if response.status_code == 404:
+                return await self.register_camera(camera_id, rtsp_url)
 
-                logger.error(
-                    f"Failed to update camera {camera_id}: "
-                    f"{response.status_code} - {response.text}"
-                )
-                return False
+            logger.error(
+                f"Failed to update camera {camera_id}: "
+                f"{response.status_code} - {response.text}"
+            )
+            return False
 
-            except httpx.RequestError as e:
-                logger.error(f"MediaMTX connection error for {camera_id}: {e}")
-                return False
+        except httpx.RequestError as e:
+            logger.error(f"MediaMTX connection error for {camera_id}: {e}")
+            return False
+        finally:
+            self.invalidate_paths_cache()
 
     async def get_stream_status(self, camera_id: str) -> dict[str, Any]:
         """
@@ -232,30 +282,28 @@ class StreamService:
         if not self._enabled:
             return {"status": "disabled", "message": "MediaMTX is disabled"}
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    f"{self._api_url}/paths/get/{camera_id}",
-                    timeout=5.0,
-                )
+        # Reuse a fresh paths/list snapshot (e.g. right after list_streams)
+        for path in self._cached_paths() or ():
+            if path.get("name") == camera_id:
+                return self._path_status(path)
 
-                if response.status_code == 200:
-                    data = response.json()
-                    return {
-                        "status": "ok",
-                        "is_ready": data.get("ready", False),
-                        "source_ready": data.get("sourceReady", False),
-                        "readers_count": len(data.get("readers", [])),
-                        "source": data.get("source", {}).get("type"),
-                    }
+        client = self._get_client()
+        try:
+            response = await client.get(
+                f"{self._api_url}/paths/get/{camera_id}",
+                timeout=self._status_timeout,
+            )
 
-                if response.status_code == 404:
-                    return {"status": "not_found", "message": "Camera not registered"}
+            if response.status_code == 200:
+                return self._path_status(response.json())
 
-                return {"status": "error", "message": response.text}
+            if response.status_code == 404:
+                return {"status": "not_found", "message": "Camera not registered"}
 
-            except httpx.RequestError as e:
-                return {"status": "error", "message": str(e)}
+            return {"status": "error", "message": response.text}
+
+        except httpx.RequestError as e:
+            return {"status": "error", "message": str(e)}
 
     async def get_all_paths(self) -> list[dict[str, Any]]:
         """
@@ -267,16 +315,27 @@ class StreamService:
         if not self._enabled:
             return []
 
-        async with httpx.AsyncClient() as client:
+        cached = self._cached_paths()
+        if cached is not None:
+            return list(cached)
+
+        async with self._paths_lock:
+            # A concurrent caller may have refreshed it while we waited
+            cached = self._cached_paths()
+            if cached is not None:
+                return list(cached)
+
+            client = self._get_client()
             try:
                 response = await client.get(
                     f"{self._api_url}/paths/list",
-                    timeout=5.0,
+                    timeout=self._status_timeout,
                 )
 
                 if response.status_code == 200:
-                    data = response.json()
-                    return data.get("items", [])
+                    items = response.json().get("items", [])
+                    self._paths_cache = (time.monotonic(), items)
+                    return list(items)
 
                 return []
 
@@ -300,25 +359,35 @@ class StreamService:
         """Generate RTSP URL for a camera."""
         return f"{self._rtsp_url}/{camera_id}"
 
+    def get_stream_urls(self, camera_id: str) -> tuple[str, str, str, str]:
+        """Generate (rtsp, hls, whep, whep_player) URLs for a camera in one call."""
+        webrtc = f"{self._webrtc_url}/{camera_id}"
+        return (
+            f"{self._rtsp_url}/{camera_id}",
+            f"{self._hls_url}/{camera_id}/index.m3u8",
+            f"{webrtc}/whep",
+            webrtc,
+        )
+
     async def health_check(self) -> dict[str, Any]:
         """Check MediaMTX server health."""
         if not self._enabled:
             return {"healthy": True, "message": "MediaMTX is disabled"}
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    f"{self._api_url}/paths/list",
-                    timeout=5.0,
-                )
+        client = self._get_client()
+        try:
+            response = await client.get(
+                f"{self._api_url}/paths/list",
+                timeout=self._status_timeout,
+            )
 
-                return {
-                    "healthy": response.status_code == 200,
-                    "status_code": response.status_code,
-                }
+            return {
+                "healthy": response.status_code == 200,
+                "status_code": response.status_code,
+            }
 
-            except httpx.RequestError as e:
-                return {"healthy": False, "error": str(e)}
+        except httpx.RequestError as e:
+            return {"healthy": False, "error": str(e)}
 
 
 # Singleton instance
@@ -1,5 +1,7 @@
 """User service for user management."""
 
+import asyncio
+
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -26,7 +28,8 @@ class UserService(BaseService[User]):
         user = await self.get_by_username(username)
         if not user:
             return None
-        if not verify_password(password, user.hashed_password):
+        # bcrypt is CPU-bound and releases the GIL: keep it off the event loop
+        if not await asyncio.to_thread(verify_password, password, user.hashed_password):
             return None
         return user
 
@@ -35,7 +38,7 @@ class UserService(BaseService[User]):
         user = await self.get_by_id(user_id)
         if not user:
             return False
-        user.hashed_password = get_password_hash(new_password)
+        user.hashed_password = await asyncio.to_thread(get_password_hash, new_password)
         await self.update(user)
         return True
 
@@ -50,7 +53,7 @@ class UserService(BaseService[User]):
         user = User(
             id=user_id,
             username=username,
-            hashed_password=get_password_hash(password),
+            hashed_password=await asyncio.to_thread(get_password_hash, password),
             is_active=True,
             is_superuser=is_superuser,
         )
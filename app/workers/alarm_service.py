@@ -39,6 +39,7 @@ class AlarmService:
     """
 
     INTERVAL_MS = 500  # Timer interval for duration countdown
+    RELOAD_DEBOUNCE_MS = 50  # Window for coalescing cache reload requests
 
     def __init__(self):
         # sensor_id -> list of AlarmMessage (with duration in ms)
@@ -51,6 +52,11 @@ class AlarmService:
         self._sensors: dict[str, SensorInfo] = {}
         self._sensor_types: dict[str, str] = {}  # type_id -> type_name
 
+        # Debounced cache reload (see schedule_reload)
+        self._reload_pending = False
+        self._reload_tasks: set[asyncio.Task] = set()
+        self._reload_lock = asyncio.Lock()
+
     async def start(self) -> None:
         """Start the alarm service.
 
@@ -93,6 +99,10 @@ class AlarmService:
             if isinstance(module, AEPELSpeakerAlarm):
                 await module.cleanup()
 
+        # Cancel pending cache reloads
+        for task in list(self._reload_tasks):
+            task.cancel()
+
         # Stop timer loop
         self._stop_event.set()
 
@@ -109,6 +119,35 @@ class AlarmService:
         await self._load_sensor_cache()
         logger.info("AlarmService sensor cache reloaded")
 
+    def schedule_reload(self) -> None:
+        """Schedule a debounced sensor cache reload.
+
+        Returns immediately. Requests arriving within RELOAD_DEBOUNCE_MS are
+        coalesced into a single reload_cache() run in the background.
+        """
+        if self._reload_pending:
+            return
+        self._reload_pending = True
+        task = asyncio.create_task(self._debounced_reload())
+        # Hold a strong reference until the reload finishes
+        self._reload_tasks.add(task)
+        task.add_done_callback(self._reload_tasks.discard)
+
+    async def _debounced_reload(self) -> None:
+        """Wait out the debounce window, then reload the sensor cache.
+
+        Reloads run one at a time so an older snapshot can never overwrite
+        a newer one.
+        """
+        await asyncio.sleep(self.RELOAD_DEBOUNCE_MS / 1000.0)
+        async with self._reload_lock:
+            # Clear before loading so writes committed during the reload schedule another
+            self._reload_pending = False
+            try:
+                await self.reload_cache()
+            except Exception as e:
+                logger.error(f"AlarmService cache reload failed: {e}")
+
     async def _load_sensor_cache(self) -> None:
         """Load sensors and sensor types from database into memory cache."""
         async with async_session_maker() as db:
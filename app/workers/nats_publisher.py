@@ -99,6 +99,17 @@ class NatsPublisher:
                 return False
         return True
 
+    async def ping(self, timeout: float = 1.0) -> bool:
+        """Round-trip a PING/PONG on the shared connection (health check).
+
+        Raises on flush timeout so callers can report the error.
+        """
+        if not await self._ensure_connected():
+            return False
+
+        await self._client.flush(timeout=timeout)
+        return True
+
     async def publish(self, subject: str, data: dict[str, Any]) -> bool:
         """Publish message to NATS subject (fire-and-forget)."""
         if not await self._ensure_connected():
@@ -10,7 +10,7 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from app.core.config import get_settings
 from app.db.base import Base
-from app.db import models_registry  # noqa: F401 - Import to register models
+from app.db.models_registry import register_all
 
 # Alembic Config object
 config = context.config
@@ -19,7 +19,8 @@ config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
-# Target metadata for 'autogenerate'
+# Target metadata for 'autogenerate' (with every model registered)
+register_all()
 target_metadata = Base.metadata
 
 # Get settings
@@ -1 +1,7 @@
 """Tests package."""
+
+import os
+
+# Fixture users are stored with "$plain$" hashes; must be set before app.core
+# modules read settings (this package is imported ahead of conftest)
+os.environ.setdefault("ALLOW_PLAIN_HASH", "true")
@@ -8,13 +8,16 @@ from typing import AsyncGenerator
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from app.api.v2 import sensors, system
 from app.core.config import Settings
-from app.core.deps import get_db
+from app.core.deps import get_db, invalidate_user_cache
 from app.core.security import create_access_token, get_password_hash
 from app.db.base import Base
-from app.db import models_registry  # noqa: F401 - Import to register models
+from app.db.models_registry import register_all
+from app.db.session import enable_sqlite_foreign_keys
 from app.main import app
 from app.models.event import Event
 from app.models.eventpush import Eventpush
@@ -22,6 +25,8 @@ from app.models.inference import Inference
 from app.models.user import User
 from app.models.video import Video
 
+register_all()
+
 # Test database URL (in-memory SQLite)
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
@@ -42,6 +47,7 @@ async def test_engine():
         echo=False,
         future=True,
     )
+    event.listen(engine.sync_engine, "connect", enable_sqlite_foreign_keys)
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -77,6 +83,10 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    # Each test gets a fresh database, so drop every process-wide cache of DB state
+    invalidate_user_cache()
+    sensors._invalidate_type_cache()
+    system._status_cache = None
 
     async with AsyncClient(
         transport=ASGITransport(app=app),
@@ -1,8 +1,24 @@
 """Tests for authentication endpoints."""
 
+import base64
+from datetime import timedelta
+
 import pytest
 from httpx import AsyncClient
-
+from jose import jwt
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import security
+from app.core.config import get_settings
+from app.core.deps import invalidate_user_cache
+from app.core.security import (
+    create_access_token,
+    decode_access_token,
+    get_password_hash,
+    get_token_data,
+    verify_password,
+)
 from app.models.user import User
 
 
@@ -69,6 +85,37 @@ async def test_change_password(
     assert data["status"] == "success"
 
 
+@pytest.mark.asyncio
+async def test_current_user_cached_by_token(
+    client: AsyncClient, db_session: AsyncSession, test_user: User, auth_headers: dict
+):
+    """Test repeat requests with the same token reuse the cached user."""
+    first = await client.get("/api/v2/system", headers=auth_headers)
+    assert first.status_code == 200
+
+    await db_session.execute(delete(User).where(User.id == test_user.id))
+    await db_session.commit()
+
+    cached = await client.get("/api/v2/system", headers=auth_headers)
+    assert cached.status_code == 200
+
+    invalidate_user_cache(test_user.id)
+    response = await client.get("/api/v2/system", headers=auth_headers)
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_deeply_nested_token_header_rejected(client: AsyncClient):
+    """Test a token whose header is deeply nested JSON gets 401, not 500."""
+    header = base64.urlsafe_b64encode(b"[" * 200000).rstrip(b"=").decode()
+    response = await client.get(
+        "/api/v2/system",
+        headers={"Authorization": f"Bearer {header}.e30.c2ln"},
+    )
+
+    assert response.status_code == 401
+
+
 @pytest.mark.asyncio
 async def test_change_password_unauthorized(client: AsyncClient, test_user: User):
     """Test password change without auth."""
@@ -92,3 +139,86 @@ async def test_change_other_user_password(
     )
 
     assert response.status_code == 403
+
+
+def test_decode_access_token_roundtrip():
+    """Test a freshly issued token decodes to its claims."""
+    token = create_access_token({"sub": "user-1"})
+
+    payload = decode_access_token(token)
+
+    assert payload is not None
+    assert payload["sub"] == "user-1"
+
+
+def test_decode_access_token_rejects_invalid():
+    """Test tampered, expired, foreign-audience and alg=none tokens are rejected."""
+    settings = get_settings()
+    token = create_access_token({"sub": "user-1"})
+    header, payload, signature = token.split(".")
+
+    tampered = f"{header}.{payload}.{signature[:-2]}AA"
+    expired = create_access_token({"sub": "user-1"}, timedelta(seconds=-10))
+    foreign = jwt.encode(
+        {"sub": "user-1", "iss": settings.jwt_issuer, "aud": "someone-else"},
+        settings.jwt_secret_key,
+        algorithm="HS256",
+    )
+    unsigned = jwt.encode({"sub": "user-1"}, "", algorithm="HS256").split(".")
+    none_header = "eyJhbGciOiJub25lIiwidHlwIjoiSldUIn0"  # {"alg":"none","typ":"JWT"}
+
+    assert decode_access_token(tampered) is None
+    assert decode_access_token(expired) is None
+    assert decode_access_token(foreign) is None
+    assert decode_access_token(f"{none_header}.{unsigned[1]}.") is None
+    assert decode_access_token("not-a-token") is None
+
+
+def test_decode_access_token_requires_exp():
+    """Test a correctly signed token without an exp claim is rejected."""
+    settings = get_settings()
+    no_exp = jwt.encode(
+        {"sub": "user-1", "iss": settings.jwt_issuer, "aud": settings.jwt_audience},
+        settings.jwt_secret_key,
+        algorithm="HS256",
+    )
+
+    assert decode_access_token(no_exp) is None
+
+
+def test_get_token_data_skips_claim_checks():
+    """Test get_token_data returns an expired token's claims but checks the signature."""
+    expired = create_access_token({"sub": "user-1"}, timedelta(seconds=-10))
+    header, payload, signature = expired.split(".")
+
+    data = get_token_data(expired)
+
+    assert data is not None
+    assert data["sub"] == "user-1"
+    assert get_token_data(f"{header}.{payload}.{signature[:-2]}AA") is None
+
+
+def test_decode_access_token_cached(monkeypatch: pytest.MonkeyPatch):
+    """Test a verified token is served from cache without re-verifying."""
+    token = create_access_token({"sub": "user-cached"})
+    assert decode_access_token(token) is not None
+
+    def fail(_token: str):
+        raise AssertionError("token was verified again")
+
+    monkeypatch.setattr(security, "_verify_access_token", fail)
+
+    payload = decode_access_token(token)
+
+    assert payload is not None
+    assert payload["sub"] == "user-cached"
+
+
+def test_password_hash_truncates_multibyte_to_72_bytes():
+    """Test passwords over 72 UTF-8 bytes (but under 72 chars) hash and verify."""
+    password = "비밀번호" * 10  # 40 chars, 120 bytes
+
+    hashed = get_password_hash(password, rounds=4)
+
+    assert verify_password(password, hashed)
+    assert not verify_password("비밀번호", hashed)
@@ -1,8 +1,13 @@
 """Tests for inference endpoints."""
 
+import grpc
 import pytest
 from httpx import AsyncClient
 
+from app.core.deps import get_db
+from app.grpc import get_grpc_client, set_grpc_client
+from app.grpc.detector_client import InferenceStatus
+from app.main import app
 from app.models.inference import Inference
 from app.models.video import Video
 
@@ -153,3 +158,85 @@ async def test_get_inference_status(
     assert response.status_code == 200
     data = response.json()
     assert isinstance(data, list)
+
+
+class FakePreviewClient:
+    """Stands in for DetectorClient.preview_image_stream."""
+
+    def __init__(self, frames=(), error=None, on_frame=None):
+        self._frames = frames
+        self._error = error
+        self._on_frame = on_frame
+
+    async def preview_image_stream(self, app_id: str, video_id: str):
+        if self._error:
+            raise self._error
+        for frame in self._frames:
+            if self._on_frame:
+                self._on_frame()
+            yield InferenceStatus(status=3, count=0, eos=False, err=False, image=frame)
+
+
+@pytest.fixture
+def preview_client():
+    """Install a fake gRPC client for the preview stream, restoring the old one."""
+    previous = get_grpc_client()
+    yield lambda fake: set_grpc_client(fake)
+    set_grpc_client(previous)
+
+
+@pytest.mark.asyncio
+async def test_stream_preview_releases_db_before_streaming(
+    client: AsyncClient, db_session, auth_headers: dict, preview_client
+):
+    """Test MJPEG frames are streamed after the auth session is closed."""
+    closed = []
+    seen_closed = []
+
+    async def tracked_get_db():
+        try:
+            yield db_session
+        finally:
+            closed.append(True)
+
+    app.dependency_overrides[get_db] = tracked_get_db
+    preview_client(
+        FakePreviewClient(
+            frames=[b"jpeg-1", b"jpeg-2"], on_frame=lambda: seen_closed.append(bool(closed))
+        )
+    )
+
+    response = await client.get(
+        "/api/v2/inference/preview/stream",
+        params={"appId": "app1", "videoId": "cam1"},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("multipart/x-mixed-replace")
+    assert b"jpeg-1" in response.content and b"jpeg-2" in response.content
+    # The first frame is pulled by the handler, later ones while streaming
+    assert seen_closed == [False, True]
+
+
+@pytest.mark.asyncio
+async def test_stream_preview_unsupported_or_empty(
+    client: AsyncClient, auth_headers: dict, preview_client
+):
+    """Test an unimplemented RPC maps to 501 and an empty stream to 404."""
+    params = {"appId": "app1", "videoId": "cam1"}
+    unimplemented = grpc.aio.AioRpcError(
+        grpc.StatusCode.UNIMPLEMENTED, grpc.aio.Metadata(), grpc.aio.Metadata(), "no method"
+    )
+
+    preview_client(FakePreviewClient(error=unimplemented))
+    response = await client.get(
+        "/api/v2/inference/preview/stream", params=params, headers=auth_headers
+    )
+    assert response.status_code == 501
+
+    preview_client(FakePreviewClient())
+    response = await client.get(
+        "/api/v2/inference/preview/stream", params=params, headers=auth_headers
+    )
+    assert response.status_code == 404
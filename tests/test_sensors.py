@@ -0,0 +1,193 @@
+"""Tests for sensor (alarm device) endpoints."""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v2 import sensors
+from app.models.sensor import SensorType
+
+
+@pytest.mark.asyncio
+async def test_create_sensor(client: AsyncClient, auth_headers: dict):
+    """Test creating a sensor for a seeded sensor type."""
+    await client.post("/api/v2/sensors/types/seed", headers=auth_headers)
+
+    response = await client.post(
+        "/api/v2/sensors",
+        json={"name": "Gate LED", "typeId": "type_led", "ip": "10.0.0.5", "port": 5000},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 201
+    data = response.json()
+    assert data["name"] == "Gate LED"
+    assert data["typeId"] == "type_led"
+    assert data["id"]
+
+
+@pytest.mark.asyncio
+async def test_seed_sensor_types_idempotent(client: AsyncClient, auth_headers: dict):
+    """Test seeding only creates the default types that are missing."""
+    first = await client.post("/api/v2/sensors/types/seed", headers=auth_headers)
+    assert first.json()["created"] == 4
+
+    await client.delete("/api/v2/sensors/types/type_led", headers=auth_headers)
+
+    second = await client.post("/api/v2/sensors/types/seed", headers=auth_headers)
+    assert second.json()["created"] == 1
+
+    types = await client.get("/api/v2/sensors/types", headers=auth_headers)
+    assert len(types.json()) == 4
+
+
+@pytest.mark.asyncio
+async def test_create_sensor_unknown_type(client: AsyncClient, auth_headers: dict):
+    """Test creating a sensor with a non-existent type is rejected."""
+    response = await client.post(
+        "/api/v2/sensors",
+        json={"name": "Orphan", "typeId": "type_missing"},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_update_sensor_unknown_type(client: AsyncClient, auth_headers: dict):
+    """Test changing a sensor to a non-existent type is rejected."""
+    await client.post("/api/v2/sensors/types/seed", headers=auth_headers)
+    create = await client.post(
+        "/api/v2/sensors",
+        json={"id": "sensor-1", "name": "Speaker", "typeId": "type_speaker"},
+        headers=auth_headers,
+    )
+    assert create.status_code == 201
+
+    response = await client.put(
+        "/api/v2/sensors/sensor-1",
+        json={"typeId": "type_missing"},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_sensors_filtered_by_type(client: AsyncClient, auth_headers: dict):
+    """Test listing sensors uses camelCase aliases and honours typeId filter."""
+    await client.post("/api/v2/sensors/types/seed", headers=auth_headers)
+    for sensor_id, type_id in (("s-led", "type_led"), ("s-spk", "type_speaker")):
+        await client.post(
+            "/api/v2/sensors",
+            json={"id": sensor_id, "name": sensor_id, "typeId": type_id},
+            headers=auth_headers,
+        )
+
+    response = await client.get(
+        "/api/v2/sensors", params={"typeId": "type_led"}, headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [s["id"] for s in data] == ["s-led"]
+    assert data[0]["maxTime"] == 120
+
+    types = await client.get("/api/v2/sensors/types", headers=auth_headers)
+    assert {t["name"] for t in types.json()} >= {"Adam6050", "LA6_POE"}
+
+
+@pytest.mark.asyncio
+async def test_sensor_type_cache_invalidated_on_write(client: AsyncClient, auth_headers: dict):
+    """Test sensor type writes are visible through the cached list endpoint."""
+    before = await client.get("/api/v2/sensors/types", headers=auth_headers)
+    assert before.json() == []
+
+    created = await client.post(
+        "/api/v2/sensors/types",
+        json={"id": "type_custom", "name": "Custom"},
+        headers=auth_headers,
+    )
+    assert created.status_code == 201
+
+    after = await client.get("/api/v2/sensors/types", headers=auth_headers)
+    assert [t["id"] for t in after.json()] == ["type_custom"]
+
+    deleted = await client.delete("/api/v2/sensors/types/type_custom", headers=auth_headers)
+    assert deleted.status_code == 200
+    missing = await client.get("/api/v2/sensors/types/type_custom", headers=auth_headers)
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_sensor_type_cache_expires(
+    client: AsyncClient,
+    auth_headers: dict,
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test types written outside this process show up once the cache expires."""
+    before = await client.get("/api/v2/sensors/types", headers=auth_headers)
+    assert before.json() == []
+
+    # Simulates a write handled by another worker: no local invalidation
+    db_session.add(SensorType(id="type_other", name="Other"))
+    await db_session.commit()
+
+    cached = await client.get("/api/v2/sensors/types", headers=auth_headers)
+    assert cached.json() == []
+
+    monkeypatch.setattr(sensors, "_type_cache", (0.0, sensors._type_cache[1]))
+    after = await client.get("/api/v2/sensors/types", headers=auth_headers)
+    assert [t["id"] for t in after.json()] == ["type_other"]
+
+
+@pytest.mark.asyncio
+async def test_update_sensor_partial(client: AsyncClient, auth_headers: dict):
+    """Test update only writes the provided fields."""
+    await client.post("/api/v2/sensors/types/seed", headers=auth_headers)
+    await client.post(
+        "/api/v2/sensors",
+        json={"id": "sensor-2", "name": "Tower", "typeId": "type_led", "port": 5000},
+        headers=auth_headers,
+    )
+
+    response = await client.put(
+        "/api/v2/sensors/sensor-2",
+        json={"ip": "10.0.0.9", "maxTime": 30},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["ip"] == "10.0.0.9"
+    assert data["maxTime"] == 30
+    assert data["name"] == "Tower"
+    assert data["port"] == 5000
+
+    fetched = await client.get("/api/v2/sensors/sensor-2", headers=auth_headers)
+    assert fetched.json()["ip"] == "10.0.0.9"
+
+    missing = await client.put("/api/v2/sensors/nope", json={"ip": "1.1.1.1"}, headers=auth_headers)
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_delete_sensor_type_in_use(client: AsyncClient, auth_headers: dict):
+    """Test a sensor type referenced by a sensor cannot be deleted."""
+    await client.post("/api/v2/sensors/types/seed", headers=auth_headers)
+    await client.post(
+        "/api/v2/sensors",
+        json={"id": "sensor-3", "name": "Moxa", "typeId": "type_moxa"},
+        headers=auth_headers,
+    )
+
+    response = await client.delete("/api/v2/sensors/types/type_moxa", headers=auth_headers)
+    assert response.status_code == 400
+
+    duplicate = await client.post(
+        "/api/v2/sensors",
+        json={"id": "sensor-3", "name": "Again", "typeId": "type_moxa"},
+        headers=auth_headers,
+    )
+    assert duplicate.status_code == 409
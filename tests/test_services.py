@@ -1,10 +1,17 @@
 """Tests for service layer."""
 
+import asyncio
+import itertools
 import json
 import time
+from types import SimpleNamespace
 
+import httpx
 import pytest
+from sqlalchemy import select
 
+from app.grpc import autocare_pb2, detector_client
+from app.grpc.detector_client import DetectorClient
 from app.models.event import Event
 from app.models.user import User
 from app.models.video import Video
@@ -12,8 +19,10 @@ from app.schemas.event import EventQueryParams
 from app.schemas.video import VideoCreate, VideoSettings
 from app.services.auth_service import AuthService
 from app.services.event_service import EventService
+from app.services.stream_service import StreamService
 from app.services.user_service import UserService
 from app.services.video_service import VideoService
+from app.workers.alarm_service import AlarmService
 
 
 @pytest.mark.asyncio
@@ -173,6 +182,23 @@ async def test_event_service_get_trend(db_session, sample_events: list[Event]):
     assert isinstance(result.total, list)
 
 
+@pytest.mark.asyncio
+async def test_event_payload_columns_load_only_for_event_list(
+    db_session, sample_events: list[Event]
+):
+    """objects/desc are deferred except where events are turned into DTOs."""
+    db_session.expunge_all()
+
+    event = (await db_session.execute(select(Event).limit(1))).scalar_one()
+    assert "objects" not in event.__dict__
+    assert "desc" not in event.__dict__
+
+    db_session.expunge_all()
+    result = await EventService(db_session).get_events(EventQueryParams(paging_size=1))
+    assert result.events[0].objects
+    assert result.events[0].desc.startswith("Event description")
+
+
 @pytest.mark.asyncio
 async def test_event_model_timestamp_normalization():
     """Test event timestamp normalization."""
@@ -207,3 +233,357 @@ async def test_event_model_objects_serialization():
     loaded = event.get_objects()
     assert len(loaded) == 2
     assert loaded[0]["label"] == "person"
+
+
+@pytest.mark.asyncio
+async def test_alarm_service_schedule_reload_coalesces():
+    """Test bursts of reload requests collapse into one cache reload."""
+    service = AlarmService()
+    reloads = 0
+
+    async def fake_reload() -> None:
+        nonlocal reloads
+        reloads += 1
+
+    service.reload_cache = fake_reload
+
+    for _ in range(5):
+        service.schedule_reload()
+    await asyncio.sleep(service.RELOAD_DEBOUNCE_MS / 1000 * 3)
+    assert reloads == 1
+
+    service.schedule_reload()
+    await asyncio.sleep(service.RELOAD_DEBOUNCE_MS / 1000 * 3)
+    assert reloads == 2
+
+
+@pytest.mark.asyncio
+async def test_alarm_service_reloads_do_not_overlap():
+    """Test a reload scheduled during a running reload waits for it to finish."""
+    service = AlarmService()
+    running = 0
+    max_running = 0
+    reloads = 0
+
+    async def slow_reload() -> None:
+        nonlocal running, max_running, reloads
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(service.RELOAD_DEBOUNCE_MS / 1000 * 2)
+        running -= 1
+        reloads += 1
+
+    service.reload_cache = slow_reload
+
+    service.schedule_reload()
+    await asyncio.sleep(service.RELOAD_DEBOUNCE_MS / 1000 * 1.5)
+    service.schedule_reload()
+    assert len(service._reload_tasks) == 2
+
+    await asyncio.sleep(service.RELOAD_DEBOUNCE_MS / 1000 * 6)
+    assert reloads == 2
+    assert max_running == 1
+    assert not service._reload_tasks
+
+
+@pytest.mark.asyncio
+async def test_stream_service_paths_cache():
+    """Test paths/list is reused within the TTL and dropped after a path change."""
+    requests: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        if request.url.path.endswith("/paths/list"):
+            return httpx.Response(
+                200, json={"items": [{"name": "cam1", "ready": True, "readers": []}]}
+            )
+        return httpx.Response(200, json={})
+
+    service = StreamService()
+    service._enabled = True
+    service._paths_cache_ttl = 60.0
+    service.set_http_client(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    assert [p["name"] for p in await service.get_all_paths()] == ["cam1"]
+    await service.get_all_paths()
+    status = await service.get_stream_status("cam1")
+    assert status["is_ready"] is True
+    assert len(requests) == 1
+
+    await service.unregister_camera("cam1")
+    await service.get_all_paths()
+    assert sum(path.endswith("/paths/list") for path in requests) == 2
+
+
+@pytest.fixture
+def stub_client():
+    """Build a DetectorClient whose channel pool is a single fake stub.
+
+    Keyword arguments are the stub's RPC methods, e.g. GetAppList=fake_list.
+    """
+
+    def make(**rpcs) -> DetectorClient:
+        client = DetectorClient(address="localhost:0")
+        client._stub_cycle = itertools.cycle([SimpleNamespace(**rpcs)])
+        return client
+
+    return make
+
+
+@pytest.mark.asyncio
+async def test_detector_client_batches_status_requests(stub_client):
+    """Test concurrent status lookups share one GetInferenceStatusAll per app."""
+    calls: list[str] = []
+
+    async def get_status_all(request):
+        calls.append(f"all:{request.app_id}")
+        return autocare_pb2.InferenceResList(
+            inference=[autocare_pb2.InferenceRes(count=5, status=3, stream_id="cam1")]
+        )
+
+    async def get_status(request):
+        calls.append(f"one:{request.stream_id}")
+        return autocare_pb2.InferenceRes(count=1, status=1)
+
+    client = stub_client(GetInferenceStatusAll=get_status_all, GetInferenceStatus=get_status)
+
+    cam1, cam2 = await asyncio.gather(
+        client.get_inference_status_batched("app1", "cam1"),
+        client.get_inference_status_batched("app1", "cam2"),
+    )
+
+    assert (cam1.status, cam1.count) == (3, 5)
+    # Not in the batch response: answered by the per-stream fallback
+    assert (cam2.status, cam2.count) == (1, 1)
+    assert calls == ["all:app1", "one:cam2"]
+
+
+@pytest.mark.asyncio
+async def test_detector_client_cancelled_status_flush_releases_callers(stub_client):
+    """Test callers waiting on a cancelled status flush don't hang."""
+    started = asyncio.Event()
+
+    async def get_status_all(request):
+        started.set()
+        await asyncio.sleep(10)
+
+    client = stub_client(GetInferenceStatusAll=get_status_all)
+
+    # Cancelled during the batch window, then while its RPCs are running
+    for cancel_mid_rpc in (False, True):
+        waiter = asyncio.create_task(client.get_inference_status_batched("app1", "cam1"))
+        await asyncio.sleep(0)
+        flush = client._status_flush
+        if cancel_mid_rpc:
+            await started.wait()
+        flush.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(waiter, timeout=1)
+        assert client._status_flush is None
+        assert not client._status_waiters
+        assert not client._status_flush_tasks
+
+
+@pytest.mark.asyncio
+async def test_detector_client_reuses_cleared_requests(stub_client):
+    """Test per-stream RPCs reuse one pooled InferenceReq without leaking fields."""
+    seen: list[tuple[int, str, str, str]] = []
+
+    async def update_inference(request):
+        seen.append((id(request), request.app_id, request.stream_id, request.name))
+        return autocare_pb2.InferenceRes(count=1)
+
+    async def get_status(request):
+        seen.append((id(request), request.app_id, request.stream_id, request.name))
+        return autocare_pb2.InferenceRes(count=2, status=3)
+
+    client = stub_client(UpdateInference=update_inference, GetInferenceStatus=get_status)
+
+    assert await client.update_inference("app1", "cam1", name="front door") == 1
+    status = await client.get_inference_status("app2", "cam2")
+
+    assert (status.status, status.count) == (3, 2)
+    assert seen[0][1:] == ("app1", "cam1", "front door")
+    # Same message object, with the previous call's name cleared
+    assert seen[1] == (seen[0][0], "app2", "cam2", "")
+
+
+@pytest.mark.asyncio
+async def test_detector_client_preview_image_stream(stub_client):
+    """Test preview frames are yielded from one SubscribePreviewImages call."""
+    requests = []
+
+    class FakeCall:
+        def __init__(self, frames):
+            self._frames = iter(frames)
+            self.cancelled = False
+
+        def __aiter__(self):
+            return self
+
+        async def __anext__(self):
+            try:
+                return next(self._frames)
+            except StopIteration:
+                raise StopAsyncIteration from None
+
+        def cancel(self):
+            self.cancelled = True
+
+    call = FakeCall([
+        autocare_pb2.InferenceRes(status=3, snapshot=b"jpeg-1"),
+        autocare_pb2.InferenceRes(status=3, snapshot=b"jpeg-2"),
+    ])
+
+    def subscribe_preview_images(request):
+        requests.append((request.app_id, request.stream_id))
+        return call
+
+    client = stub_client(SubscribePreviewImages=subscribe_preview_images)
+
+    frames = [s.image async for s in client.preview_image_stream("app1", "cam1")]
+
+    assert frames == [b"jpeg-1", b"jpeg-2"]
+    assert requests == [("app1", "cam1")]
+    assert call.cancelled
+
+
+@pytest.mark.asyncio
+async def test_detector_client_connects_lazily_once(stub_client):
+    """Test concurrent first RPCs share a single lazy connect()."""
+    connects = 0
+
+    async def get_status(request):
+        return autocare_pb2.InferenceRes(count=1, status=3)
+
+    # Not connected yet: fake_connect installs the stub on first use
+    client = stub_client(GetInferenceStatus=get_status)
+    stub_cycle, client._stub_cycle = client._stub_cycle, None
+
+    async def fake_connect():
+        nonlocal connects
+        connects += 1
+        await asyncio.sleep(0)
+        client._stub_cycle = stub_cycle
+
+    client.connect = fake_connect
+
+    results = await asyncio.gather(
+        *(client.get_inference_status("app1", f"cam{i}") for i in range(3))
+    )
+
+    assert connects == 1
+    assert [r.status for r in results] == [3, 3, 3]
+
+
+@pytest.mark.asyncio
+async def test_detector_client_install_app_sends_serialized_chunks(monkeypatch):
+    """Test install_app streams pre-encoded 1MB AppReq chunks."""
+    monkeypatch.setattr(detector_client, "_INSTALL_CHUNK_SIZE", 4)
+    received: list[autocare_pb2.AppReq] = []
+
+    async def fake_install_app(chunks, timeout):
+        async for data in chunks:
+            received.append(autocare_pb2.AppReq.FromString(data))
+        return autocare_pb2.AppRes(result=True)
+
+    client = DetectorClient(address="localhost:0")
+    client._stub_cycle = itertools.cycle([object()])
+    client._install_app = fake_install_app
+
+    assert await client.install_app(b"0123456789", "app1") is True
+    assert [(r.app_id, r.chunk) for r in received] == [
+        ("app1", b"0123"),
+        ("app1", b"4567"),
+        ("app1", b"89"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_detector_client_warm_up_gives_up_quietly():
+    """Test warm_up connects and returns on timeout when Core is unreachable."""
+    client = DetectorClient(address="127.0.0.1:1", pool_size=2)
+
+    await client.warm_up(timeout=0.05)
+
+    assert len(client._channels) == 2
+    await client.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_detector_client_caches_app_list_until_install(stub_client):
+    """Test GetAppList is shared and cached, and refreshed after an install."""
+    calls = 0
+
+    async def get_app_list(request):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return autocare_pb2.AppList(app=[autocare_pb2.App(id="app1", name="App 1")])
+
+    async def fake_install_app(chunks, timeout):
+        async for _ in chunks:
+            pass
+        return autocare_pb2.AppRes(result=True)
+
+    client = stub_client(GetAppList=get_app_list)
+    client._install_app = fake_install_app
+
+    first, second = await asyncio.gather(client.get_app_list(), client.get_app_list())
+    await client.get_app_list()
+    assert calls == 1
+    assert [a.id for a in first] == [a.id for a in second] == ["app1"]
+
+    await client.install_app(b"pkg", "app2")
+    await client.get_app_list()
+    assert calls == 2
+
+    # An install finishing while a fetch is in flight: that result isn't cached
+    client._invalidate_info("apps")
+    in_flight = asyncio.create_task(client.get_app_list())
+    await asyncio.sleep(0)
+    client._invalidate_info("apps")
+    await in_flight
+    assert calls == 3
+    assert "apps" not in client._info_cache
+
+
+def test_event_objects_parse_is_cached_until_reassigned():
+    """Test get_objects reuses its parse until the column value changes."""
+    event = Event(objects='[{"label": "person"}]')
+
+    first = event.get_objects()
+    assert event.get_objects() is first
+    assert first == [{"label": "person"}]
+
+    event.objects = '[{"label": "car"}]'
+    assert event.get_objects() == [{"label": "car"}]
+
+    event.objects = "not json"
+    assert event.get_objects() == []
+
+
+def test_event_set_objects_primes_parse_cache():
+    """Test set_objects stores JSON once and reads back without re-parsing."""
+    event = Event()
+    objects = [{"label": "person", "score": 0.9}]
+
+    event.set_objects(objects)
+
+    assert json.loads(event.objects) == objects
+    assert event.object_type == "person"
+    assert event.get_objects() is objects
+
+
+def test_event_object_type_follows_direct_objects_assignment():
+    """Test assigning objects directly (list or JSON) keeps object_type in sync."""
+    event = Event(objects='[{"label": "car"}, {"label": "person"}]')
+    assert event.object_type == "car"
+
+    event.objects = [{"label": "truck"}]
+    assert json.loads(event.objects) == [{"label": "truck"}]
+    assert event.object_type == "truck"
+
+    event.objects = None
+    assert event.object_type is None
@@ -0,0 +1,179 @@
+"""Tests for statistics endpoints."""
+
+import json
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.camera import Camera
+from app.models.event import Event
+
+
+def _ts(*args: int) -> int:
+    """Local-time datetime to millisecond timestamp (matches the endpoint math)."""
+    return int(datetime(*args).timestamp() * 1000)
+
+
+@pytest_asyncio.fixture(scope="function")
+async def stats_events(db_session: AsyncSession) -> list[Event]:
+    """Create events on fixed dates for deterministic bucketing."""
+    db_session.add(Camera(id="cam1", name="Front Gate", rtsp_url="rtsp://10.0.0.1/stream"))
+    rows = [
+        (1, "cam1", "person", _ts(2024, 12, 28, 1, 30)),
+        (2, "cam1", "person", _ts(2024, 12, 28, 1, 45)),
+        (3, "cam1", "car", _ts(2024, 12, 28, 23, 0)),
+        (4, "cam2", "car", _ts(2024, 11, 2, 12, 0)),
+        (5, "cam2", "person", _ts(2024, 2, 10, 8, 0)),
+    ]
+    events = []
+    for event_id, video_id, label, ts in rows:
+        event = Event(
+            id=event_id,
+            video_id=video_id,
+            video_name=f"{video_id} stream",
+            app_id="app-detection",
+            timestamp=ts,
+            objects=json.dumps([{"label": label}]),
+            object_type=label,
+        )
+        events.append(event)
+        db_session.add(event)
+    await db_session.commit()
+    return events
+
+
+@pytest.mark.asyncio
+async def test_get_event_log(client: AsyncClient, stats_events: list[Event], auth_headers: dict):
+    """Test event log is ordered newest first and resolves camera names."""
+    response = await client.get(
+        "/api/v2/statistics/events",
+        params={"page_size": 2},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == len(stats_events)
+    assert [item["id"] for item in data["items"]] == ["3", "2"]
+    assert data["items"][0]["camera_name"] == "Front Gate"
+    assert data["items"][0]["timestamp"].endswith("Z")
+
+
+@pytest.mark.asyncio
+async def test_get_summary(client: AsyncClient, stats_events: list[Event], auth_headers: dict):
+    """Test summary aggregates counts per camera and event type."""
+    response = await client.get(
+        "/api/v2/statistics/summary",
+        params={"unit": "month", "date": "2024-12"},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    items = {(item["camera_id"], item["event_type"]): item for item in response.json()["items"]}
+    assert items[("cam1", "person")]["count"] == 2
+    assert items[("cam1", "person")]["camera_name"] == "Front Gate"
+    assert items[("cam1", "car")]["count"] == 1
+    assert ("cam2", "car") not in items
+
+
+@pytest.mark.asyncio
+async def test_get_trend_day(client: AsyncClient, stats_events: list[Event], auth_headers: dict):
+    """Test hourly trend buckets for a single day."""
+    response = await client.get(
+        "/api/v2/statistics/trend",
+        params={"unit": "day", "date": "2024-12-28"},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    series = {s["event_type"]: s["data"] for s in response.json()["series"]}
+    assert series["person"][1] == 2
+    assert series["car"][23] == 1
+    assert sum(series["total"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_get_trend_year(client: AsyncClient, stats_events: list[Event], auth_headers: dict):
+    """Test quarterly trend buckets for a year."""
+    response = await client.get(
+        "/api/v2/statistics/trend",
+        params={"unit": "year", "date": "2024"},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    series = {s["event_type"]: s["data"] for s in response.json()["series"]}
+    assert series["person"] == [1, 0, 0, 2]
+    assert series["car"] == [0, 0, 0, 2]
+    assert series["total"] == [1, 0, 0, 4]
+
+
+@pytest.mark.asyncio
+async def test_get_trend_quarter(
+    client: AsyncClient, stats_events: list[Event], auth_headers: dict
+):
+    """Test monthly trend buckets for a quarter."""
+    response = await client.get(
+        "/api/v2/statistics/trend",
+        params={"unit": "quarter", "date": "2024-Q4"},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    series = {s["event_type"]: s["data"] for s in response.json()["series"]}
+    assert series["person"] == [0, 0, 2]
+    assert series["car"] == [0, 1, 1]
+    assert series["total"] == [0, 1, 3]
+
+
+@pytest.mark.asyncio
+async def test_get_trend_empty_returns_example(client: AsyncClient, auth_headers: dict):
+    """Test trend falls back to example data when there are no events."""
+    response = await client.get(
+        "/api/v2/statistics/trend",
+        params={"unit": "quarter", "date": "2024-Q4"},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["labels"] == ["Month 1", "Month 2", "Month 3"]
+    assert data["series"][0]["event_type"] == "total"
+
+
+@pytest.mark.asyncio
+async def test_get_event_log_cursor_pagination(
+    client: AsyncClient, stats_events: list[Event], auth_headers: dict
+):
+    """Test walking the event log with next_cursor visits every event once."""
+    seen = []
+    params = {"page_size": 2}
+    while True:
+        response = await client.get(
+            "/api/v2/statistics/events", params=params, headers=auth_headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        seen.extend(item["id"] for item in data["items"])
+        if not data["next_cursor"]:
+            break
+        params = {"page_size": 2, "cursor": data["next_cursor"]}
+
+    assert seen == ["3", "2", "1", "4", "5"]
+
+
+@pytest.mark.asyncio
+async def test_get_event_log_invalid_cursor(
+    client: AsyncClient, stats_events: list[Event], auth_headers: dict
+):
+    """Test a malformed cursor is rejected."""
+    response = await client.get(
+        "/api/v2/statistics/events",
+        params={"cursor": "not-a-cursor"},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 400
@@ -0,0 +1,71 @@
+"""Tests for stream (MediaMTX) endpoints."""
+
+import pytest
+from httpx import AsyncClient
+
+from app.services.stream_service import stream_service
+
+MEDIAMTX_PATHS = [
+    {
+        "name": "cam1",
+        "ready": True,
+        "sourceReady": True,
+        "source": {"type": "rtspSource"},
+        "readers": [{"type": "webRTCSession"}, {"type": "hlsMuxer"}],
+    },
+    {"name": "cam2", "ready": None, "source": None, "readers": None},
+    # Paths without a name are skipped
+    {"name": "", "ready": True},
+]
+
+
+@pytest.fixture
+def mediamtx_paths(monkeypatch):
+    """Serve a fixed MediaMTX path list instead of calling the API."""
+
+    async def fake_get_all_paths():
+        return MEDIAMTX_PATHS
+
+    monkeypatch.setattr(stream_service, "get_all_paths", fake_get_all_paths)
+    return MEDIAMTX_PATHS
+
+
+@pytest.mark.asyncio
+async def test_list_streams(client: AsyncClient, mediamtx_paths: list[dict]):
+    """Test streams are listed with playback URLs and normalized fields."""
+    response = await client.get("/api/v2/streams")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 2
+
+    cam1, cam2 = data["streams"]
+    assert cam1["ready"] is True
+    assert cam1["source_type"] == "rtspSource"
+    assert cam1["readers_count"] == 2
+    assert cam1["urls"] == {
+        "rtsp": stream_service.get_rtsp_url("cam1"),
+        "hls": stream_service.get_hls_url("cam1"),
+        "whep": stream_service.get_webrtc_url("cam1"),
+        "whep_player": stream_service.get_webrtc_player_url("cam1"),
+    }
+
+    assert cam2["ready"] is False
+    assert cam2["source_type"] is None
+    assert cam2["readers_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_list_streams_etag(client: AsyncClient, mediamtx_paths: list[dict]):
+    """Test an unchanged stream list answers 304 for a matching If-None-Match."""
+    first = await client.get("/api/v2/streams")
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "private, max-age=3"
+
+    cached = await client.get("/api/v2/streams", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    stale = await client.get("/api/v2/streams", headers={"If-None-Match": '"stale"'})
+    assert stale.status_code == 200
+    assert stale.json()["total"] == 2
@@ -0,0 +1,235 @@
+"""Tests for system endpoints."""
+
+import asyncio
+import json
+import time
+from pathlib import Path
+
+import grpc
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v2 import system
+from app.db import session
+from app.main import (
+    background_tasks,
+    global_exception_handler,
+    spawn_background_task,
+    stop_background_services,
+)
+from app.models.event import Event
+from app.models.eventpush import Eventpush
+from app.models.image import Image
+from app.models.inference import Inference
+
+
+@pytest.mark.asyncio
+async def test_get_system_status(
+    client: AsyncClient,
+    sample_events: list[Event],
+    sample_inferences: list[Inference],
+    sample_eventpushes: list[Eventpush],
+    auth_headers: dict,
+):
+    """Test status counts come back from the single aggregate query."""
+    response = await client.get("/api/v2/system/status", headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["appsCount"] == 0
+    assert data["camerasCount"] == 0
+    assert data["activeInferences"] == len(sample_inferences)
+    assert data["totalEvents"] == len(sample_events)
+    # Only enabled eventpushes are pending
+    assert data["pendingEventpushes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_get_system_status_cached(
+    client: AsyncClient, sample_eventpushes: list[Eventpush], auth_headers: dict
+):
+    """Test repeated status polls within the TTL are served from cache."""
+    first = await client.get("/api/v2/system/status", headers=auth_headers)
+    assert first.json()["pendingEventpushes"] == 1
+
+    await client.delete("/api/v2/eventpushes/ep-001")
+
+    cached = await client.get("/api/v2/system/status", headers=auth_headers)
+    assert cached.json()["pendingEventpushes"] == 1
+
+    system._status_cache = None
+    fresh = await client.get("/api/v2/system/status", headers=auth_headers)
+    assert fresh.json()["pendingEventpushes"] == 0
+
+
+@pytest.mark.asyncio
+async def test_get_system_status_etag_ignores_uptime(
+    client: AsyncClient, auth_headers: dict, monkeypatch
+):
+    """Test a revalidation after uptime has moved on still answers 304."""
+    first = await client.get("/api/v2/system/status", headers=auth_headers)
+    etag = first.headers["etag"]
+
+    monkeypatch.setattr(system, "_start_time", system._start_time - 60)
+    cached = await client.get(
+        "/api/v2/system/status", headers={**auth_headers, "If-None-Match": etag}
+    )
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+
+
+@pytest.mark.asyncio
+async def test_cleanup_old_data(
+    client: AsyncClient, db_session: AsyncSession, tmp_path: Path, auth_headers: dict
+):
+    """Test cleanup removes old image files and rows but keeps recent ones."""
+    now = int(time.time() * 1000)
+    old_ts = now - 40 * 86400 * 1000
+
+    old_file = tmp_path / "old.jpg"
+    old_file.write_bytes(b"x" * 1024)
+    new_file = tmp_path / "new.jpg"
+    new_file.write_bytes(b"y")
+
+    db_session.add_all(
+        [
+            Image(event_id=1, path=str(old_file), timestamp=old_ts),
+            # Row whose file is already gone still counts as deleted
+            Image(event_id=2, path=str(tmp_path / "missing.jpg"), timestamp=old_ts),
+            Image(event_id=3, path=str(new_file), timestamp=now),
+            Event(id=1, timestamp=old_ts),
+            Event(id=2, timestamp=now),
+        ]
+    )
+    await db_session.commit()
+
+    response = await client.post(
+        "/api/v2/system/cleanup", params={"days": 30}, headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["eventsDeleted"] == 1
+    assert data["imagesDeleted"] == 2
+    assert not old_file.exists()
+    assert new_file.exists()
+
+
+@pytest.mark.asyncio
+async def test_cleanup_old_data_in_batches(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    tmp_path: Path,
+    auth_headers: dict,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test cleanup deletes every old image when they span several batches."""
+    monkeypatch.setattr(system, "_CLEANUP_BATCH_SIZE", 2)
+    old_ts = int(time.time() * 1000) - 40 * 86400 * 1000
+
+    old_files = [tmp_path / f"old{i}.jpg" for i in range(5)]
+    for path in old_files:
+        path.write_bytes(b"x")
+    db_session.add_all(
+        [Image(event_id=i, path=str(path), timestamp=old_ts) for i, path in enumerate(old_files)]
+    )
+    await db_session.commit()
+
+    response = await client.post(
+        "/api/v2/system/cleanup", params={"days": 30}, headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    assert response.json()["imagesDeleted"] == 5
+    assert not any(path.exists() for path in old_files)
+
+
+@pytest.mark.asyncio
+async def test_system_liveness(client: AsyncClient):
+    """Test the liveness probe answers without auth or downstream checks."""
+    response = await client.get("/api/v2/system/health/live")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "ok"
+    assert data["uptimeSeconds"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_unknown_api_path_is_not_spa(client: AsyncClient):
+    """Test unmatched API paths get a JSON 404 instead of the SPA shell."""
+    response = await client.get("/api/v2/does-not-exist")
+
+    assert response.status_code == 404
+    assert response.json() == {"Code": 404, "Message": "Not found"}
+
+
+@pytest.mark.asyncio
+async def test_wrong_method_on_existing_route_is_405(client: AsyncClient):
+    """Test a wrong method on a real API route is not swallowed by the SPA mount."""
+    for response in (
+        await client.delete("/api/v2/system/info"),
+        await client.patch("/api/v2/sensors"),
+    ):
+        assert response.status_code == 405
+        # Same Allow header as before the mount (from the OPTIONS catch-all)
+        assert response.headers["allow"] == "OPTIONS"
+
+
+@pytest.mark.asyncio
+async def test_exception_handler_maps_core_rpc_errors():
+    """Test uncaught Core gRPC errors map to fixed bodies: 503 only when Core is down."""
+
+    def rpc_error(code: grpc.StatusCode) -> grpc.aio.AioRpcError:
+        return grpc.aio.AioRpcError(code, grpc.aio.Metadata(), grpc.aio.Metadata(), "details")
+
+    for code in (grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.DEADLINE_EXCEEDED):
+        response = await global_exception_handler(None, rpc_error(code))
+        assert response.status_code == 503
+        assert json.loads(response.body) == {"Code": 503, "Message": "Core unavailable"}
+
+    response = await global_exception_handler(None, rpc_error(grpc.StatusCode.INVALID_ARGUMENT))
+    assert response.status_code == 502
+    assert json.loads(response.body) == {"Code": 502, "Message": "Core request failed"}
+
+
+@pytest.mark.asyncio
+async def test_background_tasks_are_supervised():
+    """Test spawned worker tasks are tracked until done and cancelled on stop."""
+
+    async def worker():
+        await asyncio.sleep(3600)
+
+    task = spawn_background_task(worker(), "test_worker")
+    assert task in background_tasks
+
+    await stop_background_services()
+
+    assert task.cancelled()
+    assert task not in background_tasks
+
+
+@pytest.mark.asyncio
+async def test_warm_up_pool_tolerates_failed_connects(monkeypatch):
+    """Test a failed connect neither aborts warm-up nor leaks opened connections."""
+    closed = []
+
+    class FakeConnection:
+        async def close(self):
+            closed.append(self)
+
+    attempts = iter([FakeConnection(), OSError("disk busy"), FakeConnection()])
+
+    class FakeEngine:
+        async def connect(self):
+            result = next(attempts)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+    monkeypatch.setattr(session, "engine", FakeEngine())
+
+    await session.warm_up_pool(3)
+
+    assert len(closed) == 2